@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""Microbenchmark: per-record cost of scalar vs bulk VIN/UUID producers."""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+import numpy as np
+
+from enterprise_synthetic_data_hub.generation.bulk import bulk_uuid_strings, bulk_vins
+from enterprise_synthetic_data_hub.generation.generator import _generate_uuid, _generate_vehicle_vin
+
+
+def _per_record_us(label: str, count: int, run: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<36} {elapsed / count * 1e6:8.3f} us/record")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark bulk VIN/UUID producers")
+    parser.add_argument("--count", type=int, default=200_000, help="Values per measurement")
+    parser.add_argument("--seed", type=int, default=20251101, help="Deterministic seed")
+    args = parser.parse_args(argv)
+
+    count = args.count
+    scalar_rng = random.Random(args.seed)
+    _per_record_us(
+        "scalar _generate_uuid",
+        count,
+        lambda: [_generate_uuid(scalar_rng) for _ in range(count)],
+    )
+    _per_record_us(
+        "scalar _generate_vehicle_vin",
+        count,
+        lambda: [_generate_vehicle_vin(scalar_rng) for _ in range(count)],
+    )
+    byte_rng = random.Random(args.seed)
+    _per_record_us("bulk_uuid_strings (random.Random)", count, lambda: bulk_uuid_strings(byte_rng.randbytes, count))
+    _per_record_us("bulk_vins (random.Random)", count, lambda: bulk_vins(byte_rng.randbytes, count))
+    numpy_rng = np.random.default_rng(args.seed)
+    _per_record_us("bulk_uuid_strings (numpy)", count, lambda: bulk_uuid_strings(numpy_rng.bytes, count))
+    _per_record_us("bulk_vins (numpy)", count, lambda: bulk_vins(numpy_rng.bytes, count))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
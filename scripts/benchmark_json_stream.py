@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""Time the dataset JSON writers on a generated bundle.
+
+Compares ``json.dumps(payload, indent=2)`` (the original
+``write_snapshot_bundle``) with the streaming writer, both with the indented
+flat-record fast path and with every record routed through
+``json.JSONEncoder``, and with compact output. Every indented run must
+produce the same bytes as the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io import json_stream
+
+
+def _dumps(path: Path, sections: dict) -> None:
+    path.write_text(json.dumps(sections, indent=2), encoding="utf-8")
+
+
+def _stream(path: Path, sections: dict, compact: bool = False) -> None:
+    json_stream.write_json_file(path, sections, compact=compact)
+
+
+def _stream_generic(path: Path, sections: dict) -> None:
+    with mock.patch.object(json_stream, "_indented_flat_record", lambda record, indent: None):
+        _stream(path, sections)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark streaming dataset JSON output")
+    parser.add_argument("--records", type=int, default=100_000, help="Records in the bundle")
+    parser.add_argument("--seed", type=int, default=20251101, help="Deterministic seed")
+    args = parser.parse_args(argv)
+
+    bundle = generate_snapshot_bundle(num_records=args.records, seed=args.seed, engine="vectorized")
+    sections = {
+        "metadata": bundle.metadata.model_dump(mode="json"),
+        "persons": bundle.persons,
+        "vehicles": bundle.vehicles,
+        "profiles": bundle.profiles,
+    }
+    runs = [
+        ("json.dumps(indent=2)", _dumps, True),
+        ("stream, generic encoder", _stream_generic, True),
+        ("stream, flat-record path", _stream, True),
+        ("stream, compact", lambda path, data: _stream(path, data, compact=True), False),
+    ]
+    baseline: tuple[float, str] | None = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for position, (label, write, indented) in enumerate(runs):
+            path = Path(tmp) / f"run_{position}.json"
+            started = time.perf_counter()
+            write(path, sections)
+            elapsed = time.perf_counter() - started
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            baseline = baseline or (elapsed, digest)
+            if indented and digest != baseline[1]:
+                print(f"{label}: output differs from json.dumps(indent=2)")
+                return 1
+            print(f"{label:<25} {args.records:>10,} records  {elapsed:8.2f}s  x{baseline[0] / elapsed:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
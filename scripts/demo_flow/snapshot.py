@@ -11,10 +11,13 @@ from typing import Tuple
 
 from enterprise_synthetic_data_hub.config import demo_profiles
 from enterprise_synthetic_data_hub.config.settings import settings
+from enterprise_synthetic_data_hub.io.snapshot_cache import remove_tree
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT = Path(__file__).resolve().parents[2]
 SNAPSHOT_ROOT = REPO_ROOT / "data" / "demo_runs"
 LATEST_DEMO_LINK = SNAPSHOT_ROOT / "latest_demo"
+# Seeded demo runs are deterministic, so repeat runs link cached artifacts.
+SNAPSHOT_CACHE_DIR = REPO_ROOT / "data" / "cache" / "snapshots"
 MANIFEST_TEMPLATE = "snapshot_manifest_{slug}.json"
 MAX_SAVED_RUNS = 5
 
@@ -50,7 +53,9 @@ def _cleanup_old_runs(limit: int = MAX_SAVED_RUNS) -> None:
     ]
     runs.sort(reverse=True)
     for stale in runs[limit:]:
-        shutil.rmtree(stale, ignore_errors=True)
+        # Seeded runs hold read-only hard links into the snapshot cache.
+        if not remove_tree(stale):
+            print(f"Could not remove old demo run {stale}; delete it manually.", file=sys.stderr)
 
 
 def generate_snapshot(profile: demo_profiles.DemoProfile) -> Tuple[Path, dict]:
@@ -71,8 +76,10 @@ def generate_snapshot(profile: demo_profiles.DemoProfile) -> Tuple[Path, dict]:
     ]
     if profile.randomize:
         cmd.append("--randomize")
-    elif profile.seed is not None:
-        cmd.extend(["--seed", str(profile.seed)])
+    else:
+        if profile.seed is not None:
+            cmd.extend(["--seed", str(profile.seed)])
+        cmd.extend(["--cache-dir", str(SNAPSHOT_CACHE_DIR)])
     subprocess.run(cmd, check=True, cwd=REPO_ROOT)
     version_slug = settings.dataset_version.replace(".", "_")
     manifest_path = output_dir / MANIFEST_TEMPLATE.format(slug=version_slug)
@@ -85,5 +92,6 @@ def generate_snapshot(profile: demo_profiles.DemoProfile) -> Tuple[Path, dict]:
 __all__ = [
     "generate_snapshot",
     "LATEST_DEMO_LINK",
+    "SNAPSHOT_CACHE_DIR",
     "SNAPSHOT_ROOT",
 ]
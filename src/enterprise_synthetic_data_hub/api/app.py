@@ -1,23 +1,47 @@
 """Flask application that exposes the governed generator for demo use."""
 from __future__ import annotations
 
+import base64
+import binascii
 from http import HTTPStatus
+import json
 import secrets
-from typing import Any, Tuple
+from typing import Any, Iterator, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
+from enterprise_synthetic_data_hub.api.cache import CachedResponse, ResponseCache
 from enterprise_synthetic_data_hub.config.settings import settings
 from enterprise_synthetic_data_hub.generation.generator import (
     SnapshotBundle,
+    build_snapshot_metadata,
     describe_generation_plan,
+    generate_records,
     generate_snapshot_bundle,
+    iter_snapshot_records,
 )
+from enterprise_synthetic_data_hub.generation.prefix_cache import PrefixCache
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
 
 DEFAULT_RECORDS = 5
+NDJSON_MIMETYPE = "application/x-ndjson"
+# Small chunks keep time-to-first-record and per-request memory low.
+STREAM_CHUNK_SIZE = 1_000
+ENTITIES = ("persons", "vehicles", "profiles")
+DEFAULT_PAGE_LIMIT = 1_000
+MAX_PAGE_LIMIT = 10_000
+# (include_vehicles, include_profiles) each endpoint's entity actually needs.
+_ENTITY_SCOPES = {
+    "persons": (False, False),
+    "vehicles": (True, False),
+    "profiles": (True, True),
+    None: (True, True),
+}
 
 
-def _parse_request_payload() -> Tuple[int, int | None]:
+def _parse_request_payload() -> Tuple[int, int | None, bool]:
+    """Return ``(records, seed, randomized)`` from the JSON request body."""
+
     payload: dict[str, Any] = request.get_json(silent=True) or {}
     records = payload.get("records", DEFAULT_RECORDS)
     if not isinstance(records, int) or records <= 0:
@@ -29,13 +53,13 @@ def _parse_request_payload() -> Tuple[int, int | None]:
         randomize = True
         seed = None
     if randomize:
-        return records, secrets.randbelow(1_000_000_000)
+        return records, secrets.randbelow(1_000_000_000), True
     if seed is None:
-        return records, None
+        return records, None, False
     if isinstance(seed, int):
-        return records, seed
+        return records, seed, False
     if isinstance(seed, str) and seed.isdigit():
-        return records, int(seed)
+        return records, int(seed), False
     raise ValueError("'seed' must be an integer, 'random', or omitted")
 
 
@@ -48,15 +72,97 @@ def _bundle_to_response(bundle: SnapshotBundle) -> dict[str, Any]:
     }
 
 
-def _generate_subset(entity: str, bundle: SnapshotBundle) -> dict[str, Any]:
-    payload = {"metadata": bundle.metadata.model_dump(mode="json")}
+def _generate_subset(entity: str, bundle: SnapshotBundle, metadata: DatasetMetadata) -> dict[str, Any]:
+    # ``metadata`` describes the whole dataset, not just the scoped bundle.
+    payload = {"metadata": metadata.model_dump(mode="json")}
     payload[entity] = getattr(bundle, entity)
     payload["record_count"] = len(payload[entity])
     return payload
 
 
-def create_app() -> Flask:
+def _wants_stream() -> bool:
+    if request.args.get("stream", "").lower() in ("1", "true"):
+        return True
+    best = request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def _ndjson_lines(entity: str | None, records: int, seed: int | None, effective_seed: int) -> Iterator[str]:
+    """Yield a metadata line, then one ``{"entity", "record"}`` line per row as chunks are generated."""
+
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    entities = (entity,) if entity else ENTITIES
+    yield encode(
+        {
+            "metadata": build_snapshot_metadata(records, effective_seed).model_dump(mode="json"),
+            "seed": effective_seed,
+            "records_requested": records,
+            "entities": list(entities),
+        }
+    ) + "\n"
+    include_vehicles, include_profiles = _ENTITY_SCOPES[entity]
+    for chunk in iter_snapshot_records(
+        num_records=records,
+        seed=seed,
+        chunk_size=STREAM_CHUNK_SIZE,
+        include_profiles=include_profiles,
+        include_vehicles=include_vehicles,
+    ):
+        yield "".join(
+            encode({"entity": name, "record": row}) + "\n"
+            for name in entities
+            for row in getattr(chunk, name)
+        )
+
+
+def _encode_cursor(seed: int, entity: str, offset: int, records: int) -> str:
+    state = json.dumps([seed, entity, offset, records], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(state).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, str, int, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        seed, entity, offset, records = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("'cursor' is not a valid dataset cursor") from None
+    if not all(isinstance(value, int) for value in (seed, offset, records)) or not 0 <= offset <= records:
+        raise ValueError("'cursor' is not a valid dataset cursor")
+    return seed, entity, offset, records
+
+
+def _positive_int_arg(name: str, default: int) -> int:
+    value = request.args.get(name)
+    if value is None:
+        return default
+    if not value.isdigit() or int(value) <= 0:
+        raise ValueError(f"'{name}' must be a positive integer")
+    return int(value)
+
+
+def _parse_page_args(seed: int, entity: str) -> Tuple[int, int, int]:
+    """Return ``(offset, records, limit)`` for a dataset page request."""
+
+    limit = _positive_int_arg("limit", DEFAULT_PAGE_LIMIT)
+    if limit > MAX_PAGE_LIMIT:
+        raise ValueError(f"'limit' must not exceed {MAX_PAGE_LIMIT}")
+    cursor = request.args.get("cursor")
+    if not cursor:
+        return 0, _positive_int_arg("records", settings.target_person_records), limit
+    cursor_seed, cursor_entity, offset, records = _decode_cursor(cursor)
+    if (cursor_seed, cursor_entity) != (seed, entity):
+        raise ValueError(f"'cursor' belongs to /datasets/{cursor_seed}/{cursor_entity}")
+    return offset, records, limit
+
+
+def create_app(
+    response_cache: ResponseCache | None = None, prefix_cache: PrefixCache | None = None
+) -> Flask:
     app = Flask(__name__)
+    cache = response_cache if response_cache is not None else ResponseCache()
+    prefixes = prefix_cache if prefix_cache is not None else PrefixCache()
+    app.extensions["response_cache"] = cache
+    app.extensions["prefix_cache"] = prefixes
 
     def _error_response(message: str, *, status: HTTPStatus = HTTPStatus.BAD_REQUEST):
         return (
@@ -78,19 +184,89 @@ def create_app() -> Flask:
             }
         )
 
+    def _cached_response(cached: CachedResponse) -> Response:
+        if request.if_none_match.contains(cached.etag):
+            response = Response(status=HTTPStatus.NOT_MODIFIED)
+        else:
+            response = Response(cached.body, mimetype=app.json.mimetype)
+        response.set_etag(cached.etag)
+        return response
+
     def _handle_generation(entity: str | None = None):
         try:
-            records, seed = _parse_request_payload()
+            records, seed, randomized = _parse_request_payload()
         except ValueError as exc:
             return _error_response(str(exc))
-        bundle = generate_snapshot_bundle(num_records=records, seed=seed)
+        effective_seed = seed if seed is not None else settings.random_seed
+        if _wants_stream():
+            # Streams bypass both caches so memory stays flat whatever ``records`` is.
+            return Response(
+                _ndjson_lines(entity, records, seed, effective_seed), mimetype=NDJSON_MIMETYPE
+            )
+        cache_entity = entity or "bundle"
+        # Randomized responses never repeat, so they skip the cache entirely.
+        if not randomized:
+            cached = cache.get(cache_entity, (records, effective_seed))
+            if cached is not None:
+                return _cached_response(cached)
+
+        # Persons skip vehicle rows and every entity but bundles skip profiles;
+        # the RNG advances identically, so the rows match a full generation.
+        include_vehicles, include_profiles = _ENTITY_SCOPES[entity]
+        if randomized:
+            bundle = generate_snapshot_bundle(
+                num_records=records,
+                seed=seed,
+                include_profiles=include_profiles,
+                include_vehicles=include_vehicles,
+            )
+        else:
+            bundle = prefixes.bundle(
+                num_records=records,
+                seed=seed,
+                include_profiles=include_profiles,
+                include_vehicles=include_vehicles,
+            )
         if entity:
-            payload = _generate_subset(entity, bundle)
+            payload = _generate_subset(
+                entity, bundle, build_snapshot_metadata(records, effective_seed)
+            )
         else:
             payload = _bundle_to_response(bundle)
-        payload["seed"] = seed if seed is not None else settings.random_seed
+        payload["seed"] = effective_seed
         payload["records_requested"] = records
-        return jsonify(payload)
+        response = jsonify(payload)
+        if randomized:
+            return response
+        return _cached_response(cache.put(cache_entity, (records, effective_seed), response.get_data()))
+
+    @app.get("/datasets/<int:seed>/<entity>")
+    def dataset_page(seed: int, entity: str):
+        if entity not in ENTITIES:
+            return _error_response(
+                f"Unknown entity '{entity}'. Expected one of: {', '.join(ENTITIES)}",
+                status=HTTPStatus.NOT_FOUND,
+            )
+        try:
+            offset, records, limit = _parse_page_args(seed, entity)
+        except ValueError as exc:
+            return _error_response(str(exc))
+        # The counter engine derives record i from (seed, i) alone, so a page
+        # costs O(limit) wherever it starts.
+        stop = min(offset + limit, records)
+        chunk = generate_records(seed, offset, stop, include_profiles=entity == "profiles")
+        rows = getattr(chunk, entity)
+        return jsonify(
+            {
+                "metadata": build_snapshot_metadata(records, seed).model_dump(mode="json"),
+                "seed": seed,
+                "engine": "counter",
+                "offset": offset,
+                entity: rows,
+                "record_count": len(rows),
+                "next_cursor": _encode_cursor(seed, entity, stop, records) if stop < records else None,
+            }
+        )
 
     @app.post("/generate/person")
     def generate_person():
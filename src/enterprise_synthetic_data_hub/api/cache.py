@@ -0,0 +1,81 @@
+"""In-process cache of serialized ``/generate/*`` response bodies.
+
+Deterministic responses depend only on ``(entity, records, seed)``, so the
+finished JSON body is kept and replayed byte for byte together with a strong
+``ETag`` derived from it. Each entity has its own LRU bounded by the total
+size of its cached bodies, so a burst of large bundle requests cannot evict
+the small person/vehicle bodies QA clients poll most.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Tuple
+
+DEFAULT_RESPONSE_CACHE_BYTES = 64 * 1024**2
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body and its strong entity tag (unquoted)."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "CachedResponse":
+        return cls(body=body, etag=hashlib.sha256(body).hexdigest())
+
+
+class ResponseCache:
+    """Per-entity LRU of :class:`CachedResponse` objects bounded by body bytes."""
+
+    def __init__(self, max_bytes_per_entity: int = DEFAULT_RESPONSE_CACHE_BYTES):
+        if max_bytes_per_entity <= 0:
+            raise ValueError("max_bytes_per_entity must be positive")
+        self.max_bytes_per_entity = max_bytes_per_entity
+        self._entries: Dict[str, OrderedDict[Hashable, CachedResponse]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, entity: str, key: Hashable) -> CachedResponse | None:
+        with self._lock:
+            entries = self._entries.get(entity)
+            if not entries or key not in entries:
+                return None
+            entries.move_to_end(key)
+            return entries[key]
+
+    def put(self, entity: str, key: Hashable, body: bytes) -> CachedResponse:
+        """Cache ``body`` and return it with its ETag; oversized bodies are not kept."""
+
+        cached = CachedResponse.from_body(body)
+        if len(body) > self.max_bytes_per_entity:
+            return cached
+        with self._lock:
+            entries = self._entries.setdefault(entity, OrderedDict())
+            previous = entries.pop(key, None)
+            size = self._sizes.get(entity, 0) - (len(previous.body) if previous else 0)
+            entries[key] = cached
+            size += len(body)
+            while size > self.max_bytes_per_entity:
+                _, evicted = entries.popitem(last=False)
+                size -= len(evicted.body)
+            self._sizes[entity] = size
+        return cached
+
+    def stats(self) -> Dict[str, Tuple[int, int]]:
+        """Return ``{entity: (entries, bytes)}``."""
+
+        with self._lock:
+            return {entity: (len(entries), self._sizes[entity]) for entity, entries in self._entries.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+
+
+__all__ = ["CachedResponse", "DEFAULT_RESPONSE_CACHE_BYTES", "ResponseCache"]
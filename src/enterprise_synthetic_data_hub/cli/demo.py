@@ -20,7 +20,12 @@ from enterprise_synthetic_data_hub.config.demo_profiles import (
     get_demo_profile,
 )
 from enterprise_synthetic_data_hub.config.settings import settings
-from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.generation.generator import (
+    ENGINES,
+    build_snapshot_metadata,
+    generate_records,
+    generate_snapshot_bundle,
+)
 
 
 @dataclass(frozen=True)
@@ -36,6 +41,7 @@ class ResolvedDemoArgs:
     use_api: bool
     api_url: str
     endpoint: str
+    engine: str = "sequential"
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -85,6 +91,12 @@ def build_parser() -> argparse.ArgumentParser:
         default="bundle",
         help="API endpoint to hit when --use-api is set",
     )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="sequential",
+        help="Generator engine for in-process previews (counter only generates the previewed rows)",
+    )
     return parser
 
 
@@ -124,6 +136,7 @@ def _resolve_runtime_args(parser: argparse.ArgumentParser, args: argparse.Namesp
         use_api=bool(args.use_api),
         api_url=api_url,
         endpoint=args.endpoint,
+        engine=args.engine,
     )
 
 
@@ -135,14 +148,22 @@ def _render_json(console: Console, title: str, payload: Any) -> None:
 
 def _preview_bundle(console: Console, resolved: ResolvedDemoArgs) -> None:
     seed = _resolve_seed(resolved.seed, resolved.randomize, resolved.profile.seed)
-    bundle = generate_snapshot_bundle(num_records=resolved.records, seed=seed)
+    if resolved.engine == "counter":
+        # Random-access engine: only the previewed window is generated.
+        bundle = generate_records(seed, 0, min(resolved.preview, resolved.records))
+        metadata_model = build_snapshot_metadata(resolved.records, seed)
+    else:
+        bundle = generate_snapshot_bundle(
+            num_records=resolved.records, seed=seed, engine=resolved.engine
+        )
+        metadata_model = bundle.metadata
     console.print(
         Panel.fit(
             f"Generator preview — profile={resolved.profile.name} records={resolved.records} seed={seed}",
             title="Generator",
         )
     )
-    metadata = bundle.metadata.model_dump(mode="json")
+    metadata = metadata_model.model_dump(mode="json")
     _render_json(console, "Metadata", metadata)
     _render_json(console, "Persons", bundle.persons[: resolved.preview])
     _render_json(console, "Vehicles", bundle.vehicles[: resolved.preview])
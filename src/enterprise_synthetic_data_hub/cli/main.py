@@ -2,11 +2,36 @@
 from __future__ import annotations
 
 import argparse
+import json
 import secrets
 from pathlib import Path
 
-from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
-from enterprise_synthetic_data_hub.io.exporters import export_snapshot_bundle
+from enterprise_synthetic_data_hub.config.settings import settings
+from enterprise_synthetic_data_hub.generation.columnar import generate_columnar_bundle
+from enterprise_synthetic_data_hub.generation.generator import (
+    DEFAULT_CHUNK_SIZE,
+    ENGINES,
+    build_snapshot_metadata,
+    generate_snapshot_bundle,
+    iter_snapshot_records,
+)
+from enterprise_synthetic_data_hub.io.checksums import verify_snapshot
+from enterprise_synthetic_data_hub.io.exporters import (
+    JSONL_SHARD_SIZE,
+    export_snapshot_binary,
+    export_snapshot_bundle,
+    export_snapshot_columnar,
+    export_snapshot_jsonl,
+    export_snapshot_sqlite,
+)
+from enterprise_synthetic_data_hub.io.sinks import SINK_TYPES, build_sink, export_snapshot_sinks
+from enterprise_synthetic_data_hub.io.snapshot_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    SnapshotCache,
+    snapshot_cache_key,
+)
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet", "arrow", "sqlite", "binary")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,9 +64,166 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Use a random seed for exploratory sample generation.",
     )
+    snapshot_parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default=None,
+        help=(
+            "Generation engine (default: sequential, or sharded when --workers is set; "
+            "vectorized draws columns with NumPy for large runs)."
+        ),
+    )
+    snapshot_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for sharded generation (output is identical for any count).",
+    )
+    snapshot_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write CSVs chunk by chunk while generating (memory scales with --chunk-size).",
+    )
+    snapshot_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Records per chunk when --stream is set.",
+    )
+    snapshot_parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="csv",
+        help=(
+            "Artifact format: governed CSV + JSON bundle, sharded JSON Lines, typed "
+            "Parquet / Arrow IPC (requires pyarrow), an indexed SQLite database, or the "
+            "fixed-width binary format with random access by row."
+        ),
+    )
+    snapshot_parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=JSONL_SHARD_SIZE,
+        help="Maximum rows per JSON Lines shard (jsonl format only).",
+    )
+    snapshot_parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Gzip JSON Lines shards (jsonl format only).",
+    )
+    snapshot_parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Rows per Parquet row group / Arrow record batch (parquet and arrow formats).",
+    )
+    snapshot_parser.add_argument(
+        "--sinks",
+        nargs="+",
+        choices=tuple(SINK_TYPES),
+        default=None,
+        help=(
+            "Generate once and write every listed format in the same pass "
+            "(streams chunks; overrides --format)."
+        ),
+    )
+    snapshot_parser.add_argument(
+        "--export-workers",
+        type=int,
+        default=None,
+        help="Threads used to write CSV/JSON artifacts concurrently (csv format without --stream).",
+    )
+    snapshot_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Reuse identical earlier snapshots from this content-addressed cache "
+            "(e.g. data/cache/snapshots); ignored with --randomize."
+        ),
+    )
+    snapshot_parser.add_argument(
+        "--cache-max-bytes",
+        type=int,
+        default=DEFAULT_CACHE_MAX_BYTES,
+        help="Evict least recently used cache entries beyond this total size.",
+    )
+
+    verify_parser = subparsers.add_parser(
+        "verify-snapshot", help="Check snapshot files against the manifest's SHA-256 digests."
+    )
+    verify_parser.add_argument(
+        "path",
+        type=Path,
+        help="Snapshot manifest JSON, or the directory that contains it.",
+    )
+    verify_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Files hashed in parallel (default: one per file, bounded by CPU count).",
+    )
     return parser
 
 
+def _build_cli_sink(name: str, args: argparse.Namespace):
+    if name == "jsonl":
+        return build_sink(name, shard_size=args.shard_size, compress=args.compress)
+    if name in ("parquet", "arrow"):
+        return build_sink(name, row_group_size=args.row_group_size)
+    return build_sink(name)
+
+
+def _export_options(args: argparse.Namespace) -> dict:
+    return {
+        "format": args.format,
+        "sinks": args.sinks,
+        "stream": bool(args.stream or args.sinks),
+        "shard_size": args.shard_size,
+        "compress": args.compress,
+        "row_group_size": args.row_group_size,
+    }
+
+
+def _export_snapshot(args: argparse.Namespace, seed: int | None, engine: str) -> dict:
+    if args.stream or args.sinks:
+        sinks = [_build_cli_sink(name, args) for name in args.sinks or [args.format]]
+        # Profiles cost a third of generation; skip them when no sink writes them.
+        include_profiles = any("profiles" in sink.entities for sink in sinks)
+        chunks = iter_snapshot_records(
+            num_records=args.records,
+            seed=seed,
+            chunk_size=args.chunk_size,
+            include_profiles=include_profiles,
+            engine=engine,
+            workers=args.workers,
+        )
+        effective_seed = settings.random_seed if seed is None else seed
+        metadata = build_snapshot_metadata(0, effective_seed, include_profiles)
+        return export_snapshot_sinks(chunks, metadata, sinks, args.output_dir)
+
+    if engine == "vectorized":
+        # Columnar generation skips row dicts entirely; every exporter accepts it.
+        bundle = generate_columnar_bundle(num_records=args.records, seed=seed, engine=engine)
+    else:
+        bundle = generate_snapshot_bundle(
+            num_records=args.records, seed=seed, engine=engine, workers=args.workers
+        )
+    if args.format == "jsonl":
+        return export_snapshot_jsonl(
+            bundle, args.output_dir, shard_size=args.shard_size, compress=args.compress
+        )
+    if args.format in ("parquet", "arrow"):
+        return export_snapshot_columnar(
+            bundle, args.output_dir, fmt=args.format, row_group_size=args.row_group_size
+        )
+    if args.format == "sqlite":
+        return export_snapshot_sqlite(bundle, args.output_dir)
+    if args.format == "binary":
+        return export_snapshot_binary(bundle, args.output_dir)
+    return export_snapshot_bundle(bundle, args.output_dir, max_workers=args.export_workers)
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -50,20 +232,81 @@ def main(argv: list[str] | None = None) -> int:
         seed = args.seed
         if args.randomize:
             seed = secrets.randbelow(1_000_000_000)
-        bundle = generate_snapshot_bundle(num_records=args.records, seed=seed)
-        artifacts = export_snapshot_bundle(bundle, args.output_dir)
+        engine = args.engine or ("sharded" if args.workers is not None else "sequential")
+        if args.workers is not None and (engine != "sharded" or args.workers <= 0):
+            parser.error("--workers must be a positive integer and requires the sharded engine")
+        formats = args.sinks or [args.format]
+        if args.sinks and len(set(args.sinks)) != len(args.sinks):
+            parser.error("--sinks must not repeat a sink")
+        if "jsonl" not in formats and args.compress:
+            parser.error("--compress requires --format jsonl")
+        if args.shard_size <= 0:
+            parser.error("--shard-size must be positive")
+        if args.row_group_size is not None and args.row_group_size <= 0:
+            parser.error("--row-group-size must be positive")
+        if args.export_workers is not None and args.export_workers <= 0:
+            parser.error("--export-workers must be positive")
+        if (args.stream or args.sinks) and args.chunk_size <= 0:
+            parser.error("--chunk-size must be positive")
+        if args.cache_max_bytes <= 0:
+            parser.error("--cache-max-bytes must be positive")
+        if args.records is not None and args.records <= 0:
+            parser.error("--records must be positive")
+
+        artifacts = None
+        cache = None
+        # Randomized seeds never repeat, so caching them would only fill the cache.
+        if args.cache_dir is not None and not args.randomize:
+            cache = SnapshotCache(args.cache_dir, args.cache_max_bytes)
+            cache_key = snapshot_cache_key(
+                dataset_version=settings.dataset_version,
+                seed=settings.random_seed if seed is None else seed,
+                records=args.records or settings.target_person_records,
+                engine=engine,
+                export_options=_export_options(args),
+            )
+            artifacts = cache.materialize(cache_key, args.output_dir)
+            if artifacts is not None:
+                print(f"Reused cached snapshot {cache_key[:12]} from {args.cache_dir}.")
+        if artifacts is None:
+            SnapshotCache.detach(args.output_dir)
+            artifacts = _export_snapshot(args, seed, engine)
+            if cache is not None:
+                cache.store(cache_key, artifacts)
+
+        manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+        counts = manifest["record_counts"]
         print("Snapshot generation completed. Files written:")
         for label, path in artifacts.items():
             print(f"- {label}: {path}")
         print(
             "Record counts — persons: {persons} vehicles: {vehicles} profiles: {profiles}".format(
-                persons=bundle.metadata.record_count_persons,
-                vehicles=bundle.metadata.record_count_vehicles,
-                profiles=bundle.metadata.record_count_profiles,
+                **counts
             )
         )
         return 0
 
+    if args.command == "verify-snapshot":
+        if args.workers is not None and args.workers <= 0:
+            parser.error("--workers must be positive")
+        manifest_path = args.path
+        if manifest_path.is_dir():
+            candidates = sorted(manifest_path.glob("snapshot_manifest_*.json"))
+            if len(candidates) != 1:
+                parser.error(f"expected exactly one snapshot_manifest_*.json in {manifest_path}")
+            manifest_path = candidates[0]
+        if not manifest_path.is_file():
+            parser.error(f"manifest not found: {manifest_path}")
+        problems = verify_snapshot(manifest_path, max_workers=args.workers)
+        if problems:
+            print(f"Snapshot verification failed for {manifest_path}:")
+            for label, problem in problems.items():
+                print(f"- {label}: {problem}")
+            return 1
+        checked = len(json.loads(manifest_path.read_text(encoding="utf-8"))["checksums"])
+        print(f"Snapshot verified: {checked} files match {manifest_path.name}.")
+        return 0
+
     parser.print_help()
     return 1
 
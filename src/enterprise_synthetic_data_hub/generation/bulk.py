@@ -0,0 +1,108 @@
+"""Bulk identifier producers that turn one block of random bytes into N values.
+
+The scalar helpers in :mod:`generator` spend most of their time in per-record
+Python calls (17 ``rng.choice`` draws per VIN, ``uuid.UUID`` + ``str`` per id).
+These producers draw a single byte block from any ``randbytes``-style source
+(``random.Random.randbytes`` or ``numpy.random.Generator.bytes``) and build
+every value with translation tables and array operations.
+"""
+from __future__ import annotations
+
+from typing import Callable, List
+
+import numpy as np
+
+from enterprise_synthetic_data_hub.generation.generator import VIN_CHARACTERS
+
+ByteSource = Callable[[int], bytes]
+
+VIN_LENGTH = 17
+_UUID_HEX_POSITIONS = np.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+# Map byte values onto the VIN alphabet; bytes past the last whole multiple of
+# the alphabet size are deleted (rejection sampling) so every character stays
+# equally likely.
+_VIN_ACCEPT_LIMIT = 256 - 256 % len(VIN_CHARACTERS)
+_VIN_TRANSLATION = bytes(
+    VIN_CHARACTERS.encode("ascii")[value % len(VIN_CHARACTERS)] for value in range(256)
+)
+_VIN_REJECTED = bytes(range(_VIN_ACCEPT_LIMIT, 256))
+
+
+def render_uuid_grid(raw: bytes) -> np.ndarray:
+    """Render packed 16-byte values as an ``(N, 36)`` grid of ASCII characters."""
+
+    count = len(raw) // 16
+    hexed = np.frombuffer(raw.hex().encode("ascii"), dtype="S1").reshape(count, 32)
+    grid = np.full((count, 36), b"-", dtype="S1")
+    grid[:, _UUID_HEX_POSITIONS] = hexed
+    return grid
+
+
+def grid_to_strings(grid: np.ndarray) -> List[str]:
+    """Convert an ``(N, width)`` ASCII grid into N Python strings."""
+
+    width = grid.shape[1]
+    return grid.view(f"S{width}").ravel().astype(f"U{width}").tolist()
+
+
+def uuid_strings_from_bytes(raw: bytes) -> List[str]:
+    """Format every 16-byte slice of ``raw`` like ``str(uuid.UUID(bytes=...))``."""
+
+    if len(raw) % 16:
+        raise ValueError("raw must contain a whole number of 16-byte values")
+    if not raw:
+        return []
+    return grid_to_strings(render_uuid_grid(raw))
+
+
+def bulk_uuid_strings(randbytes: ByteSource, count: int) -> List[str]:
+    """Return ``count`` UUID strings built from one ``16 * count`` byte block.
+
+    Like ``generator._generate_uuid`` the values are 128 raw random bits; no
+    version or variant bits are forced.
+    """
+
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    return uuid_strings_from_bytes(randbytes(16 * count))
+
+
+def bulk_vin_bytes(randbytes: ByteSource, count: int) -> bytes:
+    """Return ``count`` VINs as one block of ``17 * count`` ASCII bytes."""
+
+    if count < 0:
+        raise ValueError("count must be non-negative")
+    needed = VIN_LENGTH * count
+    characters = b""
+    while len(characters) < needed:
+        shortfall = needed - len(characters)
+        # Over-draw by the expected rejection rate plus slack to avoid a second pass.
+        block = randbytes(shortfall * 256 // _VIN_ACCEPT_LIMIT + 64)
+        characters += block.translate(_VIN_TRANSLATION, _VIN_REJECTED)
+    return characters[:needed]
+
+
+def vin_strings_from_bytes(raw: bytes) -> List[str]:
+    """Split a block produced by :func:`bulk_vin_bytes` into VIN strings."""
+
+    if not raw:
+        return []
+    return np.frombuffer(raw, dtype=f"S{VIN_LENGTH}").astype(f"U{VIN_LENGTH}").tolist()
+
+
+def bulk_vins(randbytes: ByteSource, count: int) -> List[str]:
+    """Return ``count`` 17-character VINs drawn uniformly from ``VIN_CHARACTERS``."""
+
+    return vin_strings_from_bytes(bulk_vin_bytes(randbytes, count))
+
+
+__all__ = [
+    "ByteSource",
+    "bulk_uuid_strings",
+    "bulk_vin_bytes",
+    "bulk_vins",
+    "grid_to_strings",
+    "render_uuid_grid",
+    "uuid_strings_from_bytes",
+    "vin_strings_from_bytes",
+]
@@ -0,0 +1,433 @@
+"""Columnar (struct-of-arrays) representation of a snapshot bundle.
+
+``SnapshotBundle`` keeps every record as a dict with 12-14 keys, so a 5M-row
+bundle spends most of its memory on dict and string object overhead. The
+columnar bundle stores each field once per entity in a compact buffer:
+
+* ``category`` fields (state, city, lob_type, make, ...) are dictionary
+  encoded as integer codes into a per-column category list;
+* ``uuid`` fields keep 16 raw bytes per row;
+* ``date`` fields keep a 4-byte ordinal; ``int`` fields an 8-byte integer;
+* ``string`` fields use one UTF-8 buffer plus offsets (Arrow style).
+
+Tables are read-only sequences whose rows are materialized as plain dicts on
+access, so existing callers that index, slice, iterate, or ``len()`` the
+entity lists keep working unchanged. Batch engines can also append whole
+NumPy columns through the ``extend_*`` methods and :meth:`ColumnarTable.commit_rows`
+without building any row dicts.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, overload
+
+import numpy as np
+
+from enterprise_synthetic_data_hub.config.settings import settings
+from enterprise_synthetic_data_hub.generation.generator import (
+    DEFAULT_CHUNK_SIZE,
+    SnapshotBundle,
+    SnapshotChunk,
+    _resolve_target,
+    build_snapshot_metadata,
+    iter_snapshot_records,
+)
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
+
+PERSON_LAYOUT: Mapping[str, str] = {
+    "person_id": "uuid",
+    "first_name": "category",
+    "last_name": "category",
+    "date_of_birth": "date",
+    "driver_license_number": "string",
+    "driver_license_state": "category",
+    "address_line_1": "string",
+    "address_line_2": "string",
+    "city": "category",
+    "state": "category",
+    "postal_code": "category",
+    "country": "category",
+    "lob_type": "category",
+    "synthetic_source": "category",
+}
+VEHICLE_LAYOUT: Mapping[str, str] = {
+    "vehicle_id": "uuid",
+    "person_id": "uuid",
+    "vin": "string",
+    "make": "category",
+    "model": "category",
+    "model_year": "int",
+    "body_style": "category",
+    "risk_rating": "category",
+    "lob_type": "category",
+    "garaging_state": "category",
+    "garaging_postal_code": "category",
+    "synthetic_source": "category",
+}
+PROFILE_LAYOUT: Mapping[str, str] = {
+    "profile_id": "uuid",
+    "person_id": "uuid",
+    "vehicle_id": "uuid",
+    "full_name": "category",
+    "lob_type": "category",
+    "residence_state": "category",
+    "city": "category",
+    "postal_code": "category",
+    "garaging_state": "category",
+    "primary_vehicle_vin": "string",
+    "vehicle_summary": "category",
+    "risk_rating": "category",
+    "synthetic_source": "category",
+}
+ENTITY_LAYOUTS: Mapping[str, Mapping[str, str]] = {
+    "persons": PERSON_LAYOUT,
+    "vehicles": VEHICLE_LAYOUT,
+    "profiles": PROFILE_LAYOUT,
+}
+
+
+class CategoricalColumn:
+    """Dictionary-encoded column: integer codes into a list of distinct values."""
+
+    kind = "category"
+
+    def __init__(self) -> None:
+        self.categories: List[Any] = []
+        self._lookup: Dict[Any, int] = {}
+        self.codes = array("H")
+
+    def _code_for(self, value: Any) -> int:
+        code = self._lookup.get(value)
+        if code is None:
+            code = len(self.categories)
+            if code == 0xFFFF + 1 and self.codes.typecode == "H":
+                self.codes = array("L", self.codes)
+            self.categories.append(value)
+            self._lookup[value] = code
+        return code
+
+    def extend(self, values: Iterable[Any]) -> None:
+        lookup = self._lookup
+        codes = []
+        for value in values:
+            code = lookup.get(value)
+            codes.append(self._code_for(value) if code is None else code)
+        self.codes.extend(codes)
+
+    def extend_codes(self, codes: np.ndarray, categories: Sequence[Any]) -> None:
+        """Append rows given as indices into ``categories`` (which may repeat values)."""
+
+        codes = np.asarray(codes)
+        if not len(codes):
+            return
+        remap = np.zeros(len(categories), dtype=np.int64)
+        used = np.flatnonzero(np.bincount(codes, minlength=len(categories)))
+        for local in used.tolist():
+            remap[local] = self._code_for(categories[local])
+        self.codes.frombytes(remap[codes].astype(self.codes.typecode).tobytes())
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.categories[self.codes[index]]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class UUIDColumn:
+    """Canonical lowercase UUID strings stored as 16 raw bytes per row."""
+
+    kind = "uuid"
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def extend(self, values: Iterable[str]) -> None:
+        self.data += b"".join(bytes.fromhex(value.replace("-", "")) for value in values)
+
+    def extend_raw(self, raw: bytes) -> None:
+        """Append packed 16-byte UUID values."""
+
+        if len(raw) % 16:
+            raise ValueError("raw must contain a whole number of 16-byte values")
+        self.data += raw
+
+    def __len__(self) -> int:
+        return len(self.data) // 16
+
+    def __getitem__(self, index: int) -> str:
+        hexed = self.data[16 * index : 16 * index + 16].hex()
+        return f"{hexed[:8]}-{hexed[8:12]}-{hexed[12:16]}-{hexed[16:20]}-{hexed[20:]}"
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+
+class DateColumn:
+    """ISO ``YYYY-MM-DD`` strings stored as proleptic Gregorian ordinals."""
+
+    kind = "date"
+
+    def __init__(self) -> None:
+        self.ordinals = array("i")
+
+    def extend(self, values: Iterable[str]) -> None:
+        self.ordinals.extend(date.fromisoformat(value).toordinal() for value in values)
+
+    def extend_ordinals(self, ordinals: np.ndarray) -> None:
+        self.ordinals.frombytes(np.asarray(ordinals, dtype=np.int32).tobytes())
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, index: int) -> str:
+        return date.fromordinal(self.ordinals[index]).isoformat()
+
+    @property
+    def nbytes(self) -> int:
+        return self.ordinals.itemsize * len(self.ordinals)
+
+
+class IntColumn:
+    """Integer column backed by a signed 64-bit array."""
+
+    kind = "int"
+
+    def __init__(self) -> None:
+        self.values = array("q")
+
+    def extend(self, values: Iterable[int]) -> None:
+        self.values.extend(values)
+
+    def extend_array(self, values: np.ndarray) -> None:
+        self.values.frombytes(np.asarray(values, dtype=np.int64).tobytes())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> int:
+        return self.values[index]
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.itemsize * len(self.values)
+
+
+class StringColumn:
+    """Nullable UTF-8 strings in one buffer with end offsets and a validity mask."""
+
+    kind = "string"
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.valid = bytearray()
+
+    def extend(self, values: Iterable[str | None]) -> None:
+        end = self.offsets[-1]
+        offsets = []
+        valid = bytearray()
+        encoded = []
+        for value in values:
+            if value is None:
+                valid.append(0)
+            else:
+                raw = value.encode("utf-8")
+                encoded.append(raw)
+                end += len(raw)
+                valid.append(1)
+            offsets.append(end)
+        self.data += b"".join(encoded)
+        self.offsets.extend(offsets)
+        self.valid += valid
+
+    def extend_encoded(self, data: bytes, lengths: np.ndarray, valid: np.ndarray | None = None) -> None:
+        """Append values already encoded back to back in ``data``.
+
+        ``lengths`` holds each value's byte length (0 for nulls); ``valid``
+        flags the non-null rows and defaults to all of them.
+        """
+
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if int(lengths.sum()) != len(data):
+            raise ValueError("lengths must add up to the size of data")
+        self.data += data
+        self.offsets.frombytes((self.offsets[-1] + np.cumsum(lengths)).tobytes())
+        self.valid += b"\x01" * len(lengths) if valid is None else np.asarray(valid, dtype=np.uint8).tobytes()
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __getitem__(self, index: int) -> str | None:
+        if not self.valid[index]:
+            return None
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets) + len(self.valid)
+
+
+_COLUMN_TYPES = {
+    column_type.kind: column_type
+    for column_type in (CategoricalColumn, UUIDColumn, DateColumn, IntColumn, StringColumn)
+}
+
+
+class ColumnarTable(Sequence[dict]):
+    """Read-only struct-of-arrays table whose rows materialize as dicts on access."""
+
+    def __init__(self, layout: Mapping[str, str]):
+        self.layout = dict(layout)
+        self.columns = {name: _COLUMN_TYPES[kind]() for name, kind in layout.items()}
+        self._length = 0
+
+    def extend(self, rows: Sequence[dict]) -> None:
+        for name, column in self.columns.items():
+            column.extend([row[name] for row in rows])
+        self._length += len(rows)
+
+    def commit_rows(self, count: int) -> None:
+        """Account for ``count`` rows appended straight to every column's buffers."""
+
+        expected = self._length + count
+        uneven = [name for name, column in self.columns.items() if len(column) != expected]
+        if uneven:
+            raise ValueError(f"columns out of step after a bulk append: {', '.join(uneven)}")
+        self._length = expected
+
+    def __len__(self) -> int:
+        return self._length
+
+    def row(self, index: int) -> dict:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return {name: column[index] for name, column in self.columns.items()}
+
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[dict]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(position) for position in range(*index.indices(self._length))]
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        columns = list(self.columns.items())
+        for index in range(self._length):
+            yield {name: column[index] for name, column in columns}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ColumnarTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_list(self) -> List[dict]:
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (categories excluded)."""
+
+        return sum(column.nbytes for column in self.columns.values())
+
+
+@dataclass
+class ColumnarSnapshotBundle:
+    """Columnar counterpart of :class:`SnapshotBundle` with the same attributes."""
+
+    metadata: DatasetMetadata
+    persons: ColumnarTable
+    vehicles: ColumnarTable
+    profiles: ColumnarTable
+
+    @classmethod
+    def empty(cls, metadata: DatasetMetadata) -> "ColumnarSnapshotBundle":
+        return cls(
+            metadata=metadata,
+            persons=ColumnarTable(PERSON_LAYOUT),
+            vehicles=ColumnarTable(VEHICLE_LAYOUT),
+            profiles=ColumnarTable(PROFILE_LAYOUT),
+        )
+
+    def append_chunk(self, chunk: SnapshotChunk | SnapshotBundle) -> None:
+        self.persons.extend(chunk.persons)
+        self.vehicles.extend(chunk.vehicles)
+        self.profiles.extend(chunk.profiles)
+
+    @classmethod
+    def from_bundle(cls, bundle: SnapshotBundle) -> "ColumnarSnapshotBundle":
+        columnar = cls.empty(bundle.metadata)
+        columnar.append_chunk(bundle)
+        return columnar
+
+    def to_snapshot_bundle(self) -> SnapshotBundle:
+        return SnapshotBundle(
+            metadata=self.metadata,
+            persons=self.persons.to_list(),
+            vehicles=self.vehicles.to_list(),
+            profiles=self.profiles.to_list(),
+        )
+
+
+def generate_columnar_bundle(
+    num_records: int | None = None,
+    seed: int | None = None,
+    include_profiles: bool = True,
+    engine: str = "sequential",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> ColumnarSnapshotBundle:
+    """Generate a snapshot straight into columnar storage, one chunk at a time.
+
+    Rows match :func:`generate_snapshot_bundle` for the same arguments; only a
+    single chunk of row dicts is alive at any point during the build. The
+    vectorized engine skips row dicts entirely and appends its NumPy columns
+    to the tables directly (``chunk_size`` does not apply to it).
+    """
+
+    effective_seed = settings.random_seed if seed is None else seed
+    if engine == "vectorized":
+        from enterprise_synthetic_data_hub.generation.vectorized import build_vectorized_columnar
+
+        record_target, _ = _resolve_target(num_records, effective_seed, engine, workers)
+        return build_vectorized_columnar(record_target, effective_seed, include_profiles)
+    chunks = iter_snapshot_records(
+        num_records=num_records,
+        seed=effective_seed,
+        chunk_size=chunk_size,
+        include_profiles=include_profiles,
+        engine=engine,
+        workers=workers,
+    )
+    bundle = ColumnarSnapshotBundle.empty(
+        build_snapshot_metadata(0, effective_seed, include_profiles)
+    )
+    for chunk in chunks:
+        bundle.append_chunk(chunk)
+    bundle.metadata = build_snapshot_metadata(len(bundle.persons), effective_seed, include_profiles)
+    return bundle
+
+
+__all__ = [
+    "ColumnarSnapshotBundle",
+    "ColumnarTable",
+    "ENTITY_LAYOUTS",
+    "PERSON_LAYOUT",
+    "PROFILE_LAYOUT",
+    "VEHICLE_LAYOUT",
+    "generate_columnar_bundle",
+]
@@ -1,17 +1,24 @@
 """Snapshot generation orchestrator for the synthetic data hub."""
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 import random
 import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import chain
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 from enterprise_synthetic_data_hub.config.settings import settings
 from enterprise_synthetic_data_hub.generation import rules_person, rules_vehicle
-from enterprise_synthetic_data_hub.generation.profiles import build_profiles
+from enterprise_synthetic_data_hub.generation.profiles import build_profile_row, validate_profiles
+from enterprise_synthetic_data_hub.generation.sampling import WeightedSampler
+from enterprise_synthetic_data_hub.io.checksums import DigestLog
+from enterprise_synthetic_data_hub.io.json_stream import write_json_file
 from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
@@ -28,6 +35,8 @@ STATE_CITY_POSTAL = {
 }
 STATES = list(STATE_CITY_POSTAL.keys())
 LOB_DISTRIBUTION = {"Personal": 0.7, "Commercial": 0.3}
+# Samplers are compiled once per distribution, never per draw.
+LOB_SAMPLER: WeightedSampler[str] = WeightedSampler(LOB_DISTRIBUTION)
 MAKES = ["Toyota", "Ford", "Honda", "Subaru", "Chevrolet"]
 MODELS = {
     "Toyota": ["Camry", "Prius", "RAV4"],
@@ -45,7 +54,17 @@ RISK_RATINGS_BY_LOB: Dict[str, List[str]] = {
     "Commercial": ["Medium", "High"],
 }
 VIN_CHARACTERS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+_VIN_CHARACTER_COUNT = len(VIN_CHARACTERS)
+_VIN_CHARACTER_BITS = _VIN_CHARACTER_COUNT.bit_length()
 APARTMENT_SUFFIXES = ["Apt", "Suite", "Unit"]
+# "sequential" is the reference engine backing the golden snapshots.
+ENGINES = ("sequential", "vectorized", "sharded", "counter")
+DEFAULT_CHUNK_SIZE = 10_000
+# Shard boundaries are part of the sharded engine's determinism contract.
+SHARD_SIZE = 50_000
+
+# (persons, vehicles, profiles) rows produced by one engine step.
+RowBlock = Tuple[List[dict], List[dict], List[dict]]
 
 
 @dataclass
@@ -58,6 +77,16 @@ class SnapshotBundle:
     profiles: List[dict]
 
 
+@dataclass
+class SnapshotChunk:
+    """Contiguous slice of snapshot rows yielded by :func:`iter_snapshot_records`."""
+
+    start: int
+    persons: List[dict]
+    vehicles: List[dict]
+    profiles: List[dict]
+
+
 def describe_generation_plan() -> List[str]:
     """Summarize the high-level generation plan for documentation/testing."""
 
@@ -79,18 +108,8 @@ def _generate_uuid(rng: random.Random) -> str:
 
 
 def _random_choice(rng: random.Random, values: List[str]) -> str:
-    return values[rng.randrange(len(values))]
-
-
-def _select_weighted_choice(rng: random.Random, distribution: Dict[str, float]) -> str:
-    roll = rng.random()
-    cumulative = 0.0
-    for key, weight in distribution.items():
-        cumulative += weight
-        if roll <= cumulative:
-            return key
-    # Fallback in case of floating point rounding errors
-    return next(iter(distribution.keys()))
+    # Same single ``_randbelow(len(values))`` draw as ``values[rng.randrange(len(values))]``.
+    return rng.choice(values)
 
 
 def _generate_postal_code(rng: random.Random, state: str) -> str:
@@ -115,7 +134,7 @@ def _generate_person(rng: random.Random, index: int) -> dict:
     dob = date(1970, 1, 1) + timedelta(days=rng.randint(0, 20000))
     city = _random_choice(rng, STATE_CITY_POSTAL[state]["cities"])
     postal_code = _generate_postal_code(rng, state)
-    lob_type = _select_weighted_choice(rng, LOB_DISTRIBUTION)
+    lob_type = LOB_SAMPLER.draw(rng)
     return {
         "person_id": _generate_uuid(rng),
         "first_name": _random_choice(rng, FIRST_NAMES),
@@ -161,54 +180,379 @@ def _generate_vehicle(rng: random.Random, person: dict) -> dict:
     }
 
 
-def generate_snapshot_bundle(
-    num_records: int | None = None,
-    seed: int | None = None,
-    include_profiles: bool = True,
-) -> SnapshotBundle:
-    """Generate deterministic snapshot bundle used across the pipeline."""
+def _skip_vehicle(rng: random.Random, person: dict) -> None:
+    """Advance ``rng`` exactly as :func:`_generate_vehicle` would, without building the row."""
 
-    record_target = settings.target_person_records if num_records is None else num_records
-    if record_target <= 0:
-        raise ValueError("num_records must be positive")
+    choice = rng.choice
+    getrandbits = rng.getrandbits
+    make = choice(MAKES)
+    choice(MODELS[make])
+    rng.randint(2008, 2024)
+    getrandbits(128)
+    # The rejection sampling ``Random.choice`` performs for each VIN character,
+    # minus the per-call overhead; the golden files pin the equivalence.
+    for _ in range(17):
+        while getrandbits(_VIN_CHARACTER_BITS) >= _VIN_CHARACTER_COUNT:
+            pass
+    choice(BODY_STYLES_BY_LOB[person["lob_type"]])
+    choice(RISK_RATINGS_BY_LOB[person["lob_type"]])
+
+
+def _generate_rows(
+    rng: random.Random, start: int, stop: int, include_profiles: bool, include_vehicles: bool = True
+) -> RowBlock:
+    """Fused single pass: each profile is built as soon as its vehicle exists.
+
+    v0.1 is one-to-one, so no ``person_id -> vehicle`` lookup is needed; the
+    standalone :func:`build_profiles` remains for callers holding finished lists.
+    Without vehicles the vehicle draws are still made, so persons match a full run.
+    """
 
-    effective_seed = settings.random_seed if seed is None else seed
-    rng = random.Random(effective_seed)
     persons: List[dict] = []
     vehicles: List[dict] = []
-    for index in range(record_target):
+    profiles: List[dict] = []
+    marker = settings.synthetic_marker
+    if not include_vehicles:
+        for index in range(start, stop):
+            person = _generate_person(rng, index)
+            persons.append(person)
+            _skip_vehicle(rng, person)
+        return persons, vehicles, profiles
+    for index in range(start, stop):
         person = _generate_person(rng, index)
         persons.append(person)
         vehicle = _generate_vehicle(rng, person)
         vehicles.append(vehicle)
+        if include_profiles:
+            profiles.append(build_profile_row(person, vehicle, marker))
+    validate_profiles(profiles)
+    return persons, vehicles, profiles
+
+
+def _iter_sequential(
+    record_target: int,
+    seed: int,
+    include_profiles: bool,
+    chunk_size: int,
+    include_vehicles: bool = True,
+) -> Iterator[RowBlock]:
+    rng = random.Random(seed)
+    for start in range(0, record_target, chunk_size):
+        yield _generate_rows(
+            rng, start, min(start + chunk_size, record_target), include_profiles, include_vehicles
+        )
+
+
+def _derive_seed(seed: int, *path: int | str) -> int:
+    """Derive an independent 64-bit stream seed from ``seed`` and a path."""
+
+    digest = hashlib.blake2b(repr((seed, *path)).encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
 
-    profiles = (
-        build_profiles(persons, vehicles, synthetic_source=settings.synthetic_marker)
-        if include_profiles
-        else []
-    )
 
-    metadata = DatasetMetadata(
+def _generate_shard(seed: int, shard_index: int, start: int, stop: int, include_profiles: bool) -> RowBlock:
+    # Module-level so ProcessPoolExecutor can pickle it by reference.
+    rng = random.Random(_derive_seed(seed, shard_index))
+    return _generate_rows(rng, start, stop, include_profiles)
+
+
+def _iter_shards(
+    record_target: int, seed: int, include_profiles: bool, workers: int
+) -> Iterator[RowBlock]:
+    shards = [
+        (seed, shard_index, start, min(start + SHARD_SIZE, record_target), include_profiles)
+        for shard_index, start in enumerate(range(0, record_target, SHARD_SIZE))
+    ]
+    if workers == 1 or len(shards) == 1:
+        for shard in shards:
+            yield _generate_shard(*shard)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+        # Bound in-flight shards so streaming consumers keep flat memory.
+        pending: deque = deque()
+        for shard in shards:
+            pending.append(pool.submit(_generate_shard, *shard))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _iter_sharded(
+    record_target: int, seed: int, include_profiles: bool, chunk_size: int, workers: int | None = None
+) -> Iterator[RowBlock]:
+    workers = workers or os.cpu_count() or 1
+    return _rechunk(_iter_shards(record_target, seed, include_profiles, workers), chunk_size)
+
+
+def _iter_vectorized(
+    record_target: int, seed: int, include_profiles: bool, chunk_size: int
+) -> Iterator[RowBlock]:
+    # Imported lazily so NumPy is only loaded when the batch engine is requested.
+    from enterprise_synthetic_data_hub.generation.vectorized import iter_vectorized
+
+    return _rechunk(iter_vectorized(record_target, seed, include_profiles), chunk_size)
+
+
+def _concat_blocks(blocks: List[RowBlock]) -> RowBlock:
+    if len(blocks) == 1:
+        return blocks[0]
+    return tuple(list(chain.from_iterable(block[entity] for block in blocks)) for entity in range(3))
+
+
+def _rechunk(blocks: Iterable[RowBlock], chunk_size: int) -> Iterator[RowBlock]:
+    """Re-slice engine-sized blocks into ``chunk_size`` row blocks.
+
+    Blocks are collected until a chunk's worth has arrived and concatenated
+    once, so the cost stays linear even when ``chunk_size`` is the whole run.
+    """
+
+    pending: List[RowBlock] = []
+    pending_rows = 0
+    for block in blocks:
+        pending.append(block)
+        pending_rows += len(block[0])
+        if pending_rows < chunk_size:
+            continue
+        merged = _concat_blocks(pending)
+        offset = 0
+        while pending_rows - offset >= chunk_size:
+            yield tuple(rows[offset : offset + chunk_size] for rows in merged)
+            offset += chunk_size
+        pending_rows -= offset
+        pending = [tuple(rows[offset:] for rows in merged)] if pending_rows else []
+    if pending_rows:
+        yield _concat_blocks(pending)
+
+
+def _generate_counter_rows(seed: int, start: int, stop: int, include_profiles: bool) -> RowBlock:
+    rng = random.Random()
+    persons: List[dict] = []
+    vehicles: List[dict] = []
+    profiles: List[dict] = []
+    marker = settings.synthetic_marker
+    for index in range(start, stop):
+        # Every record owns its stream, so record i never depends on 0..i-1.
+        rng.seed(_derive_seed(seed, "record", index))
+        person = _generate_person(rng, index)
+        persons.append(person)
+        vehicle = _generate_vehicle(rng, person)
+        vehicles.append(vehicle)
+        if include_profiles:
+            profiles.append(build_profile_row(person, vehicle, marker))
+    validate_profiles(profiles)
+    return persons, vehicles, profiles
+
+
+def _iter_counter(
+    record_target: int, seed: int, include_profiles: bool, chunk_size: int
+) -> Iterator[RowBlock]:
+    for start in range(0, record_target, chunk_size):
+        yield _generate_counter_rows(
+            seed, start, min(start + chunk_size, record_target), include_profiles
+        )
+
+
+_ENGINE_ITERATORS = {
+    "sequential": _iter_sequential,
+    "vectorized": _iter_vectorized,
+    "sharded": _iter_sharded,
+    "counter": _iter_counter,
+}
+
+
+def _iter_engine(
+    engine: str,
+    record_target: int,
+    seed: int,
+    include_profiles: bool,
+    chunk_size: int,
+    workers: int | None,
+    include_vehicles: bool = True,
+) -> Iterator[RowBlock]:
+    if not include_vehicles:
+        if engine != "sequential":
+            raise ValueError("include_vehicles=False is only supported by the sequential engine")
+        return _iter_sequential(record_target, seed, False, chunk_size, False)
+    if engine == "sharded":
+        return _iter_sharded(record_target, seed, include_profiles, chunk_size, workers)
+    return _ENGINE_ITERATORS[engine](record_target, seed, include_profiles, chunk_size)
+
+
+def _resolve_profiles(include_profiles: bool | None, include_vehicles: bool) -> bool:
+    """Default ``include_profiles`` to ``include_vehicles``; profiles need vehicles."""
+
+    if include_profiles is None:
+        return include_vehicles
+    if include_profiles and not include_vehicles:
+        raise ValueError("profiles require vehicles; pass include_profiles=False")
+    return include_profiles
+
+
+def _resolve_target(
+    num_records: int | None, seed: int | None, engine: str, workers: int | None = None
+) -> Tuple[int, int]:
+    record_target = settings.target_person_records if num_records is None else num_records
+    if record_target <= 0:
+        raise ValueError("num_records must be positive")
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of: {', '.join(ENGINES)}")
+    if workers is not None:
+        if engine != "sharded":
+            raise ValueError("workers is only supported by the sharded engine")
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+    effective_seed = settings.random_seed if seed is None else seed
+    return record_target, effective_seed
+
+
+def build_snapshot_metadata(
+    record_count: int, seed: int, include_profiles: bool = True, include_vehicles: bool = True
+) -> DatasetMetadata:
+    """Return bundle metadata for ``record_count`` person/vehicle pairs.
+
+    Counts are known before generation starts (v0.1 is one-to-one), which lets
+    streaming writers emit metadata ahead of the rows.
+    """
+
+    return DatasetMetadata(
         dataset_version=settings.dataset_version,
         generated_at=settings.generation_timestamp,
-        record_count_persons=len(persons),
-        record_count_vehicles=len(vehicles),
-        record_count_profiles=len(profiles),
+        record_count_persons=record_count,
+        record_count_vehicles=record_count if include_vehicles else 0,
+        record_count_profiles=record_count if include_profiles else 0,
         notes=(
             "Deterministic snapshot generated from rule-based distributions "
-            f"(seed={effective_seed})."
+            f"(seed={seed})."
         ),
     )
+
+
+def iter_snapshot_records(
+    num_records: int | None = None,
+    seed: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    include_profiles: bool | None = None,
+    engine: str = "sequential",
+    workers: int | None = None,
+    include_vehicles: bool = True,
+) -> Iterator[SnapshotChunk]:
+    """Yield snapshot rows in order, ``chunk_size`` records at a time.
+
+    Concatenating the chunks reproduces :func:`generate_snapshot_bundle` for the
+    same arguments exactly, while only one chunk is held in memory at a time.
+    Arguments are validated eagerly, before the first chunk is requested.
+    """
+
+    include_profiles = _resolve_profiles(include_profiles, include_vehicles)
+    record_target, effective_seed = _resolve_target(num_records, seed, engine, workers)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    blocks = _iter_engine(
+        engine, record_target, effective_seed, include_profiles, chunk_size, workers, include_vehicles
+    )
+    return _number_chunks(blocks)
+
+
+def _number_chunks(blocks: Iterable[RowBlock]) -> Iterator[SnapshotChunk]:
+    start = 0
+    for persons, vehicles, profiles in blocks:
+        yield SnapshotChunk(start=start, persons=persons, vehicles=vehicles, profiles=profiles)
+        start += len(persons)
+
+
+def generate_records(
+    seed: int | None,
+    start: int,
+    stop: int,
+    include_profiles: bool = True,
+) -> SnapshotChunk:
+    """Return records ``start``..``stop - 1`` of the counter-engine dataset for ``seed``.
+
+    Every field of record ``index`` is derived from ``(seed, index)`` alone, so
+    any window costs time proportional to its size and matches the same slice
+    of ``generate_snapshot_bundle(seed=seed, engine="counter")``.
+    """
+
+    if start < 0 or stop < start:
+        raise ValueError("start and stop must satisfy 0 <= start <= stop")
+    effective_seed = settings.random_seed if seed is None else seed
+    persons, vehicles, profiles = _generate_counter_rows(effective_seed, start, stop, include_profiles)
+    return SnapshotChunk(start=start, persons=persons, vehicles=vehicles, profiles=profiles)
+
+
+def generate_snapshot_bundle(
+    num_records: int | None = None,
+    seed: int | None = None,
+    include_profiles: bool | None = None,
+    engine: str = "sequential",
+    workers: int | None = None,
+    include_vehicles: bool = True,
+) -> SnapshotBundle:
+    """Generate deterministic snapshot bundle used across the pipeline.
+
+    ``engine="vectorized"`` draws whole columns with NumPy for large runs;
+    most of its time here goes into building the row dicts, so prefer
+    ``generate_columnar_bundle(engine="vectorized")`` when columns suffice.
+    ``engine="sharded"`` splits the records into fixed ``SHARD_SIZE`` shards,
+    each with its own derived RNG stream, and fans them out over ``workers``
+    processes (default: CPU count); output is identical for any worker count.
+    ``engine="counter"`` derives each record from ``(seed, index)`` so windows
+    can be served by :func:`generate_records` without generating the prefix.
+    All three are deterministic per seed but yield different streams than the
+    default ``"sequential"`` engine, which remains the reference for golden
+    snapshots.
+
+    ``include_vehicles=False`` (sequential engine) returns persons only:
+    vehicle draws still advance the RNG but no vehicle or profile rows are
+    built, so the persons match a full run. ``include_profiles`` defaults to
+    ``include_vehicles``; asking for profiles without vehicles is an error.
+    """
+
+    include_profiles = _resolve_profiles(include_profiles, include_vehicles)
+    record_target, effective_seed = _resolve_target(num_records, seed, engine, workers)
+    blocks = _iter_engine(
+        engine,
+        record_target,
+        effective_seed,
+        include_profiles,
+        record_target,
+        workers,
+        include_vehicles,
+    )
+    persons: List[dict] = []
+    vehicles: List[dict] = []
+    profiles: List[dict] = []
+    for block_persons, block_vehicles, block_profiles in blocks:
+        persons.extend(block_persons)
+        vehicles.extend(block_vehicles)
+        profiles.extend(block_profiles)
+
     return SnapshotBundle(
-        metadata=metadata,
+        metadata=build_snapshot_metadata(
+            len(persons), effective_seed, include_profiles, include_vehicles
+        ),
         persons=persons,
         vehicles=vehicles,
         profiles=profiles,
     )
 
 
-def write_snapshot_bundle(bundle: SnapshotBundle, output_dir: Path | None = None) -> Path:
-    """Persist the snapshot bundle to disk for downstream consumers."""
+def write_snapshot_bundle(
+    bundle: SnapshotBundle,
+    output_dir: Path | None = None,
+    *,
+    compact: bool = False,
+    digests: DigestLog | None = None,
+) -> Path:
+    """Persist the snapshot bundle to disk for downstream consumers.
+
+    Records are streamed to the dataset file element by element, so the full
+    JSON document is never held in memory. The default indented layout is
+    byte-identical to ``json.dumps(payload, indent=2)``; ``compact=True``
+    drops all insignificant whitespace for machine consumers. Both files'
+    digests are recorded in ``digests`` when given.
+    """
 
     output_dir = output_dir or DATA_OUTPUT_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -224,14 +568,21 @@ def write_snapshot_bundle(bundle: SnapshotBundle, output_dir: Path | None = None
     metadata_name = f"metadata_{version_slug}.json"
     snapshot_path = output_dir / snapshot_name
     metadata_path = output_dir / metadata_name
-    snapshot_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    metadata_path.write_text(json.dumps(metadata_payload, indent=2), encoding="utf-8")
+    write_json_file(snapshot_path, payload, compact=compact, digests=digests)
+    write_json_file(metadata_path, metadata_payload, compact=compact, digests=digests)
     return snapshot_path
 
 
 __all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "ENGINES",
+    "SHARD_SIZE",
     "SnapshotBundle",
+    "SnapshotChunk",
+    "build_snapshot_metadata",
     "describe_generation_plan",
+    "generate_records",
     "generate_snapshot_bundle",
+    "iter_snapshot_records",
     "write_snapshot_bundle",
 ]
@@ -0,0 +1,160 @@
+"""Per-seed prefix cache over the sequential engine.
+
+The sequential engine draws person and vehicle fields from one RNG in a
+fixed order, so the first N records for a seed are identical whatever the
+requested total. :class:`PrefixCache` keeps the longest run generated so far
+for each seed together with the RNG state at its end: smaller requests are
+served by slicing, larger ones generate only the missing tail.
+
+A run is generated at the narrowest scope requested so far (persons only,
+persons and vehicles, or everything); a request needing more rebuilds the
+run at the wider scope.
+"""
+from __future__ import annotations
+
+import random
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List
+
+from enterprise_synthetic_data_hub.generation.generator import (
+    SnapshotBundle,
+    _generate_rows,
+    _resolve_profiles,
+    _resolve_target,
+    build_snapshot_metadata,
+)
+
+# A full-scope record (person, vehicle and profile dicts) holds about 2.15 KB
+# and each run's saved RNG state about 25 KB, so the defaults cap the cache
+# near 45 MB.
+DEFAULT_PREFIX_CACHE_RECORDS = 20_000
+DEFAULT_PREFIX_CACHE_SEEDS = 8
+# Scopes in widening order: persons only, + vehicles, + profiles.
+_PERSONS, _VEHICLES, _PROFILES = range(3)
+
+
+@dataclass
+class _PrefixRun:
+    seed: int
+    scope: int
+    persons: List[dict] = field(default_factory=list)
+    vehicles: List[dict] = field(default_factory=list)
+    profiles: List[dict] = field(default_factory=list)
+    rng_state: tuple = ()
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self.rng_state = random.Random(self.seed).getstate()
+
+    def reset(self, scope: int) -> None:
+        self.scope = scope
+        self.persons, self.vehicles, self.profiles = [], [], []
+        self.rng_state = random.Random(self.seed).getstate()
+
+
+class PrefixCache:
+    """Longest sequential run per seed, bounded by total records and by seeds held.
+
+    Bundles share row dicts with the cache, so callers must treat them as
+    read-only. Requests larger than ``max_records`` are still served from the
+    cached prefix and saved RNG state but are not kept.
+    """
+
+    def __init__(
+        self,
+        max_records: int = DEFAULT_PREFIX_CACHE_RECORDS,
+        max_seeds: int = DEFAULT_PREFIX_CACHE_SEEDS,
+    ):
+        if max_records <= 0:
+            raise ValueError("max_records must be positive")
+        if max_seeds <= 0:
+            raise ValueError("max_seeds must be positive")
+        self.max_records = max_records
+        self.max_seeds = max_seeds
+        self._runs: OrderedDict[int, _PrefixRun] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cached_records(self, seed: int) -> int:
+        """Return how many records are cached for ``seed``."""
+
+        run = self._runs.get(seed)
+        return len(run.persons) if run else 0
+
+    def bundle(
+        self,
+        num_records: int | None = None,
+        seed: int | None = None,
+        include_profiles: bool | None = None,
+        include_vehicles: bool = True,
+    ) -> SnapshotBundle:
+        """Return the same bundle as ``generate_snapshot_bundle`` (sequential engine)."""
+
+        include_profiles = _resolve_profiles(include_profiles, include_vehicles)
+        record_target, effective_seed = _resolve_target(num_records, seed, "sequential")
+        scope = _PROFILES if include_profiles else _VEHICLES if include_vehicles else _PERSONS
+        keep = record_target <= self.max_records
+        with self._lock:
+            run = self._runs.get(effective_seed)
+            if run is None:
+                run = _PrefixRun(effective_seed, scope)
+                if keep:
+                    self._runs[effective_seed] = run
+            else:
+                self._runs.move_to_end(effective_seed)
+
+        with run.lock:
+            record_goal = record_target
+            if run.scope < scope:
+                # The cached rows lack an entity this request needs: rebuild at
+                # the wider scope, keeping the run at least as long.
+                if keep:
+                    record_goal = max(record_target, len(run.persons))
+                    run.reset(scope)
+                else:
+                    run = _PrefixRun(effective_seed, scope)
+            persons, vehicles, profiles = run.persons, run.vehicles, run.profiles
+            cached = len(persons)
+            if cached < record_goal:
+                rng = random.Random()
+                rng.setstate(run.rng_state)
+                tail = _generate_rows(
+                    rng, cached, record_goal, run.scope == _PROFILES, run.scope >= _VEHICLES
+                )
+                if keep:
+                    persons.extend(tail[0])
+                    vehicles.extend(tail[1])
+                    profiles.extend(tail[2])
+                    run.rng_state = rng.getstate()
+                else:
+                    persons, vehicles, profiles = (
+                        rows + extra for rows, extra in zip((persons, vehicles, profiles), tail)
+                    )
+            bundle = SnapshotBundle(
+                metadata=build_snapshot_metadata(
+                    record_target, effective_seed, include_profiles, include_vehicles
+                ),
+                persons=persons[:record_target],
+                vehicles=vehicles[:record_target] if include_vehicles else [],
+                profiles=profiles[:record_target] if include_profiles else [],
+            )
+        if keep:
+            self._evict(effective_seed)
+        return bundle
+
+    def _evict(self, current_seed: int) -> None:
+        with self._lock:
+            total = sum(len(run.persons) for run in self._runs.values())
+            for seed in list(self._runs):
+                if total <= self.max_records and len(self._runs) <= self.max_seeds:
+                    break
+                if seed != current_seed:
+                    total -= len(self._runs.pop(seed).persons)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
+
+
+__all__ = ["DEFAULT_PREFIX_CACHE_RECORDS", "DEFAULT_PREFIX_CACHE_SEEDS", "PrefixCache"]
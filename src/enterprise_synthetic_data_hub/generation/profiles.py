@@ -4,10 +4,16 @@ from __future__ import annotations
 import uuid
 from typing import Sequence
 
+from pydantic import TypeAdapter
+
 from enterprise_synthetic_data_hub.config.settings import settings
 from enterprise_synthetic_data_hub.models.profile import Profile
 
 _PROFILE_NAMESPACE = uuid.UUID("ca92fd9b-5368-4924-8db6-bb1f56766c2b")
+_PROFILE_LIST_ADAPTER = TypeAdapter(list[Profile])
+
+PROFILE_VALIDATION_MODES = ("sample", "full", "off")
+PROFILE_VALIDATION_SAMPLE_SIZE = 100
 
 
 def _build_profile_id(person_id: str, vehicle_id: str) -> str:
@@ -15,37 +21,79 @@ def _build_profile_id(person_id: str, vehicle_id: str) -> str:
     return str(uuid.uuid5(_PROFILE_NAMESPACE, seed))
 
 
+def build_profile_row(person: dict, vehicle: dict, synthetic_source: str) -> dict:
+    """Assemble one profile dict; keys and values match ``Profile.model_dump(mode="json")``."""
+
+    return {
+        "profile_id": _build_profile_id(person["person_id"], vehicle["vehicle_id"]),
+        "person_id": person["person_id"],
+        "vehicle_id": vehicle["vehicle_id"],
+        "full_name": f"{person['first_name']} {person['last_name']}",
+        "lob_type": person["lob_type"],
+        "residence_state": person["state"],
+        "city": person["city"],
+        "postal_code": person["postal_code"],
+        "garaging_state": vehicle["garaging_state"],
+        "primary_vehicle_vin": vehicle["vin"],
+        "vehicle_summary": f"{vehicle['model_year']} {vehicle['make']} {vehicle['model']}",
+        "risk_rating": vehicle["risk_rating"],
+        "synthetic_source": synthetic_source,
+    }
+
+
+def validate_profiles(profiles: Sequence[dict], mode: str = "sample") -> None:
+    """Validate profile dicts against :class:`Profile` in one batch.
+
+    ``"full"`` validates every row, ``"sample"`` validates up to
+    ``PROFILE_VALIDATION_SAMPLE_SIZE`` rows spread evenly across the list, and
+    ``"off"`` skips validation. Raises ``pydantic.ValidationError`` on failure.
+    """
+
+    if mode not in PROFILE_VALIDATION_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(PROFILE_VALIDATION_MODES)}")
+    if mode == "off" or not profiles:
+        return
+    if mode == "sample" and len(profiles) > PROFILE_VALIDATION_SAMPLE_SIZE:
+        # Evenly spaced from the first row to the last, so the tail is always covered.
+        last = len(profiles) - 1
+        steps = PROFILE_VALIDATION_SAMPLE_SIZE - 1
+        profiles = [profiles[round(step * last / steps)] for step in range(steps + 1)]
+    _PROFILE_LIST_ADAPTER.validate_python(list(profiles))
+
+
 def build_profiles(
     persons: Sequence[dict],
     vehicles: Sequence[dict],
     *,
     synthetic_source: str | None = None,
+    validate: str = "sample",
 ) -> list[dict]:
-    """Return deterministic profiles derived from governed entities."""
+    """Return deterministic profiles derived from governed entities.
+
+    Rows are assembled as plain dicts (no per-row pydantic model). By default a
+    spread sample of the output is validated against :class:`Profile` in one
+    ``TypeAdapter`` call; pass ``validate="full"`` to check every row or
+    ``validate="off"`` to skip validation entirely.
+    """
 
+    if validate not in PROFILE_VALIDATION_MODES:
+        raise ValueError(f"validate must be one of: {', '.join(PROFILE_VALIDATION_MODES)}")
+    source = synthetic_source or settings.synthetic_marker
     vehicle_lookup = {vehicle["person_id"]: vehicle for vehicle in vehicles}
     profiles: list[dict] = []
     for person in persons:
         vehicle = vehicle_lookup.get(person["person_id"])
         if vehicle is None:
             continue
-        profile = Profile(
-            profile_id=_build_profile_id(person["person_id"], vehicle["vehicle_id"]),
-            person_id=person["person_id"],
-            vehicle_id=vehicle["vehicle_id"],
-            full_name=f"{person['first_name']} {person['last_name']}",
-            lob_type=person["lob_type"],
-            residence_state=person["state"],
-            city=person["city"],
-            postal_code=person["postal_code"],
-            garaging_state=vehicle["garaging_state"],
-            primary_vehicle_vin=vehicle["vin"],
-            vehicle_summary=f"{vehicle['model_year']} {vehicle['make']} {vehicle['model']}",
-            risk_rating=vehicle["risk_rating"],
-            synthetic_source=synthetic_source or settings.synthetic_marker,
-        )
-        profiles.append(profile.model_dump(mode="json"))
+        profiles.append(build_profile_row(person, vehicle, source))
+    validate_profiles(profiles, validate)
     return profiles
 
 
-__all__ = ["build_profiles"]
+__all__ = [
+    "PROFILE_VALIDATION_MODES",
+    "PROFILE_VALIDATION_SAMPLE_SIZE",
+    "build_profile_row",
+    "build_profiles",
+    "validate_profiles",
+]
@@ -0,0 +1,80 @@
+"""Precompiled weighted samplers for categorical distributions."""
+from __future__ import annotations
+
+import random
+from bisect import bisect_left
+from itertools import accumulate
+from typing import TYPE_CHECKING, Generic, List, Mapping, Sequence, TypeVar
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar("T")
+
+
+class WeightedSampler(Generic[T]):
+    """Draw keys of a weighted distribution in O(log n) via a cumulative array.
+
+    The table is built once per distribution. A scalar :meth:`draw` consumes
+    exactly one ``rng.random()`` and returns the first key whose cumulative
+    weight reaches the roll. Weights that already sum to exactly 1.0 are used
+    as given, so such distributions reproduce the original linear-scan
+    selection draw for draw (golden snapshots depend on this). Any other total
+    is normalized first, so raw counts work too, but rounding in the division
+    can move a bucket boundary by one ulp relative to a linear scan.
+    """
+
+    def __init__(self, distribution: Mapping[T, float]):
+        if not distribution:
+            raise ValueError("distribution must contain at least one entry")
+        weights = list(distribution.values())
+        if any(weight < 0 for weight in weights):
+            raise ValueError("distribution weights must be non-negative")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("distribution weights must sum to a positive value")
+        self._keys: List[T] = list(distribution.keys())
+        cumulative = list(accumulate(weights))
+        self._cumulative: List[float] = (
+            cumulative if total == 1.0 else [value / total for value in cumulative]
+        )
+        # Built by draw_codes on first use so the scalar engine never loads NumPy.
+        self._cumulative_array: np.ndarray | None = None
+
+    @property
+    def keys(self) -> Sequence[T]:
+        return self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _index(self, roll: float) -> int:
+        index = bisect_left(self._cumulative, roll)
+        # Floating point rounding can leave the final bucket just short of 1.0.
+        return index if index < len(self._keys) else 0
+
+    def draw(self, rng: random.Random) -> T:
+        """Return one key using a single ``rng.random()`` roll."""
+
+        return self._keys[self._index(rng.random())]
+
+    def draw_many(self, rng: random.Random, count: int) -> List[T]:
+        """Return ``count`` keys; equivalent to ``count`` successive :meth:`draw` calls."""
+
+        keys = self._keys
+        index = self._index
+        return [keys[index(rng.random())] for _ in range(count)]
+
+    def draw_codes(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Return ``count`` key indexes drawn with a vectorized binary search."""
+
+        import numpy as np
+
+        if self._cumulative_array is None:
+            self._cumulative_array = np.array(self._cumulative)
+        codes = np.searchsorted(self._cumulative_array, rng.random(count), side="left")
+        codes[codes >= len(self._keys)] = 0
+        return codes
+
+
+__all__ = ["WeightedSampler"]
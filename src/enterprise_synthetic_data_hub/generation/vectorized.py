@@ -0,0 +1,429 @@
+"""NumPy batch engine that draws whole columns instead of one record at a time.
+
+The engine follows the same governed rules as the sequential generator but
+consumes a ``numpy.random.Generator`` stream. Output is deterministic for a
+given seed and shares the ``SnapshotBundle`` row shape, yet it is a different
+random stream than ``engine="sequential"``; golden snapshots stay tied to the
+sequential engine.
+
+Each block is drawn once as NumPy columns (:class:`_BlockDraws`) and then
+either rendered as row dicts (:func:`iter_vectorized`) or appended straight
+into a :class:`ColumnarSnapshotBundle` (:func:`build_vectorized_columnar`).
+Building the dicts costs several times more than drawing the values, so the
+columnar path is the one to use for large runs.
+"""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from enterprise_synthetic_data_hub.config.settings import settings
+from enterprise_synthetic_data_hub.generation.generator import (
+    BODY_STYLES_BY_LOB,
+    FIRST_NAMES,
+    LAST_NAMES,
+    LOB_SAMPLER,
+    MAKES,
+    MODELS,
+    RISK_RATINGS_BY_LOB,
+    STATE_CITY_POSTAL,
+    STATES,
+    _build_address_line_2,
+    build_snapshot_metadata,
+)
+from enterprise_synthetic_data_hub.generation.bulk import (
+    VIN_LENGTH,
+    bulk_vin_bytes,
+    grid_to_strings,
+    render_uuid_grid,
+    vin_strings_from_bytes,
+)
+from enterprise_synthetic_data_hub.generation.columnar import ColumnarSnapshotBundle
+from enterprise_synthetic_data_hub.generation.profiles import _PROFILE_NAMESPACE, validate_profiles
+
+# Block size is part of the determinism contract: changing it changes output.
+BLOCK_SIZE = 65_536
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_MODEL_YEARS = (2008, 2024)
+_LICENSE_RANGE = (1000000, 9999999)
+_STREET_SUFFIX = b" Main Street"
+_POWERS_OF_TEN = 10 ** np.arange(1, 19, dtype=np.int64)
+_DOB_SPAN_DAYS = 20000
+_LOB_KEYS = list(LOB_SAMPLER.keys)
+_POSTAL_LOW = np.array([STATE_CITY_POSTAL[state]["postal_range"][0] for state in STATES])
+_POSTAL_HIGH = np.array([STATE_CITY_POSTAL[state]["postal_range"][1] for state in STATES])
+
+
+class _GroupedTable:
+    """Flattened lookup for "pick one value from the group selected per row"."""
+
+    def __init__(self, groups: Sequence[Sequence[str]]):
+        sizes = np.array([len(group) for group in groups])
+        self.sizes = sizes
+        self.offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        self.values = np.array([value for group in groups for value in group], dtype=object)
+        self.labels = self.values.tolist()
+
+    def draw_codes(self, rng: np.random.Generator, group_codes: np.ndarray) -> np.ndarray:
+        """Return indexes into :attr:`values`, one pick from each row's group."""
+
+        picks = rng.integers(0, self.sizes[group_codes])
+        return self.offsets[group_codes] + picks
+
+
+_CITIES = _GroupedTable([STATE_CITY_POSTAL[state]["cities"] for state in STATES])
+_MODELS = _GroupedTable([MODELS[make] for make in MAKES])
+_BODY_STYLES = _GroupedTable([BODY_STYLES_BY_LOB[lob] for lob in _LOB_KEYS])
+_RISK_RATINGS = _GroupedTable([RISK_RATINGS_BY_LOB[lob] for lob in _LOB_KEYS])
+_STATE_VALUES = np.array(STATES, dtype=object)
+_FIRST_NAME_VALUES = np.array(FIRST_NAMES, dtype=object)
+_LAST_NAME_VALUES = np.array(LAST_NAMES, dtype=object)
+_MAKE_VALUES = np.array(MAKES, dtype=object)
+_LOB_VALUES = np.array(_LOB_KEYS, dtype=object)
+# Derived categoricals are indexed by arithmetic over their source codes.
+_STATE_BYTES = np.array([state.encode("ascii") for state in STATES], dtype="S2")
+_FULL_NAMES = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+_MODEL_MAKES = [make for make in MAKES for _ in MODELS[make]]
+_VEHICLE_SUMMARIES = [
+    f"{year} {make} {model}"
+    for year in range(_MODEL_YEARS[0], _MODEL_YEARS[1] + 1)
+    for make, model in zip(_MODEL_MAKES, _MODELS.labels)
+]
+
+
+@dataclass
+class _BlockDraws:
+    """Every random column of one block, in the engine's fixed draw order."""
+
+    start: int
+    stop: int
+    state_codes: np.ndarray
+    dob_days: np.ndarray
+    city_codes: np.ndarray
+    postal_codes: np.ndarray
+    lob_codes: np.ndarray
+    person_raw: bytes
+    first_codes: np.ndarray
+    last_codes: np.ndarray
+    license_numbers: np.ndarray
+    make_codes: np.ndarray
+    model_codes: np.ndarray
+    model_years: np.ndarray
+    vehicle_raw: bytes
+    vin_raw: bytes
+    body_codes: np.ndarray
+    risk_codes: np.ndarray
+
+    @classmethod
+    def draw(cls, rng: np.random.Generator, start: int, stop: int) -> "_BlockDraws":
+        size = stop - start
+        state_codes = rng.integers(0, len(STATES), size)
+        dob_days = rng.integers(0, _DOB_SPAN_DAYS + 1, size)
+        city_codes = _CITIES.draw_codes(rng, state_codes)
+        postal_codes = rng.integers(_POSTAL_LOW[state_codes], _POSTAL_HIGH[state_codes], endpoint=True)
+        lob_codes = LOB_SAMPLER.draw_codes(rng, size)
+        person_raw = rng.bytes(16 * size)
+        first_codes = rng.integers(0, len(FIRST_NAMES), size)
+        last_codes = rng.integers(0, len(LAST_NAMES), size)
+        license_numbers = rng.integers(*_LICENSE_RANGE, size, endpoint=True)
+        make_codes = rng.integers(0, len(MAKES), size)
+        model_codes = _MODELS.draw_codes(rng, make_codes)
+        model_years = rng.integers(*_MODEL_YEARS, size, endpoint=True)
+        vehicle_raw = rng.bytes(16 * size)
+        vin_raw = bulk_vin_bytes(rng.bytes, size)
+        body_codes = _BODY_STYLES.draw_codes(rng, lob_codes)
+        risk_codes = _RISK_RATINGS.draw_codes(rng, lob_codes)
+        return cls(
+            start, stop, state_codes, dob_days, city_codes, postal_codes, lob_codes, person_raw,
+            first_codes, last_codes, license_numbers, make_codes, model_codes, model_years,
+            vehicle_raw, vin_raw, body_codes, risk_codes,
+        )  # fmt: skip
+
+    def profile_id_raw(self) -> bytes:
+        """Batch equivalent of profiles._build_profile_id (UUIDv5 over both ids)."""
+
+        size = self.stop - self.start
+        names = np.empty((size, 73), dtype="S1")
+        names[:, :36] = render_uuid_grid(self.person_raw)
+        names[:, 36] = b":"
+        names[:, 37:] = render_uuid_grid(self.vehicle_raw)
+        namespace = _PROFILE_NAMESPACE.bytes
+        sha1 = hashlib.sha1
+        digests = b"".join(
+            [sha1(namespace + name).digest()[:16] for name in names.view("S73").ravel().tolist()]
+        )
+        packed = np.frombuffer(digests, dtype=np.uint8).reshape(size, 16).copy()
+        packed[:, 6] = (packed[:, 6] & 0x0F) | 0x50
+        packed[:, 8] = (packed[:, 8] & 0x3F) | 0x80
+        return packed.tobytes()
+
+
+def _address_line_2_column(start: int, stop: int) -> List[str | None]:
+    # Only every third record carries a second line; fill those slots sparsely.
+    column: List[str | None] = [None] * (stop - start)
+    first = start + (-start % 3)
+    column[first - start :: 3] = [_build_address_line_2(index) for index in range(first, stop, 3)]
+    return column
+
+
+def _address_line_1_encoded(start: int, stop: int) -> Tuple[bytes, np.ndarray]:
+    """``f"{100 + index} Main Street"`` for the block as UTF-8 bytes plus lengths."""
+
+    numbers = np.arange(start + 100, stop + 100, dtype=np.int64)
+    digits = np.searchsorted(_POWERS_OF_TEN, numbers, side="right") + 1
+    grid = np.zeros((len(numbers), 20 + len(_STREET_SUFFIX)), dtype="S1")
+    grid[:, :20] = numbers.astype("S20").view("S1").reshape(-1, 20)
+    grid[:, 20:] = np.frombuffer(_STREET_SUFFIX, dtype="S1")
+    # Digits are NUL-padded to 20 bytes; dropping the padding joins the values.
+    return grid.tobytes().replace(b"\0", b""), digits + len(_STREET_SUFFIX)
+
+
+def _address_line_2_encoded(start: int, stop: int) -> Tuple[bytes, np.ndarray, np.ndarray]:
+    lines = _address_line_2_column(start, stop)
+    encoded = [b"" if line is None else line.encode("utf-8") for line in lines]
+    valid = np.fromiter((line is not None for line in lines), dtype=np.bool_, count=len(lines))
+    return b"".join(encoded), np.fromiter(map(len, encoded), dtype=np.int64, count=len(lines)), valid
+
+
+def _dictionary_encode(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(distinct values, codes)`` for a narrow-range integer column."""
+
+    low = int(values.min())
+    present = np.flatnonzero(np.bincount(values - low))
+    lookup = np.zeros(len(present) and int(present[-1]) + 1, dtype=np.intp)
+    lookup[present] = np.arange(len(present))
+    return present + low, lookup[values - low]
+
+
+def _block_rows(
+    draws: _BlockDraws, include_profiles: bool
+) -> Tuple[List[dict], List[dict], List[dict]]:
+    start, stop = draws.start, draws.stop
+    marker = settings.synthetic_marker
+
+    states = _STATE_VALUES[draws.state_codes].tolist()
+    dobs = np.datetime_as_string(_EPOCH + draws.dob_days, unit="D").tolist()
+    cities = _CITIES.values[draws.city_codes].tolist()
+    lob_types = _LOB_VALUES[draws.lob_codes].tolist()
+    person_ids = grid_to_strings(render_uuid_grid(draws.person_raw))
+    first_names = _FIRST_NAME_VALUES[draws.first_codes].tolist()
+    last_names = _LAST_NAME_VALUES[draws.last_codes].tolist()
+    license_numbers = draws.license_numbers.tolist()
+    makes = _MAKE_VALUES[draws.make_codes].tolist()
+    models = _MODELS.values[draws.model_codes].tolist()
+    model_years = draws.model_years.tolist()
+    vehicle_ids = grid_to_strings(render_uuid_grid(draws.vehicle_raw))
+    vins = vin_strings_from_bytes(draws.vin_raw)
+    body_styles = _BODY_STYLES.values[draws.body_codes].tolist()
+    risk_ratings = _RISK_RATINGS.values[draws.risk_codes].tolist()
+
+    postal_strings = [f"{postal:05d}" for postal in draws.postal_codes.tolist()]
+    address_lines_2 = _address_line_2_column(start, stop)
+    persons = [
+        {
+            "person_id": person_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "date_of_birth": dob,
+            "driver_license_number": f"{state}{license_number}",
+            "driver_license_state": state,
+            "address_line_1": f"{100 + index} Main Street",
+            "address_line_2": address_line_2,
+            "city": city,
+            "state": state,
+            "postal_code": postal_code,
+            "country": "US",
+            "lob_type": lob_type,
+            "synthetic_source": marker,
+        }
+        for index, address_line_2, person_id, first_name, last_name, dob, license_number, state, city, postal_code, lob_type in zip(
+            range(start, stop),
+            address_lines_2,
+            person_ids,
+            first_names,
+            last_names,
+            dobs,
+            license_numbers,
+            states,
+            cities,
+            postal_strings,
+            lob_types,
+        )
+    ]
+    vehicles = [
+        {
+            "vehicle_id": vehicle_id,
+            "person_id": person_id,
+            "vin": vin,
+            "make": make,
+            "model": model,
+            "model_year": model_year,
+            "body_style": body_style,
+            "risk_rating": risk_rating,
+            "lob_type": lob_type,
+            "garaging_state": state,
+            "garaging_postal_code": postal_code,
+            "synthetic_source": marker,
+        }
+        for vehicle_id, person_id, vin, make, model, model_year, body_style, risk_rating, lob_type, state, postal_code in zip(
+            vehicle_ids,
+            person_ids,
+            vins,
+            makes,
+            models,
+            model_years,
+            body_styles,
+            risk_ratings,
+            lob_types,
+            states,
+            postal_strings,
+        )
+    ]
+    profiles: List[dict] = []
+    if include_profiles:
+        # Fields mirror models.profile.Profile; assembled directly to avoid a
+        # per-row pydantic round-trip at batch scale.
+        profiles = [
+            {
+                "profile_id": profile_id,
+                "person_id": person_id,
+                "vehicle_id": vehicle_id,
+                "full_name": f"{first_name} {last_name}",
+                "lob_type": lob_type,
+                "residence_state": state,
+                "city": city,
+                "postal_code": postal_code,
+                "garaging_state": state,
+                "primary_vehicle_vin": vin,
+                "vehicle_summary": f"{model_year} {make} {model}",
+                "risk_rating": risk_rating,
+                "synthetic_source": marker,
+            }
+            for profile_id, person_id, vehicle_id, first_name, last_name, lob_type, state, city, postal_code, vin, model_year, make, model, risk_rating in zip(
+                grid_to_strings(render_uuid_grid(draws.profile_id_raw())),
+                person_ids,
+                vehicle_ids,
+                first_names,
+                last_names,
+                lob_types,
+                states,
+                cities,
+                postal_strings,
+                vins,
+                model_years,
+                makes,
+                models,
+                risk_ratings,
+            )
+        ]
+        validate_profiles(profiles)
+    return persons, vehicles, profiles
+
+
+def _append_block(bundle: ColumnarSnapshotBundle, draws: _BlockDraws, include_profiles: bool) -> None:
+    """Append one block to ``bundle`` column by column, without building rows."""
+
+    start, stop = draws.start, draws.stop
+    size = stop - start
+    marker = [settings.synthetic_marker]
+    constant = np.zeros(size, dtype=np.intp)
+    # Postal codes are few per state: dictionary-encode the block's values once.
+    postal_values, postal_codes = _dictionary_encode(draws.postal_codes)
+    postal_labels = [f"{postal:05d}" for postal in postal_values.tolist()]
+    licenses = np.empty((size, 9), dtype="S1")
+    licenses[:, :2] = _STATE_BYTES[draws.state_codes].view("S1").reshape(size, 2)
+    licenses[:, 2:] = draws.license_numbers.astype("S7").view("S1").reshape(size, 7)
+    dob_ordinals = draws.dob_days + _EPOCH_ORDINAL
+    vin_lengths = np.full(size, VIN_LENGTH)
+
+    persons = bundle.persons.columns
+    persons["person_id"].extend_raw(draws.person_raw)
+    persons["first_name"].extend_codes(draws.first_codes, FIRST_NAMES)
+    persons["last_name"].extend_codes(draws.last_codes, LAST_NAMES)
+    persons["date_of_birth"].extend_ordinals(dob_ordinals)
+    persons["driver_license_number"].extend_encoded(licenses.tobytes(), np.full(size, 9))
+    persons["driver_license_state"].extend_codes(draws.state_codes, STATES)
+    persons["address_line_1"].extend_encoded(*_address_line_1_encoded(start, stop))
+    persons["address_line_2"].extend_encoded(*_address_line_2_encoded(start, stop))
+    persons["city"].extend_codes(draws.city_codes, _CITIES.labels)
+    persons["state"].extend_codes(draws.state_codes, STATES)
+    persons["postal_code"].extend_codes(postal_codes, postal_labels)
+    persons["country"].extend_codes(constant, ["US"])
+    persons["lob_type"].extend_codes(draws.lob_codes, _LOB_KEYS)
+    persons["synthetic_source"].extend_codes(constant, marker)
+    bundle.persons.commit_rows(size)
+
+    vehicles = bundle.vehicles.columns
+    vehicles["vehicle_id"].extend_raw(draws.vehicle_raw)
+    vehicles["person_id"].extend_raw(draws.person_raw)
+    vehicles["vin"].extend_encoded(draws.vin_raw, vin_lengths)
+    vehicles["make"].extend_codes(draws.make_codes, MAKES)
+    vehicles["model"].extend_codes(draws.model_codes, _MODELS.labels)
+    vehicles["model_year"].extend_array(draws.model_years)
+    vehicles["body_style"].extend_codes(draws.body_codes, _BODY_STYLES.labels)
+    vehicles["risk_rating"].extend_codes(draws.risk_codes, _RISK_RATINGS.labels)
+    vehicles["lob_type"].extend_codes(draws.lob_codes, _LOB_KEYS)
+    vehicles["garaging_state"].extend_codes(draws.state_codes, STATES)
+    vehicles["garaging_postal_code"].extend_codes(postal_codes, postal_labels)
+    vehicles["synthetic_source"].extend_codes(constant, marker)
+    bundle.vehicles.commit_rows(size)
+
+    if not include_profiles:
+        return
+    profiles = bundle.profiles.columns
+    profiles["profile_id"].extend_raw(draws.profile_id_raw())
+    profiles["person_id"].extend_raw(draws.person_raw)
+    profiles["vehicle_id"].extend_raw(draws.vehicle_raw)
+    profiles["full_name"].extend_codes(draws.first_codes * len(LAST_NAMES) + draws.last_codes, _FULL_NAMES)
+    profiles["lob_type"].extend_codes(draws.lob_codes, _LOB_KEYS)
+    profiles["residence_state"].extend_codes(draws.state_codes, STATES)
+    profiles["city"].extend_codes(draws.city_codes, _CITIES.labels)
+    profiles["postal_code"].extend_codes(postal_codes, postal_labels)
+    profiles["garaging_state"].extend_codes(draws.state_codes, STATES)
+    profiles["primary_vehicle_vin"].extend_encoded(draws.vin_raw, vin_lengths)
+    summary_codes = (draws.model_years - _MODEL_YEARS[0]) * len(_MODEL_MAKES) + draws.model_codes
+    profiles["vehicle_summary"].extend_codes(summary_codes, _VEHICLE_SUMMARIES)
+    profiles["risk_rating"].extend_codes(draws.risk_codes, _RISK_RATINGS.labels)
+    profiles["synthetic_source"].extend_codes(constant, marker)
+    bundle.profiles.commit_rows(size)
+
+
+def _iter_draws(record_target: int, seed: int) -> Iterator[_BlockDraws]:
+    # random.Random ignores the sign of integer seeds; mirror that for NumPy.
+    rng = np.random.default_rng(abs(seed))
+    for start in range(0, record_target, BLOCK_SIZE):
+        yield _BlockDraws.draw(rng, start, min(start + BLOCK_SIZE, record_target))
+
+
+def iter_vectorized(
+    record_target: int, seed: int, include_profiles: bool = True
+) -> Iterator[Tuple[List[dict], List[dict], List[dict]]]:
+    """Yield persons, vehicles, and profiles drawn column-wise in fixed blocks."""
+
+    for draws in _iter_draws(record_target, seed):
+        yield _block_rows(draws, include_profiles)
+
+
+def build_vectorized_columnar(
+    record_target: int, seed: int, include_profiles: bool = True
+) -> ColumnarSnapshotBundle:
+    """Draw the same rows as :func:`iter_vectorized` straight into columnar tables.
+
+    Profiles are validated on a sample of materialized rows, like the row path
+    does per block.
+    """
+
+    bundle = ColumnarSnapshotBundle.empty(build_snapshot_metadata(record_target, seed, include_profiles))
+    for draws in _iter_draws(record_target, seed):
+        _append_block(bundle, draws, include_profiles)
+    validate_profiles(bundle.profiles)
+    return bundle
+
+
+__all__ = ["BLOCK_SIZE", "build_vectorized_columnar", "iter_vectorized"]
@@ -0,0 +1,181 @@
+"""Typed Arrow conversion and Parquet / Arrow IPC writers for snapshot entities.
+
+This module needs the optional ``pyarrow`` dependency
+(``pip install enterprise-synthetic-data-hub[columnar]``); the exporters
+import it lazily so the rest of the package works without it.
+
+Rows are packed into a :class:`ColumnarTable` first and converted buffer by
+buffer: categorical fields become dictionary arrays, ``date`` fields
+``date32``, ``int`` fields ``int32``, and UUID / free-text fields plain
+strings. Dictionaries only ever grow across batches, which keeps every batch
+of an IPC file a valid dictionary delta of the previous one.
+"""
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from enterprise_synthetic_data_hub.generation.bulk import uuid_strings_from_bytes
+from enterprise_synthetic_data_hub.generation.columnar import (
+    CategoricalColumn,
+    ColumnarTable,
+    DateColumn,
+    IntColumn,
+    StringColumn,
+    UUIDColumn,
+)
+from enterprise_synthetic_data_hub.io.checksums import DigestLog, open_digest_file
+
+ARROW_FORMATS: Sequence[str] = ("parquet", "arrow")
+DEFAULT_ROW_GROUP_SIZE = 100_000
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_NULLABLE_FIELDS = frozenset({"address_line_2"})
+_ARROW_TYPES = {
+    "category": pa.dictionary(pa.int32(), pa.string()),
+    "uuid": pa.string(),
+    "date": pa.date32(),
+    "int": pa.int32(),
+    "string": pa.string(),
+}
+
+
+def arrow_schema(layout: Mapping[str, str]) -> pa.Schema:
+    """Return the Arrow schema for an entity layout from :mod:`generation.columnar`."""
+
+    return pa.schema(
+        [
+            pa.field(name, _ARROW_TYPES[kind], nullable=name in _NULLABLE_FIELDS)
+            for name, kind in layout.items()
+        ]
+    )
+
+
+class _DictionaryUnifier:
+    """Map per-batch category codes onto one append-only dictionary."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._lookup: Dict[str, int] = {}
+
+    def remap(self, column: CategoricalColumn) -> pa.DictionaryArray:
+        lookup = self._lookup
+        remap = np.empty(len(column.categories), dtype=np.int32)
+        for local_code, value in enumerate(column.categories):
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.values)
+                self.values.append(value)
+            remap[local_code] = code
+        codes = np.frombuffer(column.codes, dtype=column.codes.typecode)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(remap[codes], type=pa.int32()), pa.array(self.values, type=pa.string())
+        )
+
+
+def _string_array(column: StringColumn) -> pa.Array:
+    valid = np.frombuffer(column.valid, dtype=np.uint8)
+    null_count = int(len(valid) - valid.sum())
+    bitmap = pa.py_buffer(np.packbits(valid, bitorder="little")) if null_count else None
+    large = pa.LargeStringArray.from_buffers(
+        len(column),
+        pa.py_buffer(column.offsets),
+        pa.py_buffer(bytes(column.data)),
+        bitmap,
+        null_count,
+    )
+    return large.cast(pa.string())
+
+
+def _column_array(column, unifier: _DictionaryUnifier | None) -> pa.Array:
+    if isinstance(column, CategoricalColumn):
+        return unifier.remap(column)
+    if isinstance(column, UUIDColumn):
+        return pa.array(uuid_strings_from_bytes(bytes(column.data)), type=pa.string())
+    if isinstance(column, DateColumn):
+        days = np.frombuffer(column.ordinals, dtype=np.int32) - _UNIX_EPOCH_ORDINAL
+        return pa.array(days, type=pa.int32()).cast(pa.date32())
+    if isinstance(column, IntColumn):
+        return pa.array(np.frombuffer(column.values, dtype=np.int64).astype(np.int32), type=pa.int32())
+    return _string_array(column)
+
+
+class ArrowEntityWriter:
+    """Stream one entity into a Parquet or Arrow IPC file in fixed-size row groups."""
+
+    def __init__(
+        self,
+        path: Path,
+        layout: Mapping[str, str],
+        fmt: str,
+        row_group_size: int,
+        digests: DigestLog | None = None,
+    ):
+        if fmt not in ARROW_FORMATS:
+            raise ValueError(f"Unknown columnar format '{fmt}'. Expected one of: {', '.join(ARROW_FORMATS)}")
+        if row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
+        self.path = path
+        self.layout = dict(layout)
+        self.schema = arrow_schema(layout)
+        self._row_group_size = row_group_size
+        self._unifiers = {
+            name: _DictionaryUnifier() for name, kind in layout.items() if kind == "category"
+        }
+        self._pending: List[dict] = []
+        self.rows_written = 0
+        self._handle = open_digest_file(path, "wb", digests)
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(self._handle, self.schema)
+        else:
+            self._writer = ipc.new_file(
+                self._handle, self.schema, options=ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+            )
+
+    def _flush(self, rows: Sequence[dict]) -> None:
+        table = ColumnarTable(self.layout)
+        table.extend(rows)
+        arrays = [
+            _column_array(column, self._unifiers.get(name)) for name, column in table.columns.items()
+        ]
+        batch = pa.record_batch(arrays, schema=self.schema)
+        if isinstance(self._writer, pq.ParquetWriter):
+            self._writer.write_batch(batch, row_group_size=len(rows))
+        else:
+            self._writer.write_batch(batch)
+        self.rows_written += len(rows)
+
+    def write_rows(self, rows: Sequence[dict]) -> None:
+        self._pending.extend(rows)
+        size = self._row_group_size
+        if len(self._pending) < size:
+            return
+        full = len(self._pending) - len(self._pending) % size
+        for start in range(0, full, size):
+            self._flush(self._pending[start : start + size])
+        del self._pending[:full]
+
+    def close(self) -> None:
+        if self._pending:
+            self._flush(self._pending)
+            self._pending = []
+        self._writer.close()
+        self._handle.close()
+
+    def abort(self) -> None:
+        """Drop pending rows, close the file and delete it."""
+
+        self._pending = []
+        try:
+            self._writer.close()
+        finally:
+            self._handle.close()
+            self.path.unlink(missing_ok=True)
+
+
+__all__ = ["ARROW_FORMATS", "ArrowEntityWriter", "DEFAULT_ROW_GROUP_SIZE", "arrow_schema"]
@@ -0,0 +1,301 @@
+"""Snapshot artifact layout and the writers shared by every export path.
+
+:mod:`io.exporters` and :mod:`io.sinks` both build on these: file naming,
+the streaming CSV and JSON Lines writers, and the metadata, manifest and
+README files that accompany every snapshot.
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import operator
+from pathlib import Path
+from typing import IO, Iterable, List, Sequence
+
+from enterprise_synthetic_data_hub.io.checksums import (
+    DigestLog,
+    file_digest,
+    open_digest_file,
+    write_digest_text,
+)
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
+
+PERSON_COLUMNS: Sequence[str] = (
+    "person_id",
+    "first_name",
+    "last_name",
+    "date_of_birth",
+    "driver_license_number",
+    "driver_license_state",
+    "address_line_1",
+    "address_line_2",
+    "city",
+    "state",
+    "postal_code",
+    "country",
+    "lob_type",
+    "synthetic_source",
+)
+VEHICLE_COLUMNS: Sequence[str] = (
+    "vehicle_id",
+    "person_id",
+    "vin",
+    "make",
+    "model",
+    "model_year",
+    "body_style",
+    "risk_rating",
+    "lob_type",
+    "garaging_state",
+    "garaging_postal_code",
+    "synthetic_source",
+)
+JSONL_SHARD_SIZE = 500_000
+JSONL_ENTITIES: Sequence[str] = ("persons", "vehicles", "profiles")
+
+
+class CsvStreamWriter:
+    """Write rows as tuples in a fixed column order, counting as it goes."""
+
+    def __init__(self, path: Path, columns: Sequence[str], digests: DigestLog | None = None):
+        self.path = path
+        self._handle = open_digest_file(path, "w", digests, newline="", encoding="utf-8")
+        self._writer = csv.writer(self._handle)
+        self._writer.writerow(columns)
+        # csv.writer renders None as an empty field, matching the governed CSV format.
+        self._project = operator.itemgetter(*columns)
+        self.rows_written = 0
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        project = self._project
+        count = 0
+        for row in rows:
+            self._writer.writerow(project(row))
+            count += 1
+        self.rows_written += count
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "CsvStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class _GzipShard(gzip.GzipFile):
+    """Gzip stream over a digesting file that closes the underlying file too."""
+
+    def __init__(self, handle: IO[bytes], path: Path):
+        self._raw_handle = handle
+        super().__init__(filename=str(path), mode="wb", fileobj=handle, mtime=0)
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._raw_handle.close()
+
+
+class JsonlShardWriter:
+    """Write rows as JSON Lines, rolling over to a new shard every ``shard_size`` rows."""
+
+    def __init__(
+        self,
+        output_dir: Path,
+        stem: str,
+        shard_size: int,
+        compress: bool,
+        digests: DigestLog | None = None,
+    ):
+        self._output_dir = output_dir
+        self._digests = digests
+        self._stem = stem
+        self._shard_size = shard_size
+        self._compress = compress
+        self._encode = json.JSONEncoder(separators=(",", ":")).encode
+        self._handle: IO[bytes] | None = None
+        self._shard_rows = 0
+        self.paths: List[Path] = []
+        self.shard_rows: List[int] = []
+
+    @property
+    def rows_written(self) -> int:
+        return sum(self.shard_rows)
+
+    def _open_next(self) -> IO[bytes]:
+        suffix = ".jsonl.gz" if self._compress else ".jsonl"
+        path = self._output_dir / f"{self._stem}-{len(self.paths):05d}{suffix}"
+        self.paths.append(path)
+        self.shard_rows.append(0)
+        # mtime=0 keeps compressed shards byte-reproducible for a given seed.
+        handle = open_digest_file(path, "wb", self._digests)
+        if not self._compress:
+            return handle
+        return _GzipShard(handle, path)
+
+    def write_rows(self, rows: Sequence[dict]) -> None:
+        encode = self._encode
+        position = 0
+        while position < len(rows):
+            if self._handle is None or self._shard_rows == self._shard_size:
+                self.close()
+                self._handle = self._open_next()
+                self._shard_rows = 0
+            take = min(self._shard_size - self._shard_rows, len(rows) - position)
+            lines = [encode(row) for row in rows[position : position + take]]
+            self._handle.write(("\n".join(lines) + "\n").encode("utf-8"))
+            self._shard_rows += take
+            self.shard_rows[-1] = self._shard_rows
+            position += take
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def shards(self) -> List[dict]:
+        return [
+            {"file": path.name, "rows": rows, "bytes": path.stat().st_size}
+            for path, rows in zip(self.paths, self.shard_rows)
+        ]
+
+
+def snapshot_output_dir(output_dir: Path | None, dataset_version: str) -> Path:
+    """Return ``output_dir`` (default ``data/snapshots/<version>``), creating it."""
+
+    output_dir = Path(output_dir or Path("data") / "snapshots" / dataset_version)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def artifact_paths(output_dir: Path, dataset_version: str) -> dict[str, Path]:
+    """Return the conventional path of every single-file artifact, by manifest label."""
+
+    version_slug = dataset_version.replace(".", "_")
+    return {
+        "persons_csv": output_dir / f"persons_{version_slug}.csv",
+        "vehicles_csv": output_dir / f"vehicles_{version_slug}.csv",
+        "dataset_json": output_dir / f"dataset_{version_slug}.json",
+        "metadata_json": output_dir / f"metadata_{version_slug}.json",
+        "manifest_json": output_dir / f"snapshot_manifest_{version_slug}.json",
+        "sqlite_db": output_dir / f"snapshot_{version_slug}.sqlite",
+        "binary_snapshot": output_dir / f"snapshot_{version_slug}.esdb",
+        "readme": output_dir / f"README_SNAPSHOT_{version_slug.upper()}.md",
+    }
+
+
+_README_DESCRIPTIONS = {
+    "persons_csv": "persons CSV",
+    "vehicles_csv": "vehicles CSV",
+    "dataset_json": "combined JSON bundle",
+    "metadata_json": "metadata JSON",
+    "manifest_json": "manifest",
+    "sqlite_db": "SQLite database",
+    "binary_snapshot": "fixed-width binary snapshot",
+    "persons_parquet": "persons Parquet",
+    "vehicles_parquet": "vehicles Parquet",
+    "profiles_parquet": "profiles Parquet",
+    "persons_arrow": "persons Arrow IPC",
+    "vehicles_arrow": "vehicles Arrow IPC",
+    "profiles_arrow": "profiles Arrow IPC",
+}
+
+
+def _readme_description(label: str) -> str | None:
+    if label in _README_DESCRIPTIONS:
+        return _README_DESCRIPTIONS[label]
+    entity, _, shard = label.partition("_jsonl_")
+    if shard:
+        return f"{entity} JSON Lines shard {int(shard)}"
+    return None
+
+
+def write_manifest(
+    path: Path,
+    metadata: DatasetMetadata,
+    record_counts: dict[str, int],
+    files: dict[str, Path],
+    extra: dict | None = None,
+    digests: DigestLog | None = None,
+) -> None:
+    """Write the snapshot manifest: counts, file names and a checksum per file.
+
+    Checksums come from ``digests`` where the files were logged while being
+    written; any other file is hashed from disk.
+    """
+
+    manifest = {
+        "dataset_version": metadata.dataset_version,
+        "generated_at": metadata.generated_at.isoformat(),
+        "record_counts": record_counts,
+        "files": {label: file_path.name for label, file_path in files.items()},
+        "checksums": {
+            label: {"file": file_path.name, **file_digest(file_path, digests)}
+            for label, file_path in files.items()
+        },
+        "notes": metadata.notes,
+        **(extra or {}),
+    }
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+
+def write_readme(path: Path, dataset_version: str, files: dict[str, Path]) -> None:
+    """Write the snapshot README listing every described file."""
+
+    path.write_text(
+        "\n".join(
+            [
+                f"# Snapshot {dataset_version}",
+                "",  # blank line
+                "Files exported by the CLI:",
+                *[
+                    f"- {file_path.name} ({_readme_description(label)})"
+                    for label, file_path in files.items()
+                    if _readme_description(label)
+                ],
+                "",
+                "Re-generate via:",
+                "```bash",
+                "python -m enterprise_synthetic_data_hub.cli.main generate-snapshot",
+                "```",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def write_metadata(
+    path: Path,
+    metadata: DatasetMetadata,
+    record_counts: dict[str, int],
+    digests: DigestLog | None = None,
+) -> DatasetMetadata:
+    """Write the metadata JSON with the counts actually exported and return that metadata."""
+
+    final_metadata = metadata.model_copy(
+        update={
+            "record_count_persons": record_counts["persons"],
+            "record_count_vehicles": record_counts["vehicles"],
+            "record_count_profiles": record_counts["profiles"],
+        }
+    )
+    write_digest_text(path, json.dumps(final_metadata.model_dump(mode="json"), indent=2), digests)
+    return final_metadata
+
+
+__all__ = [
+    "CsvStreamWriter",
+    "JSONL_ENTITIES",
+    "JSONL_SHARD_SIZE",
+    "JsonlShardWriter",
+    "PERSON_COLUMNS",
+    "VEHICLE_COLUMNS",
+    "artifact_paths",
+    "snapshot_output_dir",
+    "write_manifest",
+    "write_metadata",
+    "write_readme",
+]
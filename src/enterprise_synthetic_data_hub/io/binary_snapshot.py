@@ -0,0 +1,327 @@
+"""Fixed-width binary snapshot format with O(1) random access by row index.
+
+File layout (all integers little-endian)::
+
+    b"ESDHBIN1" | u32 header length | header JSON | padding | entity blocks
+
+The JSON header carries the dataset metadata and, per entity, the row count,
+record size, block offset, field formats and the dictionary tables for
+categorical fields. Every entity block is ``rows * record_size`` bytes of
+fixed-width records, so row ``i`` lives at ``offset + i * record_size``:
+
+* ``uuid``: 16 raw bytes;
+* ``category``: ``u16`` (or ``u32`` for large dictionaries) index into the
+  field's dictionary table;
+* ``date``: ``i32`` proleptic Gregorian ordinal; ``int``: ``i64``;
+* ``string``: ``u16`` byte length (``0xFFFF`` for null) followed by the UTF-8
+  bytes padded to the longest value in the column.
+
+:class:`BinarySnapshot` memory-maps the file and hands out ``memoryview``
+slices of the map, decoding a record into the usual row dict only when it is
+indexed.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Sequence, overload
+
+import numpy as np
+
+from enterprise_synthetic_data_hub.generation.columnar import (
+    CategoricalColumn,
+    ColumnarSnapshotBundle,
+    ColumnarTable,
+    DateColumn,
+    IntColumn,
+    UUIDColumn,
+)
+from enterprise_synthetic_data_hub.generation.generator import SnapshotBundle
+from enterprise_synthetic_data_hub.io.checksums import DigestLog, open_digest_file
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
+
+BINARY_MAGIC = b"ESDHBIN1"
+BINARY_VERSION = 1
+BINARY_ENTITIES: Sequence[str] = ("persons", "vehicles", "profiles")
+_NULL_LENGTH = 0xFFFF
+_WRITE_BATCH_ROWS = 65_536
+_PREAMBLE = struct.Struct("<8sI")
+_NUMPY_CODES = {"H": "<u2", "I": "<u4", "i": "<i4", "q": "<i8"}
+
+
+def _align(value: int, boundary: int = 8) -> int:
+    return -(-value // boundary) * boundary
+
+
+def _field_spec(name: str, column) -> dict:
+    if isinstance(column, UUIDColumn):
+        return {"name": name, "kind": "uuid", "format": "16s"}
+    if isinstance(column, CategoricalColumn):
+        code = "H" if len(column.categories) <= 0xFFFF + 1 else "I"
+        return {"name": name, "kind": "category", "format": code}
+    if isinstance(column, DateColumn):
+        return {"name": name, "kind": "date", "format": "i"}
+    if isinstance(column, IntColumn):
+        return {"name": name, "kind": "int", "format": "q"}
+    lengths = np.diff(np.frombuffer(column.offsets, dtype=np.int64))
+    width = max(int(lengths.max()) if len(lengths) else 0, 1)
+    if width >= _NULL_LENGTH:
+        raise ValueError(f"{name} values are too long for the fixed-width format")
+    return {"name": name, "kind": "string", "format": f"H{width}s", "width": width}
+
+
+def _record_dtype(fields: Sequence[dict]) -> np.dtype:
+    names, formats, offsets = [], [], []
+    position = 0
+    for spec in fields:
+        if spec["kind"] == "string":
+            names.extend([f"{spec['name']}__length", spec["name"]])
+            formats.extend(["<u2", f"S{spec['width']}"])
+            offsets.extend([position, position + 2])
+        elif spec["kind"] == "uuid":
+            names.append(spec["name"])
+            formats.append("V16")
+            offsets.append(position)
+        else:
+            names.append(spec["name"])
+            formats.append(_NUMPY_CODES[spec["format"]])
+            offsets.append(position)
+        position += struct.calcsize("<" + spec["format"])
+    return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": position})
+
+
+def _fill_batch(records: np.ndarray, table: ColumnarTable, fields: Sequence[dict], start: int) -> None:
+    stop = start + len(records)
+    for spec in fields:
+        name = spec["name"]
+        column = table.columns[name]
+        kind = spec["kind"]
+        if kind == "uuid":
+            records[name] = np.frombuffer(column.data, dtype="V16")[start:stop]
+        elif kind == "category":
+            records[name] = np.frombuffer(column.codes, dtype=column.codes.typecode)[start:stop]
+        elif kind == "date":
+            records[name] = np.frombuffer(column.ordinals, dtype=np.int32)[start:stop]
+        elif kind == "int":
+            records[name] = np.frombuffer(column.values, dtype=np.int64)[start:stop]
+        else:
+            offsets = column.offsets
+            data = column.data
+            valid = column.valid
+            records[name] = [bytes(data[offsets[i] : offsets[i + 1]]) for i in range(start, stop)]
+            lengths = np.diff(np.frombuffer(offsets, dtype=np.int64)[start : stop + 1])
+            lengths[np.frombuffer(valid, dtype=np.uint8)[start:stop] == 0] = _NULL_LENGTH
+            records[f"{name}__length"] = lengths
+
+
+def write_binary_snapshot(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle, path: Path, digests: DigestLog | None = None
+) -> Path:
+    """Write ``bundle`` to ``path`` in the fixed-width binary format."""
+
+    columnar = (
+        bundle if isinstance(bundle, ColumnarSnapshotBundle) else ColumnarSnapshotBundle.from_bundle(bundle)
+    )
+    entities = {}
+    layouts = {}
+    for entity in BINARY_ENTITIES:
+        table: ColumnarTable = getattr(columnar, entity)
+        fields = [_field_spec(name, column) for name, column in table.columns.items()]
+        layouts[entity] = (table, fields, _record_dtype(fields))
+        entities[entity] = {
+            "rows": len(table),
+            "record_size": layouts[entity][2].itemsize,
+            "fields": fields,
+            "dictionaries": {
+                name: column.categories
+                for name, column in table.columns.items()
+                if isinstance(column, CategoricalColumn)
+            },
+        }
+
+    # Block offsets depend on the header length and vice versa; re-encode until
+    # the offsets stop moving (at most a couple of rounds).
+    header = {"version": BINARY_VERSION, "metadata": bundle.metadata.model_dump(mode="json"), "entities": entities}
+    for spec in entities.values():
+        spec["offset"] = 0
+    while True:
+        encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        position = _align(_PREAMBLE.size + len(encoded))
+        offsets = []
+        for spec in entities.values():
+            offsets.append(position)
+            position = _align(position + spec["rows"] * spec["record_size"])
+        if offsets == [spec["offset"] for spec in entities.values()]:
+            break
+        for spec, offset in zip(entities.values(), offsets):
+            spec["offset"] = offset
+
+    with open_digest_file(path, "wb", digests) as handle:
+        handle.write(_PREAMBLE.pack(BINARY_MAGIC, len(encoded)))
+        handle.write(encoded)
+        written = _PREAMBLE.size + len(encoded)
+        for entity in BINARY_ENTITIES:
+            spec = entities[entity]
+            handle.write(b"\0" * (spec["offset"] - written))
+            written = spec["offset"]
+            table, fields, dtype = layouts[entity]
+            for start in range(0, spec["rows"], _WRITE_BATCH_ROWS):
+                records = np.zeros(min(_WRITE_BATCH_ROWS, spec["rows"] - start), dtype=dtype)
+                _fill_batch(records, table, fields, start)
+                handle.write(records.tobytes())
+                written += records.nbytes
+    return path
+
+
+def _uuid_text(raw: bytes) -> str:
+    hexed = raw.hex()
+    return f"{hexed[:8]}-{hexed[8:12]}-{hexed[12:16]}-{hexed[16:20]}-{hexed[20:]}"
+
+
+class BinaryTable(Sequence[dict]):
+    """Read-only view of one entity block inside a memory-mapped snapshot."""
+
+    def __init__(self, buffer: memoryview, spec: Mapping):
+        self._rows = spec["rows"]
+        self.record_size = spec["record_size"]
+        offset = spec["offset"]
+        self._block = buffer[offset : offset + self._rows * self.record_size]
+        self.fields: List[dict] = spec["fields"]
+        self.dictionaries: Dict[str, List] = spec["dictionaries"]
+        self._struct = struct.Struct("<" + "".join(field["format"] for field in self.fields))
+        decoders = []
+        for field in self.fields:
+            kind = field["kind"]
+            if kind == "category":
+                decoders.append((1, self.dictionaries[field["name"]].__getitem__))
+            elif kind == "uuid":
+                decoders.append((1, _uuid_text))
+            elif kind == "date":
+                decoders.append((1, lambda ordinal: date.fromordinal(ordinal).isoformat()))
+            elif kind == "int":
+                decoders.append((1, None))
+            else:
+                decoders.append((2, None))
+        self._decoders = decoders
+        self._names = [field["name"] for field in self.fields]
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def record(self, index: int) -> memoryview:
+        """Return the raw fixed-width bytes of row ``index`` without copying."""
+
+        if index < 0:
+            index += self._rows
+        if not 0 <= index < self._rows:
+            raise IndexError("row index out of range")
+        start = index * self.record_size
+        return self._block[start : start + self.record_size]
+
+    def row(self, index: int) -> dict:
+        values = self._struct.unpack(self.record(index))
+        row = {}
+        position = 0
+        for name, (width, decode) in zip(self._names, self._decoders):
+            if width == 2:
+                length, raw = values[position], values[position + 1]
+                row[name] = None if length == _NULL_LENGTH else raw[:length].decode("utf-8")
+            else:
+                value = values[position]
+                row[name] = decode(value) if decode else value
+            position += width
+        return row
+
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[dict]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(position) for position in range(*index.indices(self._rows))]
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(self._rows):
+            yield self.row(index)
+
+    def release(self) -> None:
+        self._block.release()
+
+
+class BinarySnapshot:
+    """Memory-mapped reader for files produced by :func:`write_binary_snapshot`."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        magic, header_length = _PREAMBLE.unpack_from(self._buffer)
+        if magic != BINARY_MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a binary snapshot")
+        header = json.loads(bytes(self._buffer[_PREAMBLE.size : _PREAMBLE.size + header_length]))
+        if header["version"] != BINARY_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported binary snapshot version {header['version']}")
+        self.metadata = DatasetMetadata.model_validate(header["metadata"])
+        self.tables: Dict[str, BinaryTable] = {
+            entity: BinaryTable(self._buffer, spec) for entity, spec in header["entities"].items()
+        }
+
+    def __getitem__(self, entity: str) -> BinaryTable:
+        return self.tables[entity]
+
+    @property
+    def persons(self) -> BinaryTable:
+        return self.tables["persons"]
+
+    @property
+    def vehicles(self) -> BinaryTable:
+        return self.tables["vehicles"]
+
+    @property
+    def profiles(self) -> BinaryTable:
+        return self.tables["profiles"]
+
+    def to_snapshot_bundle(self) -> SnapshotBundle:
+        return SnapshotBundle(
+            metadata=self.metadata,
+            persons=list(self.persons),
+            vehicles=list(self.vehicles),
+            profiles=list(self.profiles),
+        )
+
+    def close(self) -> None:
+        for table in getattr(self, "tables", {}).values():
+            table.release()
+        self._buffer.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "BinarySnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_binary_snapshot(path: Path) -> SnapshotBundle:
+    """Load a whole binary snapshot back into a :class:`SnapshotBundle`."""
+
+    with BinarySnapshot(path) as snapshot:
+        return snapshot.to_snapshot_bundle()
+
+
+__all__ = [
+    "BINARY_MAGIC",
+    "BinarySnapshot",
+    "BinaryTable",
+    "read_binary_snapshot",
+    "write_binary_snapshot",
+]
@@ -0,0 +1,151 @@
+"""SHA-256 digests computed while artifacts are written, plus manifest verification.
+
+Exporters open their output through :func:`open_digest_file`, which hashes
+and counts every byte on its way to disk and, on close, records the result
+in the export's :class:`DigestLog`. The manifest writer is handed that log,
+so :func:`file_digest` fills in checksums without reading multi-GB artifacts
+back. Files missing from the log (SQLite databases, which sqlite writes
+itself) are hashed from disk.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Mapping, Tuple
+
+_READ_BLOCK_SIZE = 1 << 20
+
+
+class DigestLog:
+    """``{"sha256", "bytes"}`` of the files written during one export, by path."""
+
+    def __init__(self) -> None:
+        self._digests: Dict[Path, dict] = {}
+
+    def record(self, path: Path, sha256: str, size: int) -> None:
+        self._digests[Path(path).resolve()] = {"sha256": sha256, "bytes": size}
+
+    def get(self, path: Path) -> dict | None:
+        return self._digests.get(Path(path).resolve())
+
+    def update(self, other: "DigestLog") -> None:
+        """Merge digests recorded elsewhere, e.g. by a worker process."""
+
+        self._digests.update(other._digests)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+
+class _DigestingFile(io.FileIO):
+    """Unbuffered binary file that hashes and counts bytes as they are written."""
+
+    def __init__(self, path: Path, digests: DigestLog | None):
+        super().__init__(path, "wb")
+        self.path = Path(path)
+        self._digests = digests
+        self._sha256 = hashlib.sha256()
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        written = super().write(data)
+        self._sha256.update(memoryview(data)[:written])
+        self.bytes_written += written
+        return written
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        super().close()
+        if self._digests is not None:
+            self._digests.record(self.path, self._sha256.hexdigest(), self.bytes_written)
+
+
+def open_digest_file(
+    path: Path, mode: str = "w", digests: DigestLog | None = None, **text_options
+):
+    """Open ``path`` for writing (``"w"`` text or ``"wb"`` binary) with inline hashing.
+
+    The digest is recorded in ``digests`` when the file is closed. Text
+    options (``encoding``, ``newline``) are forwarded to the text layer.
+    """
+
+    if mode not in ("w", "wb"):
+        raise ValueError("mode must be 'w' or 'wb'")
+    buffered = io.BufferedWriter(_DigestingFile(path, digests), buffer_size=_READ_BLOCK_SIZE)
+    if mode == "wb":
+        return buffered
+    return io.TextIOWrapper(buffered, **text_options)
+
+
+def write_digest_text(path: Path, text: str, digests: DigestLog | None = None) -> None:
+    """``Path.write_text(text, encoding="utf-8")`` with the digest recorded in ``digests``."""
+
+    with open_digest_file(path, "w", digests, encoding="utf-8") as handle:
+        handle.write(text)
+
+
+def hash_file(path: Path) -> Tuple[str, int]:
+    """Return ``(sha256 hex digest, size in bytes)`` by reading ``path``."""
+
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(_READ_BLOCK_SIZE), b""):
+            digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size
+
+
+def file_digest(path: Path, digests: DigestLog | None = None) -> dict:
+    """Return ``{"sha256", "bytes"}`` for ``path`` from ``digests``, hashing it if absent."""
+
+    recorded = digests.get(path) if digests is not None else None
+    if recorded is not None:
+        return dict(recorded)
+    sha256, size = hash_file(path)
+    return {"sha256": sha256, "bytes": size}
+
+
+def verify_snapshot(manifest_path: Path, max_workers: int | None = None) -> Dict[str, str]:
+    """Check every file listed in the manifest's ``checksums``; return problems by label.
+
+    Files are hashed concurrently (``hashlib`` releases the GIL on large
+    blocks). An empty result means every file matched its size and digest.
+    """
+
+    manifest_path = Path(manifest_path)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    checksums: Mapping[str, dict] = manifest.get("checksums") or {}
+    if not checksums:
+        return {"manifest": "manifest has no checksums to verify"}
+
+    def check(entry: dict) -> str | None:
+        path = manifest_path.parent / entry["file"]
+        if not path.is_file():
+            return "missing"
+        if path.stat().st_size != entry["bytes"]:
+            return f"size {path.stat().st_size} != {entry['bytes']}"
+        sha256, _ = hash_file(path)
+        if sha256 != entry["sha256"]:
+            return "sha256 mismatch"
+        return None
+
+    workers = max_workers or min(len(checksums), (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = dict(zip(checksums, executor.map(check, checksums.values())))
+    return {label: problem for label, problem in results.items() if problem}
+
+
+__all__ = [
+    "DigestLog",
+    "file_digest",
+    "hash_file",
+    "open_digest_file",
+    "verify_snapshot",
+    "write_digest_text",
+]
@@ -1,127 +1,238 @@
 """Export helpers for CLI + downstream consumers."""
 from __future__ import annotations
 
-import csv
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, List, Sequence
 
+from enterprise_synthetic_data_hub.generation.columnar import ColumnarSnapshotBundle
 from enterprise_synthetic_data_hub.generation.generator import (
     SnapshotBundle,
+    SnapshotChunk,
     write_snapshot_bundle,
 )
+from enterprise_synthetic_data_hub.io.artifacts import (
+    JSONL_SHARD_SIZE,
+    PERSON_COLUMNS,
+    VEHICLE_COLUMNS,
+    CsvStreamWriter,
+    artifact_paths,
+    snapshot_output_dir,
+    write_manifest,
+    write_readme,
+)
+from enterprise_synthetic_data_hub.io.checksums import DigestLog
+from enterprise_synthetic_data_hub.io.sinks import build_sink, export_snapshot_sinks
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
 from enterprise_synthetic_data_hub.models.person import Person
 from enterprise_synthetic_data_hub.models.vehicle import Vehicle
 
-PERSON_COLUMNS: Sequence[str] = (
-    "person_id",
-    "first_name",
-    "last_name",
-    "date_of_birth",
-    "driver_license_number",
-    "driver_license_state",
-    "address_line_1",
-    "address_line_2",
-    "city",
-    "state",
-    "postal_code",
-    "country",
-    "lob_type",
-    "synthetic_source",
-)
-VEHICLE_COLUMNS: Sequence[str] = (
-    "vehicle_id",
-    "person_id",
-    "vin",
-    "make",
-    "model",
-    "model_year",
-    "body_style",
-    "risk_rating",
-    "lob_type",
-    "garaging_state",
-    "garaging_postal_code",
-    "synthetic_source",
-)
 
+def _write_csv(path: Path, rows: Iterable[dict], columns: Sequence[str]) -> DigestLog:
+    digests = DigestLog()
+    with CsvStreamWriter(path, columns, digests) as writer:
+        writer.write_rows(rows)
+    return digests
 
-def _serialize_row(row: dict, columns: Sequence[str]) -> dict:
-    return {column: ("" if row.get(column) is None else row.get(column)) for column in columns}
 
+def _write_dataset_json(bundle: SnapshotBundle, output_dir: Path) -> DigestLog:
+    digests = DigestLog()
+    write_snapshot_bundle(bundle, output_dir, digests=digests)
+    return digests
 
-def _write_csv(path: Path, rows: Iterable[dict], columns: Sequence[str]) -> None:
-    with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=columns)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(_serialize_row(row, columns))
 
+def _run_export_tasks(
+    tasks: List[Callable[[], DigestLog]], max_workers: int | None
+) -> List[DigestLog]:
+    workers = min(max_workers or 1, len(tasks))
+    if workers <= 1:
+        return [task() for task in tasks]
+    with ThreadPoolExecutor(workers) as pool:
+        return list(pool.map(lambda task: task(), tasks))
 
-def export_snapshot_bundle(bundle: SnapshotBundle, output_dir: Path | None = None) -> dict:
-    """Persist governed CSV/JSON + manifest artifacts for the snapshot."""
 
-    output_dir = Path(output_dir or Path("data") / "snapshots" / bundle.metadata.dataset_version)
-    output_dir.mkdir(parents=True, exist_ok=True)
+def export_snapshot_bundle(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle, output_dir: Path | None = None, *, max_workers: int | None = None
+) -> dict:
+    """Persist governed CSV/JSON + manifest artifacts for the snapshot.
 
-    version_slug = bundle.metadata.dataset_version.replace(".", "_")
-    persons_path = output_dir / f"persons_{version_slug}.csv"
-    vehicles_path = output_dir / f"vehicles_{version_slug}.csv"
-    manifest_path = output_dir / f"snapshot_manifest_{version_slug}.json"
-    readme_path = output_dir / f"README_SNAPSHOT_{version_slug.upper()}.md"
+    With ``max_workers`` greater than one, the persons CSV, vehicles CSV and
+    dataset/metadata JSON are written concurrently on a thread pool; the
+    writers stream through :func:`open_digest_file`, so file I/O and hashing
+    overlap. The manifest and README are always written last, once every
+    artifact exists. Output bytes are identical in both modes.
+    """
 
-    _write_csv(persons_path, bundle.persons, PERSON_COLUMNS)
-    _write_csv(vehicles_path, bundle.vehicles, VEHICLE_COLUMNS)
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be a positive integer")
+    output_dir = snapshot_output_dir(output_dir, bundle.metadata.dataset_version)
+    paths = artifact_paths(output_dir, bundle.metadata.dataset_version)
 
-    dataset_path = write_snapshot_bundle(bundle, output_dir)
-    metadata_path = dataset_path.with_name(dataset_path.name.replace("dataset_", "metadata_"))
+    tasks = [
+        partial(_write_csv, paths["persons_csv"], bundle.persons, PERSON_COLUMNS),
+        partial(_write_csv, paths["vehicles_csv"], bundle.vehicles, VEHICLE_COLUMNS),
+        partial(_write_dataset_json, bundle, output_dir),
+    ]
+    digests = DigestLog()
+    for task_digests in _run_export_tasks(tasks, max_workers):
+        digests.update(task_digests)
 
-    manifest = {
-        "dataset_version": bundle.metadata.dataset_version,
-        "generated_at": bundle.metadata.generated_at.isoformat(),
-        "record_counts": {
+    files = {
+        "persons_csv": paths["persons_csv"],
+        "vehicles_csv": paths["vehicles_csv"],
+        "dataset_json": paths["dataset_json"],
+        "metadata_json": paths["metadata_json"],
+    }
+    write_manifest(
+        paths["manifest_json"],
+        bundle.metadata,
+        {
             "persons": len(bundle.persons),
             "vehicles": len(bundle.vehicles),
             "profiles": len(bundle.profiles),
         },
-        "files": {
-            "persons_csv": persons_path.name,
-            "vehicles_csv": vehicles_path.name,
-            "dataset_json": dataset_path.name,
-            "metadata_json": metadata_path.name,
-        },
-        "notes": bundle.metadata.notes,
-    }
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-
-    readme_path.write_text(
-        "\n".join(
-            [
-                f"# Snapshot {bundle.metadata.dataset_version}",
-                "",  # blank line
-                "Files exported by the CLI:",
-                f"- {persons_path.name} (persons CSV)",
-                f"- {vehicles_path.name} (vehicles CSV)",
-                f"- {dataset_path.name} (combined JSON bundle)",
-                f"- {metadata_path.name} (metadata JSON)",
-                f"- {manifest_path.name} (manifest)",
-                "",
-                "Re-generate via:",
-                "```bash",
-                "python -m enterprise_synthetic_data_hub.cli.main generate-snapshot",
-                "```",
-            ]
-        ),
-        encoding="utf-8",
+        files,
+        digests=digests,
+    )
+    write_readme(
+        paths["readme"],
+        bundle.metadata.dataset_version,
+        {**files, "manifest_json": paths["manifest_json"]},
     )
 
-    return {
-        "persons_csv": persons_path,
-        "vehicles_csv": vehicles_path,
-        "dataset_json": dataset_path,
-        "metadata_json": metadata_path,
-        "manifest_json": manifest_path,
-        "readme": readme_path,
-    }
+    return {**files, "manifest_json": paths["manifest_json"], "readme": paths["readme"]}
+
+
+def export_snapshot_stream(
+    chunks: Iterable[SnapshotChunk],
+    metadata: DatasetMetadata,
+    output_dir: Path | None = None,
+) -> dict:
+    """Write persons/vehicles CSVs while chunks are still being generated.
+
+    ``chunks`` is typically :func:`iter_snapshot_records`; each chunk is written
+    and released before the next one is produced, so time and memory scale with
+    the chunk size rather than the dataset. Record counts in the metadata JSON
+    and manifest come from the rows actually written.
+    """
+
+    return export_snapshot_sinks(chunks, metadata, [build_sink("csv")], output_dir)
+
+
+def export_snapshot_jsonl_stream(
+    chunks: Iterable[SnapshotChunk | SnapshotBundle],
+    metadata: DatasetMetadata,
+    output_dir: Path | None = None,
+    *,
+    shard_size: int = JSONL_SHARD_SIZE,
+    compress: bool = False,
+) -> dict:
+    """Write one sharded JSON Lines file set per entity while chunks arrive.
+
+    Each entity is split into files of at most ``shard_size`` rows
+    (``persons_v0_1-00000.jsonl`` and so on, ``.jsonl.gz`` when ``compress``).
+    The manifest lists every shard with its row count and on-disk byte size
+    so consumers can fetch and parse shards in parallel.
+    """
+
+    sink = build_sink("jsonl", shard_size=shard_size, compress=compress)
+    return export_snapshot_sinks(chunks, metadata, [sink], output_dir)
+
+
+def export_snapshot_jsonl(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle,
+    output_dir: Path | None = None,
+    *,
+    shard_size: int = JSONL_SHARD_SIZE,
+    compress: bool = False,
+) -> dict:
+    """Persist a generated bundle as sharded JSON Lines plus metadata and manifest."""
+
+    return export_snapshot_jsonl_stream(
+        [bundle], bundle.metadata, output_dir, shard_size=shard_size, compress=compress
+    )
+
+
+def export_snapshot_columnar_stream(
+    chunks: Iterable[SnapshotChunk | SnapshotBundle],
+    metadata: DatasetMetadata,
+    output_dir: Path | None = None,
+    *,
+    fmt: str = "parquet",
+    row_group_size: int | None = None,
+) -> dict:
+    """Write typed Parquet (``fmt="parquet"``) or Arrow IPC (``fmt="arrow"``) files per entity.
+
+    See :class:`io.sinks.ArrowSink` for the column types. Requires the
+    optional ``pyarrow`` dependency.
+    """
+
+    if fmt not in ("parquet", "arrow"):
+        raise ValueError(f"Unknown columnar format '{fmt}'. Expected one of: parquet, arrow")
+    sink = build_sink(fmt, row_group_size=row_group_size)
+    return export_snapshot_sinks(chunks, metadata, [sink], output_dir)
+
+
+def export_snapshot_columnar(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle,
+    output_dir: Path | None = None,
+    *,
+    fmt: str = "parquet",
+    row_group_size: int | None = None,
+) -> dict:
+    """Persist a generated bundle as typed Parquet or Arrow IPC files plus manifest."""
+
+    return export_snapshot_columnar_stream(
+        [bundle], bundle.metadata, output_dir, fmt=fmt, row_group_size=row_group_size
+    )
+
+
+def export_snapshot_sqlite_stream(
+    chunks: Iterable[SnapshotChunk | SnapshotBundle],
+    metadata: DatasetMetadata,
+    output_dir: Path | None = None,
+) -> dict:
+    """Bulk load chunks into ``snapshot_<version>.sqlite`` with indexes built afterwards.
+
+    Tables ``persons``, ``vehicles`` and ``profiles`` follow the model
+    schemas with foreign keys to their parents; unique keys and indexes on
+    the QA lookup columns (``person_id``, ``state``, ``lob_type``, ``vin``)
+    are created once the load has finished.
+    """
+
+    return export_snapshot_sinks(chunks, metadata, [build_sink("sqlite")], output_dir)
+
+
+def export_snapshot_sqlite(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle, output_dir: Path | None = None
+) -> dict:
+    """Persist a generated bundle as an indexed SQLite database plus manifest."""
+
+    return export_snapshot_sqlite_stream([bundle], bundle.metadata, output_dir)
+
+
+def export_snapshot_binary_stream(
+    chunks: Iterable[SnapshotChunk | SnapshotBundle],
+    metadata: DatasetMetadata,
+    output_dir: Path | None = None,
+) -> dict:
+    """Write chunks to ``snapshot_<version>.esdb``, the fixed-width binary format.
+
+    String widths and category dictionaries are only known once every row has
+    been seen, so chunks are accumulated in columnar form before the file is
+    written (see :mod:`io.binary_snapshot`).
+    """
+
+    return export_snapshot_sinks(chunks, metadata, [build_sink("binary")], output_dir)
+
+
+def export_snapshot_binary(
+    bundle: SnapshotBundle | ColumnarSnapshotBundle, output_dir: Path | None = None
+) -> dict:
+    """Persist a generated bundle in the fixed-width binary format plus manifest."""
+
+    return export_snapshot_binary_stream([bundle], bundle.metadata, output_dir)
 
 
 def export_snapshot_stub(output_dir: Path, persons: Iterable[Person], vehicles: Iterable[Vehicle]) -> None:
@@ -136,4 +247,16 @@ def export_snapshot_stub(output_dir: Path, persons: Iterable[Person], vehicles:
     )
 
 
-__all__ = ["export_snapshot_bundle"]
+__all__ = [
+    "JSONL_SHARD_SIZE",
+    "export_snapshot_binary",
+    "export_snapshot_binary_stream",
+    "export_snapshot_bundle",
+    "export_snapshot_columnar",
+    "export_snapshot_columnar_stream",
+    "export_snapshot_jsonl",
+    "export_snapshot_jsonl_stream",
+    "export_snapshot_sqlite",
+    "export_snapshot_sqlite_stream",
+    "export_snapshot_stream",
+]
@@ -0,0 +1,204 @@
+"""Incremental JSON writer for large snapshot documents.
+
+``json.dumps(payload, indent=2)`` builds the whole document as one string
+before anything reaches disk. :func:`write_json_document` encodes a top-level
+object section by section instead, emitting each array element on its own and
+flushing the text to the file handle in fixed-size blocks, so memory stays
+bounded by the largest single record rather than the full dataset.
+
+Indented output is byte-identical to ``json.dumps(payload, indent=2)``;
+compact output matches ``json.dumps(payload, separators=(",", ":"))``.
+"""
+from __future__ import annotations
+
+import json
+from json.encoder import encode_basestring_ascii
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, TextIO
+
+from enterprise_synthetic_data_hub.io.checksums import DigestLog, open_digest_file
+
+JSON_WRITE_BUFFER_SIZE = 1 << 20
+_INDENT = 2
+# Exact-type encoders for the scalar values snapshot records are made of. The
+# stdlib only uses its C encoder when ``indent`` is None, so indented records
+# of these types are rendered here instead; anything else (floats, nested
+# containers, subclasses) goes through ``json.JSONEncoder``.
+_SCALAR_ENCODERS: dict[type, Callable[[Any], str]] = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+class _BufferedText:
+    """Collect text fragments and hand them to ``handle.write`` in large blocks."""
+
+    def __init__(self, handle: TextIO, buffer_size: int):
+        self._handle = handle
+        self._buffer_size = buffer_size
+        self._parts: List[str] = []
+        self._pending = 0
+
+    def write(self, text: str) -> None:
+        self._parts.append(text)
+        self._pending += len(text)
+        if self._pending >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._parts:
+            self._handle.write("".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
+
+
+def _indented_flat_record(record: Any, indent: str) -> str | None:
+    """Render a non-empty dict of scalars like ``json.dumps(indent=2)``, else None."""
+
+    if type(record) is not dict or not record:
+        return None
+    encoders = _SCALAR_ENCODERS
+    parts = []
+    for key, value in record.items():
+        encoder = encoders.get(type(value))
+        if encoder is None or type(key) is not str:
+            return None
+        parts.append(f"{encode_basestring_ascii(key)}: {encoder(value)}")
+    inner = indent + " " * _INDENT
+    return "{" + inner + ("," + inner).join(parts) + indent + "}"
+
+
+class ArrayElementEncoder:
+    """Render elements of a top-level array section as :func:`write_json_document` does.
+
+    Text built from ``encode`` results joined with ``separator`` can be handed
+    back later as an :class:`EncodedArray` and is spliced in unchanged.
+    """
+
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+        if compact:
+            self._encode = json.JSONEncoder(separators=(",", ":")).encode
+            self._indent = ""
+            self.separator = ","
+        else:
+            self._encode = json.JSONEncoder(indent=_INDENT).encode
+            self._indent = "\n" + " " * (2 * _INDENT)
+            self.separator = "," + self._indent
+
+    def encode(self, element: Any) -> str:
+        if self.compact:
+            return self._encode(element)
+        text = _indented_flat_record(element, self._indent)
+        return text if text is not None else self._encode(element).replace("\n", self._indent)
+
+
+class EncodedArray:
+    """An array section whose elements were already rendered by :class:`ArrayElementEncoder`.
+
+    ``blocks`` yields the element text (elements joined with the encoder's
+    separator) in arbitrary pieces, e.g. as read back from a spool file.
+    """
+
+    def __init__(self, blocks: Iterable[str]):
+        self.blocks = blocks
+
+
+def _is_streamable(value: Any) -> bool:
+    return isinstance(value, Iterable) and not isinstance(value, (str, bytes, Mapping))
+
+
+def _joined(texts: Iterable[str], separator: str) -> Iterator[str]:
+    for position, text in enumerate(texts):
+        if position:
+            yield separator
+        yield text
+
+
+def write_json_document(
+    handle: TextIO,
+    sections: Mapping[str, Any],
+    *,
+    compact: bool = False,
+    buffer_size: int = JSON_WRITE_BUFFER_SIZE,
+) -> None:
+    """Write ``sections`` as a JSON object, streaming any iterable section.
+
+    Mapping and scalar values are encoded whole; lists, tuples, columnar
+    tables, and generators are written element by element, and an
+    :class:`EncodedArray` is copied in as is.
+    """
+
+    if buffer_size <= 0:
+        raise ValueError("buffer_size must be positive")
+    out = _BufferedText(handle, buffer_size)
+    elements = ArrayElementEncoder(compact)
+    encode_element, element_separator = elements.encode, elements.separator
+    if compact:
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        key_separator, item_separator = ":", ","
+        object_open, object_close = "{", "}"
+        array_open, array_close = "[", "]"
+    else:
+        encode = json.JSONEncoder(indent=_INDENT).encode
+        key_separator, item_separator = ": ", ","
+        section_indent = "\n" + " " * _INDENT
+        object_open, object_close = "{" + section_indent, "\n}"
+        array_open, array_close = "[" + elements.separator[1:], section_indent + "]"
+
+    if not sections:
+        out.write("{}")
+        out.flush()
+        return
+
+    out.write(object_open)
+    for position, (key, value) in enumerate(sections.items()):
+        if position:
+            out.write(item_separator if compact else item_separator + section_indent)
+        out.write(encode(str(key)) + key_separator)
+        if isinstance(value, EncodedArray):
+            pieces = (block for block in value.blocks if block)
+        elif _is_streamable(value):
+            pieces = _joined(map(encode_element, value), element_separator)
+        else:
+            text = encode(value)
+            out.write(text if compact else text.replace("\n", section_indent))
+            continue
+        empty = True
+        for piece in pieces:
+            if empty:
+                out.write(array_open)
+                empty = False
+            out.write(piece)
+        out.write("[]" if empty else array_close)
+    out.write(object_close)
+    out.flush()
+
+
+def write_json_file(
+    path: Path,
+    sections: Mapping[str, Any],
+    *,
+    compact: bool = False,
+    buffer_size: int = JSON_WRITE_BUFFER_SIZE,
+    digests: DigestLog | None = None,
+) -> Path:
+    """Stream ``sections`` to ``path`` as UTF-8 JSON and return the path.
+
+    The file's digest is recorded in ``digests`` when given.
+    """
+
+    with open_digest_file(path, "w", digests, encoding="utf-8") as handle:
+        write_json_document(handle, sections, compact=compact, buffer_size=buffer_size)
+    return path
+
+
+__all__ = [
+    "ArrayElementEncoder",
+    "EncodedArray",
+    "JSON_WRITE_BUFFER_SIZE",
+    "write_json_document",
+    "write_json_file",
+]
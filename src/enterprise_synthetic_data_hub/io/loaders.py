@@ -0,0 +1,303 @@
+"""Load exported snapshots back into a :class:`SnapshotBundle` or pandas DataFrames.
+
+:func:`load_snapshot` reads the snapshot manifest to find, per entity, the
+cheapest artifact that holds it (CSV, JSON Lines shards, Parquet / Arrow,
+the binary snapshot, SQLite, and finally the combined JSON document) and
+parses only the requested entities and columns. Large CSVs are cut into
+byte ranges on line boundaries and, together with JSON Lines shards, parsed
+in a process pool. Generated values never contain line breaks, so every CSV
+row is exactly one line.
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import json
+import mmap
+import operator
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+from enterprise_synthetic_data_hub.generation.columnar import ENTITY_LAYOUTS
+from enterprise_synthetic_data_hub.generation.generator import SnapshotBundle
+from enterprise_synthetic_data_hub.io.sqlite_export import SQLITE_TABLE_MODELS
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
+
+LOAD_CHUNK_BYTES = 32 * 1024**2
+LOAD_ENTITIES: Sequence[str] = ("persons", "vehicles", "profiles")
+
+Rows = List[tuple]
+
+
+def _projector(columns: Sequence[str]) -> Callable[[Mapping], tuple]:
+    if len(columns) == 1:
+        column = columns[0]
+        return lambda row: (row[column],)
+    return operator.itemgetter(*columns)
+
+
+def _csv_converters(entity: str, columns: Sequence[str]) -> List[Callable[[str], object] | None]:
+    """Per-column converters that restore the generator's value types from CSV text."""
+
+    fields = SQLITE_TABLE_MODELS[entity].model_fields
+    converters: List[Callable[[str], object] | None] = []
+    for column in columns:
+        field = fields[column]
+        if field.annotation is int:
+            converters.append(int)
+        elif not field.is_required():
+            # csv.writer renders None as an empty field.
+            converters.append(lambda value: value or None)
+        else:
+            converters.append(None)
+    return converters
+
+
+def _parse_csv_range(
+    path: Path, start: int, end: int, entity: str, header: Sequence[str], columns: Sequence[str]
+) -> Rows:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        text = handle.read(end - start).decode("utf-8")
+    project = _projector([header.index(column) for column in columns])
+    rows = [project(row) for row in csv.reader(io.StringIO(text, newline=""))]
+    converters = _csv_converters(entity, columns)
+    if not any(converters):
+        return rows
+    convert = [(position, fn) for position, fn in enumerate(converters) if fn]
+    converted = []
+    for row in rows:
+        values = list(row)
+        for position, fn in convert:
+            values[position] = fn(values[position])
+        converted.append(tuple(values))
+    return converted
+
+
+def _csv_ranges(path: Path, chunk_bytes: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """Return the CSV header and ``(start, end)`` byte ranges ending on line boundaries."""
+
+    size = path.stat().st_size
+    ranges = []
+    with path.open("rb") as handle:
+        header = next(csv.reader([handle.readline().decode("utf-8")]))
+        start = handle.tell()
+        while start < size:
+            handle.seek(min(start + chunk_bytes, size))
+            handle.readline()
+            end = handle.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+
+def _parse_jsonl_file(path: Path, columns: Sequence[str]) -> Rows:
+    project = _projector(columns)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as handle:
+        return [project(json.loads(line)) for line in handle]
+
+
+def _read_arrow_file(path: Path, fmt: str, columns: Sequence[str]) -> Rows:
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError as exc:  # pragma: no cover - exercised without pyarrow
+        raise RuntimeError(
+            f"Loading {fmt} artifacts requires pyarrow; install enterprise-synthetic-data-hub[columnar]"
+        ) from exc
+
+    if fmt == "parquet":
+        table = pq.read_table(path, columns=list(columns))
+    else:
+        with ipc.open_file(path) as reader:
+            table = reader.read_all().select(list(columns))
+    values = []
+    for column in table.columns:
+        if pa.types.is_dictionary(column.type) or pa.types.is_date(column.type):
+            column = column.cast(pa.string())
+        values.append(column.to_pylist())
+    return list(zip(*values))
+
+
+def _read_binary_snapshot(path: Path, entity: str, columns: Sequence[str]) -> Rows:
+    from enterprise_synthetic_data_hub.io.binary_snapshot import BinarySnapshot
+
+    project = _projector(columns)
+    with BinarySnapshot(path) as snapshot:
+        return [project(row) for row in snapshot[entity]]
+
+
+def _read_sqlite(path: Path, entity: str, columns: Sequence[str]) -> Rows:
+    connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return connection.execute(f"SELECT {', '.join(columns)} FROM {entity} ORDER BY rowid").fetchall()
+    finally:
+        connection.close()
+
+
+def _read_json_section(path: Path, entity: str, columns: Sequence[str]) -> Rows:
+    """Decode only the ``entity`` list of a combined ``dataset_*.json`` document."""
+
+    project = _projector(columns)
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        # Top-level keys sit at two-space indentation (or follow a comma when
+        # compact); record keys are nested deeper, so the markers are unique.
+        for marker, indented in ((f'\n  "{entity}": ', True), (f',"{entity}":', False)):
+            start = view.find(marker.encode("utf-8"))
+            if start != -1:
+                start += len(marker)
+                end = view.find(b'\n  "', start) if indented else -1
+                text = view[start : end if end != -1 else len(view)].decode("utf-8")
+                section, _ = json.JSONDecoder().raw_decode(text)
+                return [project(row) for row in section]
+        return [project(row) for row in json.loads(view)[entity]]
+
+
+def _entity_source(files: Mapping[str, str], entity: str) -> Tuple[str, List[str]] | None:
+    if f"{entity}_csv" in files:
+        return "csv", [files[f"{entity}_csv"]]
+    shards = sorted(label for label in files if label.startswith(f"{entity}_jsonl_"))
+    if shards:
+        return "jsonl", [files[label] for label in shards]
+    for fmt in ("parquet", "arrow"):
+        if f"{entity}_{fmt}" in files:
+            return fmt, [files[f"{entity}_{fmt}"]]
+    for label, kind in (("binary_snapshot", "binary"), ("sqlite_db", "sqlite"), ("dataset_json", "json")):
+        if label in files:
+            return kind, [files[label]]
+    return None
+
+
+def _manifest_path(path: Path) -> Path:
+    if path.is_file():
+        return path
+    manifests = sorted(path.glob("snapshot_manifest_*.json"))
+    if len(manifests) != 1:
+        raise ValueError(f"expected exactly one snapshot manifest in {path}, found {len(manifests)}")
+    return manifests[0]
+
+
+def _resolve_columns(
+    entities: Sequence[str], columns: Mapping[str, Sequence[str]] | Sequence[str] | None
+) -> Dict[str, List[str]]:
+    resolved = {}
+    for entity in entities:
+        if columns is None:
+            selected = list(ENTITY_LAYOUTS[entity])
+        elif isinstance(columns, Mapping):
+            selected = list(columns.get(entity) or ENTITY_LAYOUTS[entity])
+        else:
+            selected = list(columns)
+        unknown = [column for column in selected if column not in ENTITY_LAYOUTS[entity]]
+        if unknown:
+            raise ValueError(f"Unknown {entity} columns: {', '.join(unknown)}")
+        if not selected:
+            raise ValueError(f"at least one {entity} column is required")
+        resolved[entity] = selected
+    return resolved
+
+
+def load_snapshot(
+    path: Path,
+    entities: Sequence[str] | None = None,
+    columns: Mapping[str, Sequence[str]] | Sequence[str] | None = None,
+    *,
+    as_frames: bool = False,
+    max_workers: int | None = None,
+    chunk_bytes: int = LOAD_CHUNK_BYTES,
+):
+    """Load an exported snapshot from its directory or manifest path.
+
+    ``entities`` defaults to every entity the snapshot contains; ``columns``
+    is either one column list applied to each requested entity or a mapping
+    of entity to columns. Returns a :class:`SnapshotBundle` (entities that
+    were not requested are empty lists) or, with ``as_frames=True``, a dict of
+    pandas DataFrames keyed by entity. CSV byte ranges of ``chunk_bytes`` and
+    JSON Lines shards are parsed in a process pool of ``max_workers`` once
+    they add up to more than one chunk.
+    """
+
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    manifest_path = _manifest_path(Path(path))
+    root = manifest_path.parent
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    files: Mapping[str, str] = manifest["files"]
+
+    sources = {entity: _entity_source(files, entity) for entity in LOAD_ENTITIES}
+    if entities is None:
+        entities = [entity for entity, source in sources.items() if source is not None]
+    for entity in entities:
+        if entity not in LOAD_ENTITIES:
+            raise ValueError(f"Unknown entity '{entity}'. Expected one of: {', '.join(LOAD_ENTITIES)}")
+        if sources[entity] is None:
+            raise ValueError(f"{manifest_path.name} lists no artifact containing {entity}")
+    selected = _resolve_columns(entities, columns)
+
+    # (entity, function, args); pooled tasks are parsed in worker processes.
+    pooled: List[tuple] = []
+    inline: List[tuple] = []
+    pooled_bytes = 0
+    for entity in entities:
+        kind, names = sources[entity]
+        paths = [root / name for name in names]
+        entity_columns = selected[entity]
+        if kind == "csv":
+            header, ranges = _csv_ranges(paths[0], chunk_bytes)
+            pooled.extend(
+                (entity, _parse_csv_range, (paths[0], start, end, entity, header, entity_columns))
+                for start, end in ranges
+            )
+            pooled_bytes += paths[0].stat().st_size
+        elif kind == "jsonl":
+            pooled.extend((entity, _parse_jsonl_file, (shard, entity_columns)) for shard in paths)
+            pooled_bytes += sum(shard.stat().st_size for shard in paths)
+        elif kind in ("parquet", "arrow"):
+            inline.append((entity, _read_arrow_file, (paths[0], kind, entity_columns)))
+        elif kind == "binary":
+            inline.append((entity, _read_binary_snapshot, (paths[0], entity, entity_columns)))
+        elif kind == "sqlite":
+            inline.append((entity, _read_sqlite, (paths[0], entity, entity_columns)))
+        else:
+            inline.append((entity, _read_json_section, (paths[0], entity, entity_columns)))
+
+    rows: Dict[str, Rows] = {entity: [] for entity in entities}
+    if len(pooled) > 1 and pooled_bytes > chunk_bytes and max_workers != 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(entity, executor.submit(fn, *args)) for entity, fn, args in pooled]
+            for entity, fn, args in inline:
+                rows[entity].extend(fn(*args))
+            for entity, future in futures:
+                rows[entity].extend(future.result())
+    else:
+        for entity, fn, args in [*pooled, *inline]:
+            rows[entity].extend(fn(*args))
+
+    if as_frames:
+        import pandas as pd
+
+        return {
+            entity: pd.DataFrame.from_records(rows[entity], columns=selected[entity])
+            for entity in entities
+        }
+
+    metadata = DatasetMetadata.model_validate_json(
+        (root / files["metadata_json"]).read_text(encoding="utf-8")
+    )
+    return SnapshotBundle(
+        metadata=metadata,
+        **{
+            entity: [dict(zip(selected[entity], row)) for row in rows[entity]] if entity in rows else []
+            for entity in LOAD_ENTITIES
+        },
+    )
+
+
+__all__ = ["LOAD_CHUNK_BYTES", "load_snapshot"]
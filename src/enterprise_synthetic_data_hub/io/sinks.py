@@ -0,0 +1,504 @@
+"""Single-pass export pipeline that fans generated chunks out to several sinks.
+
+Each sink owns its files and buffers, receives every chunk exactly once, and
+reports the files it produced with per-entity row counts when it closes, so
+one generation pass can produce CSV, JSON Lines, the JSON bundle, SQLite,
+Parquet/Arrow and the binary format side by side without re-reading anything
+from disk. The per-format exporters in :mod:`io.exporters` are single-sink
+runs of :func:`export_snapshot_sinks`.
+"""
+from __future__ import annotations
+
+import abc
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from enterprise_synthetic_data_hub.generation.columnar import ENTITY_LAYOUTS
+from enterprise_synthetic_data_hub.generation.generator import SnapshotBundle, SnapshotChunk
+from enterprise_synthetic_data_hub.io.artifacts import (
+    JSONL_ENTITIES,
+    JSONL_SHARD_SIZE,
+    PERSON_COLUMNS,
+    VEHICLE_COLUMNS,
+    CsvStreamWriter,
+    JsonlShardWriter,
+    artifact_paths,
+    snapshot_output_dir,
+    write_manifest,
+    write_metadata,
+    write_readme,
+)
+from enterprise_synthetic_data_hub.io.checksums import DigestLog
+from enterprise_synthetic_data_hub.io.json_stream import (
+    JSON_WRITE_BUFFER_SIZE,
+    ArrayElementEncoder,
+    EncodedArray,
+    write_json_file,
+)
+from enterprise_synthetic_data_hub.io.sqlite_export import SqliteSnapshotWriter
+from enterprise_synthetic_data_hub.models.dataset_metadata import DatasetMetadata
+
+logger = logging.getLogger(__name__)
+SnapshotPart = SnapshotChunk | SnapshotBundle
+
+
+@dataclass
+class SinkReport:
+    """Files written by one sink, the rows it received per entity, and its manifest fields.
+
+    ``digests`` holds the checksums recorded while the files were written.
+    """
+
+    files: Dict[str, Path] = field(default_factory=dict)
+    rows: Dict[str, int] = field(default_factory=dict)
+    extra: Dict[str, Any] = field(default_factory=dict)
+    digests: DigestLog = field(default_factory=DigestLog)
+
+    def manifest_entry(self) -> dict:
+        file_bytes = {label: path.stat().st_size for label, path in self.files.items()}
+        return {
+            **self.extra,
+            "rows": self.rows,
+            "bytes": sum(file_bytes.values()),
+            "files": {
+                label: {"file": path.name, "bytes": file_bytes[label]}
+                for label, path in self.files.items()
+            },
+        }
+
+
+class SnapshotSink(abc.ABC):
+    """Base class: ``open`` once, ``write_chunk`` per chunk, then ``close`` or ``abort``."""
+
+    name = "sink"
+    # Entities whose rows end up in the sink's files.
+    entities: Sequence[str] = JSONL_ENTITIES
+
+    @abc.abstractmethod
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        """Create the sink's files in ``output_dir``."""
+
+    @abc.abstractmethod
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        """Write every row of ``chunk``."""
+
+    @abc.abstractmethod
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        """Flush and close every file; ``metadata`` carries the final record counts."""
+
+    @abc.abstractmethod
+    def abort(self) -> None:
+        """Close every file without finishing it and delete what was written.
+
+        Called after a failed ``open``, ``write_chunk`` or ``close``, so it must
+        cope with a partially opened sink.
+        """
+
+
+class CsvSink(SnapshotSink):
+    """Governed persons/vehicles CSVs, byte-identical to :func:`export_snapshot_bundle`."""
+
+    name = "csv"
+    entities = ("persons", "vehicles")
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        paths = artifact_paths(output_dir, metadata.dataset_version)
+        self._digests = DigestLog()
+        self._writers: Dict[str, CsvStreamWriter] = {}
+        self._writers["persons"] = CsvStreamWriter(paths["persons_csv"], PERSON_COLUMNS, self._digests)
+        self._writers["vehicles"] = CsvStreamWriter(paths["vehicles_csv"], VEHICLE_COLUMNS, self._digests)
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        for entity, writer in self._writers.items():
+            writer.write_rows(getattr(chunk, entity))
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        for writer in self._writers.values():
+            writer.close()
+        return SinkReport(
+            files={f"{entity}_csv": writer.path for entity, writer in self._writers.items()},
+            rows={entity: writer.rows_written for entity, writer in self._writers.items()},
+            digests=self._digests,
+        )
+
+    def abort(self) -> None:
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            finally:
+                writer.path.unlink(missing_ok=True)
+
+
+class JsonlSink(SnapshotSink):
+    """Sharded JSON Lines per entity, matching :func:`export_snapshot_jsonl`."""
+
+    name = "jsonl"
+
+    def __init__(self, shard_size: int = JSONL_SHARD_SIZE, compress: bool = False):
+        if shard_size <= 0:
+            raise ValueError("shard_size must be positive")
+        self.shard_size = shard_size
+        self.compress = compress
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        version_slug = metadata.dataset_version.replace(".", "_")
+        self._digests = DigestLog()
+        self._writers = {
+            entity: JsonlShardWriter(
+                output_dir, f"{entity}_{version_slug}", self.shard_size, self.compress, self._digests
+            )
+            for entity in JSONL_ENTITIES
+        }
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        for entity, writer in self._writers.items():
+            writer.write_rows(getattr(chunk, entity))
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        for writer in self._writers.values():
+            writer.close()
+        return SinkReport(
+            files={
+                f"{entity}_jsonl_{index:05d}": path
+                for entity, writer in self._writers.items()
+                for index, path in enumerate(writer.paths)
+            },
+            rows={entity: writer.rows_written for entity, writer in self._writers.items()},
+            extra={
+                "format": "jsonl",
+                "compression": "gzip" if self.compress else None,
+                "shards": {entity: writer.shards() for entity, writer in self._writers.items()},
+            },
+            digests=self._digests,
+        )
+
+    def abort(self) -> None:
+        for writer in self._writers.values():
+            try:
+                writer.close()
+            finally:
+                for path in writer.paths:
+                    path.unlink(missing_ok=True)
+
+
+class JsonBundleSink(SnapshotSink):
+    """The combined ``dataset_*.json`` document, as written by ``write_snapshot_bundle``.
+
+    The metadata section leads the document but its record counts are only
+    known at the end, so each entity's array elements are rendered into a
+    spool file next to the output and copied verbatim into the final document
+    on close.
+    """
+
+    name = "json"
+
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        self._path = artifact_paths(output_dir, metadata.dataset_version)["dataset_json"]
+        self._digests = DigestLog()
+        self._elements = ArrayElementEncoder(self.compact)
+        self._spools = {
+            entity: output_dir / f".{self._path.stem}.{entity}.spool" for entity in JSONL_ENTITIES
+        }
+        self._handles = {}
+        for entity, path in self._spools.items():
+            self._handles[entity] = path.open("w", encoding="utf-8")
+        self._rows = dict.fromkeys(JSONL_ENTITIES, 0)
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        encode, separator = self._elements.encode, self._elements.separator
+        for entity, handle in self._handles.items():
+            rows = getattr(chunk, entity)
+            if not rows:
+                continue
+            if self._rows[entity]:
+                handle.write(separator)
+            handle.write(separator.join(map(encode, rows)))
+            self._rows[entity] += len(rows)
+
+    def _replay(self, entity: str) -> Iterator[str]:
+        with self._spools[entity].open(encoding="utf-8") as handle:
+            yield from iter(lambda: handle.read(JSON_WRITE_BUFFER_SIZE), "")
+
+    def _close_spools(self) -> None:
+        try:
+            for handle in self._handles.values():
+                handle.close()
+        finally:
+            for spool in self._spools.values():
+                spool.unlink(missing_ok=True)
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        for handle in self._handles.values():
+            handle.close()
+        try:
+            write_json_file(
+                self._path,
+                {
+                    "metadata": metadata.model_dump(mode="json"),
+                    **{entity: EncodedArray(self._replay(entity)) for entity in JSONL_ENTITIES},
+                },
+                compact=self.compact,
+                digests=self._digests,
+            )
+        finally:
+            self._close_spools()
+        return SinkReport(
+            files={"dataset_json": self._path}, rows=dict(self._rows), digests=self._digests
+        )
+
+    def abort(self) -> None:
+        try:
+            self._close_spools()
+        finally:
+            self._path.unlink(missing_ok=True)
+
+
+class SqliteSink(SnapshotSink):
+    """Indexed SQLite database with a table per entity (see :mod:`io.sqlite_export`)."""
+
+    name = "sqlite"
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        self._writer: SqliteSnapshotWriter | None = None
+        paths = artifact_paths(output_dir, metadata.dataset_version)
+        self._writer = SqliteSnapshotWriter(paths["sqlite_db"])
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        for entity in self._writer.rows_written:
+            self._writer.write_rows(entity, getattr(chunk, entity))
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        self._writer.close()
+        return SinkReport(
+            files={"sqlite_db": self._writer.path},
+            rows=dict(self._writer.rows_written),
+            extra={"format": "sqlite"},
+        )
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.abort()
+
+
+class ArrowSink(SnapshotSink):
+    """Typed Parquet or Arrow IPC files per entity (requires ``pyarrow``).
+
+    ``date_of_birth`` is stored as ``date32``, ``model_year`` as ``int32`` and
+    categorical fields as dictionary-encoded strings. Rows are buffered into
+    row groups of ``row_group_size`` (default 100k).
+    """
+
+    def __init__(self, fmt: str = "parquet", row_group_size: int | None = None):
+        try:
+            from enterprise_synthetic_data_hub.io import arrow_tables
+        except ImportError as exc:  # pragma: no cover - depends on the environment
+            raise RuntimeError(
+                "Parquet/Arrow export requires pyarrow. "
+                "Install it with `pip install enterprise-synthetic-data-hub[columnar]`."
+            ) from exc
+        if fmt not in arrow_tables.ARROW_FORMATS:
+            raise ValueError(
+                f"Unknown columnar format '{fmt}'. Expected one of: {', '.join(arrow_tables.ARROW_FORMATS)}"
+            )
+        self.name = fmt
+        self.fmt = fmt
+        self.row_group_size = row_group_size or arrow_tables.DEFAULT_ROW_GROUP_SIZE
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        from enterprise_synthetic_data_hub.io.arrow_tables import ArrowEntityWriter
+
+        version_slug = metadata.dataset_version.replace(".", "_")
+        self._digests = DigestLog()
+        self._writers = {}
+        for entity, layout in ENTITY_LAYOUTS.items():
+            self._writers[entity] = ArrowEntityWriter(
+                output_dir / f"{entity}_{version_slug}.{self.fmt}",
+                layout,
+                self.fmt,
+                self.row_group_size,
+                self._digests,
+            )
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        for entity, writer in self._writers.items():
+            writer.write_rows(getattr(chunk, entity))
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        for writer in self._writers.values():
+            writer.close()
+        return SinkReport(
+            files={f"{entity}_{self.fmt}": writer.path for entity, writer in self._writers.items()},
+            rows={entity: writer.rows_written for entity, writer in self._writers.items()},
+            extra={"format": self.fmt, "row_group_size": self.row_group_size},
+            digests=self._digests,
+        )
+
+    def abort(self) -> None:
+        for writer in self._writers.values():
+            writer.abort()
+
+
+class BinarySink(SnapshotSink):
+    """The fixed-width ``snapshot_<version>.esdb`` file (see :mod:`io.binary_snapshot`).
+
+    String widths and category dictionaries are only known once every row has
+    been seen, so chunks are accumulated in columnar form and the file is
+    written on close.
+    """
+
+    name = "binary"
+
+    def open(self, output_dir: Path, metadata: DatasetMetadata) -> None:
+        from enterprise_synthetic_data_hub.generation.columnar import ColumnarSnapshotBundle
+
+        self._path = artifact_paths(output_dir, metadata.dataset_version)["binary_snapshot"]
+        self._columnar = ColumnarSnapshotBundle.empty(metadata)
+
+    def write_chunk(self, chunk: SnapshotPart) -> None:
+        self._columnar.append_chunk(chunk)
+
+    def close(self, metadata: DatasetMetadata) -> SinkReport:
+        from enterprise_synthetic_data_hub.io.binary_snapshot import write_binary_snapshot
+
+        columnar, self._columnar = self._columnar, None
+        columnar.metadata = metadata
+        digests = DigestLog()
+        write_binary_snapshot(columnar, self._path, digests)
+        return SinkReport(
+            files={"binary_snapshot": self._path},
+            rows={entity: len(getattr(columnar, entity)) for entity in JSONL_ENTITIES},
+            extra={"format": "binary"},
+            digests=digests,
+        )
+
+    def abort(self) -> None:
+        self._columnar = None
+        self._path.unlink(missing_ok=True)
+
+
+SINK_TYPES: Mapping[str, type] = {
+    "csv": CsvSink,
+    "jsonl": JsonlSink,
+    "json": JsonBundleSink,
+    "sqlite": SqliteSink,
+    "parquet": ArrowSink,
+    "arrow": ArrowSink,
+    "binary": BinarySink,
+}
+
+
+def build_sink(name: str, **options) -> SnapshotSink:
+    """Instantiate a registered sink by name, e.g. ``build_sink("jsonl", compress=True)``."""
+
+    if name not in SINK_TYPES:
+        raise ValueError(f"Unknown sink '{name}'. Expected one of: {', '.join(SINK_TYPES)}")
+    if name in ("parquet", "arrow"):
+        options = {"fmt": name, **options}
+    return SINK_TYPES[name](**options)
+
+
+def _discard_failed_export(
+    started: Sequence[SnapshotSink], reports: Mapping[str, SinkReport], paths: Iterable[Path]
+) -> None:
+    """Abort unfinished sinks and delete every file a failed export produced."""
+
+    for sink in started:
+        try:
+            if sink.name in reports:
+                for path in reports[sink.name].files.values():
+                    path.unlink(missing_ok=True)
+            else:
+                sink.abort()
+        except Exception:
+            logger.exception("Could not clean up the %s sink after a failed export", sink.name)
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            logger.exception("Could not remove %s after a failed export", path)
+
+
+def export_snapshot_sinks(
+    chunks: Iterable[SnapshotPart],
+    metadata: DatasetMetadata,
+    sinks: Sequence[SnapshotSink],
+    output_dir: Path | None = None,
+) -> dict:
+    """Generate once and tee every chunk into each sink.
+
+    The metadata JSON, manifest and README are written once every chunk has
+    been consumed. Record counts cover only entities some sink writes, so
+    profiles generated for a CSV-only export are reported as 0. The manifest's ``sinks`` section records, per sink, the rows it
+    received and the byte size of every file it produced; with a single sink
+    its format fields (``format``, ``shards``, ...) are also repeated at the
+    top level. If anything fails, every sink is aborted and the files already
+    written are removed before the error propagates.
+    """
+
+    if not sinks:
+        raise ValueError("at least one sink is required")
+    names = [sink.name for sink in sinks]
+    if len(set(names)) != len(names):
+        raise ValueError("sinks must have distinct names")
+    output_dir = snapshot_output_dir(output_dir, metadata.dataset_version)
+    paths = artifact_paths(output_dir, metadata.dataset_version)
+
+    started: List[SnapshotSink] = []
+    reports: Dict[str, SinkReport] = {}
+    digests = DigestLog()
+    record_counts = {"persons": 0, "vehicles": 0, "profiles": 0}
+    exported = [entity for entity in record_counts if any(entity in sink.entities for sink in sinks)]
+    try:
+        for sink in sinks:
+            started.append(sink)
+            sink.open(output_dir, metadata)
+        for chunk in chunks:
+            for sink in sinks:
+                sink.write_chunk(chunk)
+            for entity in exported:
+                record_counts[entity] += len(getattr(chunk, entity))
+
+        final_metadata = write_metadata(paths["metadata_json"], metadata, record_counts, digests)
+        for sink in sinks:
+            reports[sink.name] = sink.close(final_metadata)
+
+        files: Dict[str, Path] = {}
+        for report in reports.values():
+            files.update(report.files)
+            digests.update(report.digests)
+        files["metadata_json"] = paths["metadata_json"]
+        extra: Dict[str, Any] = {}
+        if len(reports) == 1:
+            extra.update(next(iter(reports.values())).extra)
+        extra["sinks"] = {name: report.manifest_entry() for name, report in reports.items()}
+        write_manifest(paths["manifest_json"], final_metadata, record_counts, files, extra, digests)
+        write_readme(
+            paths["readme"], metadata.dataset_version, {**files, "manifest_json": paths["manifest_json"]}
+        )
+    except BaseException:
+        _discard_failed_export(
+            started, reports, (paths["metadata_json"], paths["manifest_json"], paths["readme"])
+        )
+        raise
+
+    return {**files, "manifest_json": paths["manifest_json"], "readme": paths["readme"]}
+
+
+__all__ = [
+    "ArrowSink",
+    "BinarySink",
+    "CsvSink",
+    "JsonBundleSink",
+    "JsonlSink",
+    "SINK_TYPES",
+    "SinkReport",
+    "SnapshotSink",
+    "SqliteSink",
+    "build_sink",
+    "export_snapshot_sinks",
+]
@@ -0,0 +1,219 @@
+"""Content-addressed cache of exported snapshot artifacts.
+
+Snapshot output is fully determined by the generation parameters (dataset
+version, seed, record count, profile flag, engine, export layout) and by the
+generator code itself, so identical requests can reuse earlier artifacts.
+Entries live under ``<root>/<key>/`` and are linked into the requested output
+directory with hard links (falling back to copies across filesystems).
+Cached files are made read-only so an in-place write through a hard link
+fails instead of silently corrupting the entry. The cache directory is kept
+under ``max_bytes`` by evicting the least recently used entries.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import sys
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+DEFAULT_CACHE_DIR = Path("data") / "cache" / "snapshots"
+DEFAULT_CACHE_MAX_BYTES = 2 * 1024**3
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+# Code that can change artifact bytes; the CLI and API layers cannot.
+_VERSIONED_PACKAGES = ("config", "generation", "io", "models")
+_ENTRY_INDEX = "cache_entry.json"
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def generator_code_version() -> str:
+    """Digest of the source files that determine snapshot contents."""
+
+    digest = hashlib.sha256()
+    for package in _VERSIONED_PACKAGES:
+        for path in sorted((_PACKAGE_ROOT / package).rglob("*.py")):
+            digest.update(path.relative_to(_PACKAGE_ROOT).as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def snapshot_cache_key(
+    *,
+    dataset_version: str,
+    seed: int,
+    records: int,
+    include_profiles: bool = True,
+    engine: str = "sequential",
+    export_options: Mapping[str, Any] | None = None,
+) -> str:
+    """Return the cache key for one set of generation + export parameters."""
+
+    payload = {
+        "code_version": generator_code_version(),
+        "dataset_version": dataset_version,
+        "seed": seed,
+        "records": records,
+        "include_profiles": include_profiles,
+        "engine": engine,
+        "export_options": dict(export_options or {}),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _retry_writable(function, path, _error) -> None:
+    # Windows refuses to delete read-only files; clear the bit and try once more.
+    os.chmod(path, stat.S_IMODE(os.lstat(path).st_mode) | stat.S_IWUSR)
+    function(path)
+
+
+def remove_tree(path: Path) -> bool:
+    """Delete ``path`` recursively, including read-only files; return True once it is gone.
+
+    Clearing the read-only bit on a hard link also clears it on the cache
+    entry it points to; :meth:`SnapshotCache.materialize` restores it.
+    """
+
+    handler = {"onexc": _retry_writable} if sys.version_info >= (3, 12) else {"onerror": _retry_writable}
+    try:
+        shutil.rmtree(path, **handler)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.warning("Could not remove %s", path, exc_info=True)
+    return not os.path.lexists(path)
+
+
+class SnapshotCache:
+    """Directory of cached snapshot exports keyed by :func:`snapshot_cache_key`."""
+
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def materialize(self, key: str, output_dir: Path) -> Dict[str, Path] | None:
+        """Link a cached entry into ``output_dir``; return its artifacts or None on a miss."""
+
+        entry = self._entry_dir(key)
+        try:
+            files = json.loads((entry / _ENTRY_INDEX).read_text(encoding="utf-8"))["files"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if not all((entry / name).is_file() for name in files.values()):
+            return None
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        artifacts = {}
+        for label, name in files.items():
+            # Removing a linked copy on Windows clears the bit on the entry too.
+            (entry / name).chmod(_READ_ONLY)
+            _link_or_copy(entry / name, output_dir / name)
+            artifacts[label] = output_dir / name
+        os.utime(entry)  # mark as most recently used
+        return artifacts
+
+    def store(self, key: str, artifacts: Mapping[str, Path]) -> Path:
+        """Copy exported ``artifacts`` into the cache and evict down to ``max_bytes``."""
+
+        entry = self._entry_dir(key)
+        if entry.is_dir():
+            os.utime(entry)
+            return entry
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".tmp-{uuid.uuid4().hex}"
+        staging.mkdir()
+        try:
+            for path in artifacts.values():
+                target = staging / Path(path).name
+                shutil.copyfile(path, target)
+                target.chmod(_READ_ONLY)
+            index = {"files": {label: Path(path).name for label, path in artifacts.items()}}
+            (staging / _ENTRY_INDEX).write_text(json.dumps(index, indent=2), encoding="utf-8")
+            os.replace(staging, entry)
+        except OSError:
+            # Another process stored the same key first; its entry is equivalent.
+            remove_tree(staging)
+            if not entry.is_dir():
+                raise
+        self.evict()
+        return entry
+
+    @staticmethod
+    def detach(output_dir: Path) -> list[Path]:
+        """Unlink read-only hard links (materialized entries) from ``output_dir``.
+
+        Call before exporting into a directory that may hold cached artifacts so
+        the new files are created fresh instead of written through the links.
+        """
+
+        output_dir = Path(output_dir)
+        if not output_dir.is_dir():
+            return []
+        detached = []
+        for path in output_dir.iterdir():
+            info = path.lstat()
+            if stat.S_ISREG(info.st_mode) and info.st_nlink > 1 and not info.st_mode & stat.S_IWUSR:
+                path.unlink()
+                detached.append(path)
+        return detached
+
+    def entries(self) -> Dict[Path, int]:
+        """Return ``{entry_dir: size_in_bytes}`` for every complete entry."""
+
+        if not self.root.is_dir():
+            return {}
+        return {
+            entry: sum(path.stat().st_size for path in entry.iterdir() if path.is_file())
+            for entry in self.root.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        }
+
+    def evict(self) -> list[Path]:
+        """Remove least recently used entries until the cache fits ``max_bytes``.
+
+        An entry that cannot be deleted still counts towards the total, so the
+        next older one is tried instead.
+        """
+
+        sizes = self.entries()
+        total = sum(sizes.values())
+        removed = []
+        for entry in sorted(sizes, key=lambda path: path.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            if remove_tree(entry):
+                total -= sizes[entry]
+                removed.append(entry)
+        return removed
+
+
+__all__ = [
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_CACHE_MAX_BYTES",
+    "SnapshotCache",
+    "generator_code_version",
+    "remove_tree",
+    "snapshot_cache_key",
+]
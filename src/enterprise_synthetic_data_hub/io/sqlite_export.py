@@ -0,0 +1,196 @@
+"""Bulk loader that writes snapshot entities into an indexed SQLite database.
+
+Tables mirror the Pydantic models in :mod:`models` (column order, NOT NULL
+for required fields, ``INTEGER`` for integer fields, ISO ``TEXT`` for dates).
+Rows are inserted with ``executemany`` inside large transactions while every
+index is absent and foreign-key checks are off; unique keys, query indexes
+and one orphan-row check per foreign key run once after the load, which is
+far cheaper than maintaining B-trees row by row. The finished database uses WAL
+journaling so QA readers do not block each other or a later writer.
+"""
+from __future__ import annotations
+
+import operator
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from enterprise_synthetic_data_hub.models.person import Person
+from enterprise_synthetic_data_hub.models.profile import Profile
+from enterprise_synthetic_data_hub.models.vehicle import Vehicle
+
+SQLITE_TRANSACTION_ROWS = 250_000
+SQLITE_TABLE_MODELS: Mapping[str, Type[BaseModel]] = {
+    "persons": Person,
+    "vehicles": Vehicle,
+    "profiles": Profile,
+}
+SQLITE_PRIMARY_KEYS: Mapping[str, str] = {
+    "persons": "person_id",
+    "vehicles": "vehicle_id",
+    "profiles": "profile_id",
+}
+SQLITE_FOREIGN_KEYS: Mapping[str, Sequence[Tuple[str, str]]] = {
+    "persons": (),
+    "vehicles": (("person_id", "persons"),),
+    "profiles": (("person_id", "persons"), ("vehicle_id", "vehicles")),
+}
+SQLITE_QUERY_INDEXES: Mapping[str, Sequence[str]] = {
+    "persons": ("state", "lob_type"),
+    "vehicles": ("person_id", "vin", "lob_type"),
+    "profiles": ("person_id", "vehicle_id"),
+}
+
+
+def _column_definition(name: str, field) -> str:
+    sql_type = "INTEGER" if field.annotation is int else "TEXT"
+    return f"{name} {sql_type}{' NOT NULL' if field.is_required() else ''}"
+
+
+def table_ddl(entity: str) -> str:
+    """Return the ``CREATE TABLE`` statement for ``entity``."""
+
+    fields = SQLITE_TABLE_MODELS[entity].model_fields
+    clauses = [_column_definition(name, field) for name, field in fields.items()]
+    clauses.extend(
+        f"FOREIGN KEY ({column}) REFERENCES {parent}({SQLITE_PRIMARY_KEYS[parent]})"
+        for column, parent in SQLITE_FOREIGN_KEYS[entity]
+    )
+    return f"CREATE TABLE {entity} (\n    " + ",\n    ".join(clauses) + "\n)"
+
+
+def index_ddl(entity: str) -> list[str]:
+    """Return the unique-key and query index statements run after the load."""
+
+    key = SQLITE_PRIMARY_KEYS[entity]
+    statements = [f"CREATE UNIQUE INDEX {entity}_{key}_key ON {entity}({key})"]
+    statements.extend(
+        f"CREATE INDEX {entity}_{column}_idx ON {entity}({column})"
+        for column in SQLITE_QUERY_INDEXES[entity]
+    )
+    return statements
+
+
+def orphan_query(entity: str, column: str, parent: str) -> str:
+    """Return a query for the rowids of ``entity`` rows whose ``column`` has no parent row.
+
+    It walks the child's ``column`` index and probes the parent key in sorted
+    order, which is several times faster than ``PRAGMA foreign_key_check``'s
+    row-order probes on multi-million-row tables.
+    """
+
+    return (
+        f"SELECT rowid FROM {entity} WHERE {column} NOT IN "
+        f"(SELECT {SQLITE_PRIMARY_KEYS[parent]} FROM {parent})"
+    )
+
+
+class SqliteSnapshotWriter:
+    """Create a fresh snapshot database and bulk load rows into it."""
+
+    def __init__(self, path: Path, transaction_rows: int = SQLITE_TRANSACTION_ROWS):
+        if transaction_rows <= 0:
+            raise ValueError("transaction_rows must be positive")
+        self.path = Path(path)
+        for stale in (self.path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")):
+            stale.unlink(missing_ok=True)
+        self._transaction_rows = transaction_rows
+        self._pending_rows = 0
+        self._connection = sqlite3.connect(self.path, isolation_level=None)
+        execute = self._connection.execute
+        # The file is rebuilt from scratch on failure, so the load skips the
+        # rollback journal and fsyncs; WAL is switched on once the data is in.
+        execute("PRAGMA journal_mode=OFF")
+        execute("PRAGMA synchronous=OFF")
+        execute("PRAGMA foreign_keys=OFF")
+        execute("PRAGMA temp_store=MEMORY")
+        execute("PRAGMA cache_size=-262144")
+        # Lets the post-load CREATE INDEX sorts use helper threads.
+        execute(f"PRAGMA threads={min(os.cpu_count() or 1, 8)}")
+        self._inserts: Dict[str, str] = {}
+        self._projections: Dict[str, operator.itemgetter] = {}
+        for entity, model in SQLITE_TABLE_MODELS.items():
+            columns = tuple(model.model_fields)
+            execute(table_ddl(entity))
+            self._inserts[entity] = (
+                f"INSERT INTO {entity} ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})"
+            )
+            self._projections[entity] = operator.itemgetter(*columns)
+        self.rows_written: Dict[str, int] = dict.fromkeys(SQLITE_TABLE_MODELS, 0)
+        execute("BEGIN")
+
+    def write_rows(self, entity: str, rows: Iterable[dict]) -> None:
+        cursor = self._connection.executemany(
+            self._inserts[entity], map(self._projections[entity], rows)
+        )
+        self.rows_written[entity] += cursor.rowcount
+        self._pending_rows += cursor.rowcount
+        if self._pending_rows >= self._transaction_rows:
+            self._connection.execute("COMMIT")
+            self._connection.execute("BEGIN")
+            self._pending_rows = 0
+
+    def close(self) -> None:
+        """Commit, build indexes, check for orphan rows, and switch the database to WAL."""
+
+        connection = self._connection
+        try:
+            if connection.in_transaction:
+                connection.execute("COMMIT")
+            connection.execute("BEGIN")
+            for entity in SQLITE_TABLE_MODELS:
+                for statement in index_ddl(entity):
+                    connection.execute(statement)
+            connection.execute("COMMIT")
+            violations = [
+                (entity, rowid, parent)
+                for entity, foreign_keys in SQLITE_FOREIGN_KEYS.items()
+                for column, parent in foreign_keys
+                for (rowid,) in connection.execute(orphan_query(entity, column, parent))
+            ]
+            if violations:
+                table, rowid, parent = violations[0]
+                raise ValueError(
+                    f"{len(violations)} foreign key violations, e.g. {table} row {rowid} -> {parent}"
+                )
+            # Sampled statistics are enough for the planner to pick these indexes.
+            connection.execute("PRAGMA analysis_limit=1000")
+            connection.execute("ANALYZE")
+            connection.execute("PRAGMA journal_mode=WAL")
+        finally:
+            connection.close()
+
+    def abort(self) -> None:
+        """Close the connection without building indexes and delete the database."""
+
+        try:
+            self._connection.close()
+        finally:
+            for path in (self.path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")):
+                path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "SqliteSnapshotWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if exc_info[0] is None:
+            self.close()
+        else:
+            self._connection.close()
+
+
+__all__ = [
+    "SQLITE_FOREIGN_KEYS",
+    "SQLITE_PRIMARY_KEYS",
+    "SQLITE_QUERY_INDEXES",
+    "SQLITE_TABLE_MODELS",
+    "SQLITE_TRANSACTION_ROWS",
+    "SqliteSnapshotWriter",
+    "index_ddl",
+    "orphan_query",
+    "table_ddl",
+]
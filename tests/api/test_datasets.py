@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from enterprise_synthetic_data_hub.api.app import create_app
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+
+
+@pytest.fixture()
+def client():
+    app = create_app()
+    app.testing = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.mark.parametrize("entity", ["persons", "vehicles", "profiles"])
+def test_pages_concatenate_to_counter_bundle(client, entity):
+    expected = getattr(generate_snapshot_bundle(num_records=11, seed=42, engine="counter"), entity)
+    collected, offsets = [], []
+    response = client.get(f"/datasets/42/{entity}?records=11&limit=4")
+    while True:
+        assert response.status_code == 200, response.data
+        payload = response.get_json()
+        offsets.append(payload["offset"])
+        collected.extend(payload[entity])
+        assert payload["metadata"]["record_count_persons"] == 11
+        if payload["next_cursor"] is None:
+            break
+        response = client.get(f"/datasets/42/{entity}?cursor={payload['next_cursor']}&limit=4")
+
+    assert offsets == [0, 4, 8]
+    assert collected == expected
+
+
+def test_dataset_cursor_is_bound_to_seed_and_entity(client):
+    cursor = client.get("/datasets/7/persons?records=5&limit=2").get_json()["next_cursor"]
+
+    assert client.get(f"/datasets/7/vehicles?cursor={cursor}").status_code == 400
+    assert client.get(f"/datasets/8/persons?cursor={cursor}").status_code == 400
+    assert client.get("/datasets/7/persons?cursor=not-a-cursor").status_code == 400
+
+
+def test_dataset_page_validates_arguments(client):
+    assert client.get("/datasets/7/claims").status_code == 404
+    assert client.get("/datasets/7/persons?limit=0").status_code == 400
+    assert client.get("/datasets/7/persons?limit=10001").status_code == 400
+    assert client.get("/datasets/7/persons?records=-3").status_code == 400
+    far = client.get("/datasets/7/persons?records=10000000&limit=1").get_json()
+    assert far["next_cursor"] is not None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+from enterprise_synthetic_data_hub.api.app import create_app
+from enterprise_synthetic_data_hub.api.cache import ResponseCache
+
+
+@pytest.fixture()
+def app():
+    app = create_app()
+    app.testing = True
+    return app
+
+
+def test_repeated_request_is_served_from_cache_with_etag(app, monkeypatch):
+    client = app.test_client()
+    first = client.post("/generate/person", json={"records": 4, "seed": 77})
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('"')
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached response should not regenerate")
+
+    # Seeded requests are built by the prefix cache; either path regenerating means a miss.
+    monkeypatch.setattr(app.extensions["prefix_cache"], "bundle", fail)
+    monkeypatch.setattr("enterprise_synthetic_data_hub.generation.prefix_cache._generate_rows", fail)
+    second = client.post("/generate/person", json={"records": 4, "seed": 77})
+    assert second.data == first.data
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert app.extensions["response_cache"].stats()["persons"][0] == 1
+
+
+def test_if_none_match_returns_not_modified(app):
+    client = app.test_client()
+    etag = client.post("/generate/bundle", json={"records": 2}).headers["ETag"]
+
+    response = client.post("/generate/bundle", json={"records": 2}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+    other = client.post("/generate/vehicle", json={"records": 2}, headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_randomized_requests_bypass_cache(app):
+    client = app.test_client()
+    response = client.post("/generate/person", json={"records": 2, "randomize": True})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+    assert app.extensions["response_cache"].stats() == {}
+
+
+def test_response_cache_evicts_least_recently_used_per_entity():
+    cache = ResponseCache(max_bytes_per_entity=10)
+    cache.put("persons", 1, b"aaaa")
+    cache.put("persons", 2, b"bbbb")
+    cache.put("vehicles", 1, b"cccccccc")
+    assert cache.get("persons", 1) is not None
+    cache.put("persons", 3, b"dddd")
+
+    assert cache.get("persons", 2) is None
+    assert cache.get("persons", 1).body == b"aaaa"
+    assert cache.get("vehicles", 1).body == b"cccccccc"
+    assert cache.put("persons", 4, b"x" * 11).etag
+    assert cache.get("persons", 4) is None
+    assert cache.stats()["persons"] == (2, 8)
+
+
+def test_smaller_requests_reuse_the_cached_prefix(app):
+    client = app.test_client()
+    large = client.post("/generate/bundle", json={"records": 9, "seed": 5}).get_json()
+    small = client.post("/generate/person", json={"records": 3, "seed": 5}).get_json()
+
+    assert small["persons"] == large["persons"][:3]
+    assert app.extensions["prefix_cache"].cached_records(5) == 9
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from enterprise_synthetic_data_hub.api import app as app_module
+from enterprise_synthetic_data_hub.api.app import create_app
+
+
+@pytest.fixture()
+def client():
+    app = create_app()
+    app.testing = True
+    with app.test_client() as client:
+        yield client
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.data.decode("utf-8").splitlines()]
+
+
+def test_bundle_stream_matches_buffered_response(client):
+    streamed = client.post("/generate/bundle?stream=1", json={"records": 4, "seed": 12})
+    buffered = client.post("/generate/bundle", json={"records": 4, "seed": 12}).get_json()
+
+    assert streamed.mimetype == "application/x-ndjson"
+    header, *rows = _lines(streamed)
+    assert header["metadata"] == buffered["metadata"]
+    assert header["seed"] == 12 and header["records_requested"] == 4
+    for entity in ("persons", "vehicles", "profiles"):
+        assert [line["record"] for line in rows if line["entity"] == entity] == buffered[entity]
+
+
+def test_accept_header_selects_ndjson_for_single_entity(client):
+    response = client.post(
+        "/generate/person", json={"records": 3}, headers={"Accept": "application/x-ndjson"}
+    )
+    header, *rows = _lines(response)
+    assert header["entities"] == ["persons"]
+    assert [line["entity"] for line in rows] == ["persons"] * 3
+    assert "ETag" not in response.headers
+
+    default = client.post("/generate/person", json={"records": 3}, headers={"Accept": "*/*"})
+    assert default.mimetype == "application/json"
+
+
+def test_stream_generates_chunks_lazily(client, monkeypatch):
+    monkeypatch.setattr(app_module, "STREAM_CHUNK_SIZE", 2)
+    generated = []
+    original = app_module.iter_snapshot_records
+
+    def tracking(**kwargs):
+        for chunk in original(**kwargs):
+            generated.append(chunk.start)
+            yield chunk
+
+    monkeypatch.setattr(app_module, "iter_snapshot_records", tracking)
+    response = client.post("/generate/vehicle?stream=1", json={"records": 10}, buffered=False)
+    body = iter(response.response)
+    assert json.loads(next(body))["records_requested"] == 10
+    assert generated == []
+    next(body)
+    assert generated == [0]
+    response.close()
@@ -21,3 +21,14 @@ def test_demo_cli_generator_preview_runs():
     assert exit_code == 0
     output = console.file.getvalue()
     assert "Generator preview" in output
+
+
+def test_demo_cli_counter_preview_reports_full_record_count():
+    console = Console(file=StringIO(), force_terminal=False, color_system=None)
+    exit_code = demo_cli.run_demo(
+        ["--records", "5000000", "--preview", "1", "--engine", "counter", "--seed", "4"],
+        console=console,
+    )
+    assert exit_code == 0
+    output = console.file.getvalue()
+    assert '"record_count_persons": 5000000' in output
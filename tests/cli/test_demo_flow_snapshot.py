@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+import stat
+
+from scripts.demo_flow import snapshot
+
+
+def test_snapshot_paths_live_under_project_root():
+    assert (snapshot.REPO_ROOT / "pyproject.toml").exists()
+    assert snapshot.SNAPSHOT_ROOT == snapshot.REPO_ROOT / "data" / "demo_runs"
+    assert snapshot.SNAPSHOT_CACHE_DIR == snapshot.REPO_ROOT / "data" / "cache" / "snapshots"
+
+
+def test_snapshot_cache_dir_is_gitignored():
+    ignored = (snapshot.REPO_ROOT / ".gitignore").read_text(encoding="utf-8").splitlines()
+    relative = snapshot.SNAPSHOT_CACHE_DIR.relative_to(snapshot.REPO_ROOT).as_posix()
+
+    assert "data/cache/" in ignored
+    assert relative.startswith("data/cache/")
+
+
+def test_cleanup_removes_old_runs_holding_read_only_files(tmp_path, monkeypatch):
+    real_unlink = os.unlink
+
+    def windows_unlink(path, *, dir_fd=None):
+        if not os.stat(path, dir_fd=dir_fd, follow_symlinks=False).st_mode & stat.S_IWUSR:
+            raise PermissionError(13, "Access is denied", path)
+        real_unlink(path, dir_fd=dir_fd)
+
+    monkeypatch.setattr(os, "unlink", windows_unlink)
+    monkeypatch.setattr(snapshot, "SNAPSHOT_ROOT", tmp_path)
+    monkeypatch.setattr(snapshot, "LATEST_DEMO_LINK", tmp_path / "latest_demo")
+    for run in ("20250101-000000_a", "20250102-000000_b", "20250103-000000_c"):
+        artifact = tmp_path / run / "persons.csv"
+        artifact.parent.mkdir()
+        artifact.write_text("person_id\n", encoding="utf-8")
+        artifact.chmod(stat.S_IRUSR)
+
+    snapshot._cleanup_old_runs(limit=1)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["20250103-000000_c"]
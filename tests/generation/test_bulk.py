@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import random
+import uuid
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.bulk import (
+    bulk_uuid_strings,
+    bulk_vins,
+    uuid_strings_from_bytes,
+)
+from enterprise_synthetic_data_hub.generation.generator import VIN_CHARACTERS
+
+
+def test_uuid_strings_match_stdlib_formatting():
+    raw = random.Random(4).randbytes(16 * 5)
+    expected = [str(uuid.UUID(bytes=raw[offset : offset + 16])) for offset in range(0, len(raw), 16)]
+    assert uuid_strings_from_bytes(raw) == expected
+
+
+def test_uuid_strings_reject_partial_values():
+    with pytest.raises(ValueError, match="16-byte"):
+        uuid_strings_from_bytes(b"\x00" * 15)
+
+
+def test_bulk_producers_are_deterministic_per_source():
+    assert bulk_uuid_strings(random.Random(9).randbytes, 3) == bulk_uuid_strings(random.Random(9).randbytes, 3)
+    assert bulk_vins(random.Random(9).randbytes, 3) == bulk_vins(random.Random(9).randbytes, 3)
+    assert bulk_vins(random.Random(9).randbytes, 0) == []
+
+
+def test_bulk_vins_use_governed_alphabet():
+    vins = bulk_vins(random.Random(1).randbytes, 2_000)
+    assert len(vins) == 2_000
+    assert all(len(vin) == 17 for vin in vins)
+    assert set("".join(vins)) == set(VIN_CHARACTERS)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation import generator
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.generation.prefix_cache import PrefixCache
+
+
+def _assert_same_bundle(actual, expected):
+    assert actual.metadata == expected.metadata
+    assert actual.persons == expected.persons
+    assert actual.vehicles == expected.vehicles
+    assert actual.profiles == expected.profiles
+
+
+def test_prefix_cache_slices_and_extends_sequential_runs(monkeypatch):
+    cache = PrefixCache()
+    _assert_same_bundle(cache.bundle(12, seed=8), generate_snapshot_bundle(12, seed=8))
+
+    generated = []
+    original = generator._generate_rows
+
+    def tracking(rng, start, stop, *scope):
+        generated.append((start, stop))
+        return original(rng, start, stop, *scope)
+
+    monkeypatch.setattr("enterprise_synthetic_data_hub.generation.prefix_cache._generate_rows", tracking)
+    _assert_same_bundle(cache.bundle(5, seed=8), generate_snapshot_bundle(5, seed=8))
+    _assert_same_bundle(cache.bundle(30, seed=8), generate_snapshot_bundle(30, seed=8))
+    assert generated == [(12, 30)]
+    assert cache.cached_records(8) == 30
+
+    without_profiles = cache.bundle(7, seed=8, include_profiles=False)
+    _assert_same_bundle(without_profiles, generate_snapshot_bundle(7, seed=8, include_profiles=False))
+
+
+def test_prefix_cache_widens_scope_when_a_request_needs_more_entities():
+    cache = PrefixCache()
+    persons_only = cache.bundle(6, seed=4, include_profiles=False, include_vehicles=False)
+    expected = generate_snapshot_bundle(6, seed=4, include_profiles=False, include_vehicles=False)
+    _assert_same_bundle(persons_only, expected)
+    _assert_same_bundle(cache.bundle(6, seed=4, include_profiles=False, include_vehicles=False), expected)
+
+    _assert_same_bundle(cache.bundle(3, seed=4), generate_snapshot_bundle(3, seed=4))
+    assert cache.cached_records(4) == 6
+    _assert_same_bundle(
+        cache.bundle(9, seed=4, include_profiles=False),
+        generate_snapshot_bundle(9, seed=4, include_profiles=False),
+    )
+
+
+def test_prefix_cache_evicts_least_recent_seeds_and_skips_oversized_runs():
+    cache = PrefixCache(max_records=20)
+    cache.bundle(10, seed=1)
+    cache.bundle(10, seed=2)
+    cache.bundle(4, seed=1)
+    cache.bundle(8, seed=3)
+    assert cache.cached_records(1) == 10
+    assert cache.cached_records(2) == 0
+    assert cache.cached_records(3) == 8
+
+    _assert_same_bundle(cache.bundle(25, seed=1), generate_snapshot_bundle(25, seed=1))
+    assert cache.cached_records(1) == 10
+
+
+def test_prefix_cache_bounds_the_number_of_seeds():
+    cache = PrefixCache(max_records=1_000, max_seeds=2)
+    for seed in (1, 2, 3):
+        cache.bundle(2, seed=seed)
+    assert [cache.cached_records(seed) for seed in (1, 2, 3)] == [0, 2, 2]
+
+
+def test_prefix_cache_validates_arguments():
+    with pytest.raises(ValueError):
+        PrefixCache(max_records=0)
+    with pytest.raises(ValueError):
+        PrefixCache(max_seeds=0)
+    with pytest.raises(ValueError):
+        PrefixCache().bundle(0, seed=1)
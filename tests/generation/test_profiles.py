@@ -1,7 +1,19 @@
 from __future__ import annotations
 
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from enterprise_synthetic_data_hub.config.settings import settings
 from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
-from enterprise_synthetic_data_hub.generation.profiles import build_profiles
+from enterprise_synthetic_data_hub.generation.profiles import (
+    PROFILE_VALIDATION_MODES,
+    build_profile_row,
+    build_profiles,
+    validate_profiles,
+)
+from enterprise_synthetic_data_hub.models.profile import Profile
 
 
 def test_build_profiles_matches_generator_counts():
@@ -16,3 +28,50 @@ def test_profile_fields_are_deterministic():
     bundle_a = generate_snapshot_bundle(num_records=2, seed=5)
     bundle_b = generate_snapshot_bundle(num_records=2, seed=5)
     assert bundle_a.profiles == bundle_b.profiles
+
+
+def test_fast_profiles_match_pydantic_round_trip():
+    bundle = generate_snapshot_bundle(num_records=6, seed=12, include_profiles=False)
+    expected = []
+    for person, vehicle in zip(bundle.persons, bundle.vehicles):
+        row = build_profile_row(person, vehicle, settings.synthetic_marker)
+        expected.append(Profile(**row).model_dump(mode="json"))
+    for mode in PROFILE_VALIDATION_MODES:
+        assert build_profiles(bundle.persons, bundle.vehicles, validate=mode) == expected
+
+
+def test_full_validation_rejects_malformed_rows():
+    bundle = generate_snapshot_bundle(num_records=3, seed=12, include_profiles=False)
+    persons = [dict(person) for person in bundle.persons]
+    persons[-1]["state"] = "California"
+    with pytest.raises(ValidationError):
+        build_profiles(persons, bundle.vehicles, validate="full")
+    assert len(build_profiles(persons, bundle.vehicles, validate="off")) == 3
+
+
+@pytest.mark.parametrize("count", [101, 150, 199, 1000])
+def test_sample_validation_covers_the_last_row(count):
+    bundle = generate_snapshot_bundle(num_records=1, seed=12)
+    profiles = [bundle.profiles[0]] * (count - 1) + [{**bundle.profiles[0], "residence_state": "California"}]
+    with pytest.raises(ValidationError):
+        validate_profiles(profiles, mode="sample")
+
+
+def test_validate_profiles_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="mode"):
+        validate_profiles([], mode="strict")
+
+
+@pytest.mark.parametrize("engine", ["sequential", "sharded", "counter"])
+def test_fused_profiles_match_standalone_builder(engine):
+    bundle = generate_snapshot_bundle(num_records=9, seed=44, engine=engine)
+    assert bundle.profiles == build_profiles(bundle.persons, bundle.vehicles, validate="full")
+
+
+def test_legacy_shim_profiles_match_fused_path(tmp_path):
+    from generator.synthetic_generator_v01 import write_dataset_snapshot
+
+    bundle = generate_snapshot_bundle(num_records=4, seed=42)
+    path = write_dataset_snapshot(bundle.persons, bundle.vehicles, tmp_path)
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    assert payload["profiles"] == bundle.profiles
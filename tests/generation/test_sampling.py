@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import LOB_DISTRIBUTION
+from enterprise_synthetic_data_hub.generation.sampling import WeightedSampler
+
+
+def _linear_scan(rng: random.Random, distribution: dict) -> str:
+    roll = rng.random()
+    cumulative = 0.0
+    for key, weight in distribution.items():
+        cumulative += weight
+        if roll <= cumulative:
+            return key
+    return next(iter(distribution.keys()))
+
+
+def test_draw_matches_linear_scan_for_lob_distribution():
+    sampler = WeightedSampler(LOB_DISTRIBUTION)
+    reference_rng, sampler_rng = random.Random(17), random.Random(17)
+    expected = [_linear_scan(reference_rng, LOB_DISTRIBUTION) for _ in range(2_000)]
+    assert [sampler.draw(sampler_rng) for _ in range(2_000)] == expected
+
+
+def test_draw_many_handles_large_normalized_distributions():
+    distribution = {f"city-{index}": 1.0 / 1_000 for index in range(1_000)}
+    sampler = WeightedSampler(distribution)
+    assert len(sampler) == 1_000
+    assert sampler.draw_many(random.Random(3), 50) == [
+        _linear_scan(rng, distribution) for rng in [random.Random(3)] for _ in range(50)
+    ]
+
+
+def test_draw_codes_follow_weights():
+    sampler = WeightedSampler({"rare": 1, "common": 9})
+    codes = sampler.draw_codes(np.random.default_rng(5), 20_000)
+    share = float(np.mean(codes == 1))
+    assert 0.88 < share < 0.92
+
+
+def test_sequential_engine_does_not_load_numpy():
+    script = (
+        "import sys\n"
+        "from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle\n"
+        "generate_snapshot_bundle(num_records=5, seed=1)\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("distribution", [{}, {"a": -1.0, "b": 2.0}, {"a": 0.0}])
+def test_invalid_distributions_are_rejected(distribution):
+    with pytest.raises(ValueError):
+        WeightedSampler(distribution)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.columnar import generate_columnar_bundle
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.generation.profiles import build_profiles
+from enterprise_synthetic_data_hub.generation.vectorized import BLOCK_SIZE
+from enterprise_synthetic_data_hub.models.person import Person
+from enterprise_synthetic_data_hub.models.vehicle import Vehicle
+
+
+def test_vectorized_engine_is_deterministic():
+    bundle_a = generate_snapshot_bundle(num_records=50, seed=11, engine="vectorized")
+    bundle_b = generate_snapshot_bundle(num_records=50, seed=11, engine="vectorized")
+    assert bundle_a.persons == bundle_b.persons
+    assert bundle_a.vehicles == bundle_b.vehicles
+    assert bundle_a.profiles == bundle_b.profiles
+
+
+def test_vectorized_engine_matches_bundle_shape():
+    sequential = generate_snapshot_bundle(num_records=6, seed=3)
+    vectorized = generate_snapshot_bundle(num_records=6, seed=3, engine="vectorized")
+    assert vectorized.metadata.record_count_persons == 6
+    assert vectorized.metadata.record_count_profiles == 6
+    assert list(vectorized.persons[0]) == list(sequential.persons[0])
+    assert list(vectorized.vehicles[0]) == list(sequential.vehicles[0])
+    assert list(vectorized.profiles[0]) == list(sequential.profiles[0])
+    assert [p["address_line_1"] for p in vectorized.persons] == [
+        p["address_line_1"] for p in sequential.persons
+    ]
+    assert [p["address_line_2"] for p in vectorized.persons] == [
+        p["address_line_2"] for p in sequential.persons
+    ]
+
+
+def test_vectorized_rows_validate_and_link():
+    bundle = generate_snapshot_bundle(num_records=200, seed=5, engine="vectorized")
+    for person, vehicle in zip(bundle.persons, bundle.vehicles):
+        Person(**person)
+        Vehicle(**vehicle)
+        assert vehicle["person_id"] == person["person_id"]
+        assert vehicle["garaging_postal_code"] == person["postal_code"]
+        assert vehicle["lob_type"] == person["lob_type"]
+    assert build_profiles(bundle.persons, bundle.vehicles) == bundle.profiles
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError, match="engine"):
+        generate_snapshot_bundle(num_records=1, engine="turbo")
+
+
+def test_vectorized_columnar_build_matches_row_path():
+    # Spans two engine blocks so block-local dictionaries are merged.
+    rows = generate_snapshot_bundle(num_records=BLOCK_SIZE + 50, seed=9, engine="vectorized")
+    columnar = generate_columnar_bundle(num_records=BLOCK_SIZE + 50, seed=9, engine="vectorized")
+
+    assert columnar.metadata == rows.metadata
+    assert columnar.persons[BLOCK_SIZE - 2 : BLOCK_SIZE + 2] == rows.persons[BLOCK_SIZE - 2 : BLOCK_SIZE + 2]
+    assert columnar.vehicles[-3:] == rows.vehicles[-3:]
+    assert columnar.profiles[::997] == rows.profiles[::997]
+    assert len(columnar.profiles) == BLOCK_SIZE + 50
+    assert len(columnar.persons.columns["postal_code"].categories) == len(
+        {person["postal_code"] for person in rows.persons}
+    )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io.binary_snapshot import (
+    BinarySnapshot,
+    read_binary_snapshot,
+    write_binary_snapshot,
+)
+from enterprise_synthetic_data_hub.io.checksums import verify_snapshot
+from enterprise_synthetic_data_hub.io.exporters import export_snapshot_binary_stream
+
+
+def test_binary_snapshot_round_trips_bundle(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=40, seed=11)
+    path = write_binary_snapshot(bundle, tmp_path / "snapshot.esdb")
+
+    restored = read_binary_snapshot(path)
+    assert restored.metadata == bundle.metadata
+    assert restored.persons == bundle.persons
+    assert restored.vehicles == bundle.vehicles
+    assert restored.profiles == bundle.profiles
+    assert any(person["address_line_2"] is None for person in restored.persons)
+
+
+def test_binary_snapshot_random_access_uses_fixed_width_records(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=25, seed=3)
+    path = write_binary_snapshot(bundle, tmp_path / "snapshot.esdb")
+
+    with BinarySnapshot(path) as snapshot:
+        persons = snapshot.persons
+        assert len(persons) == 25
+        assert persons[17] == bundle.persons[17]
+        assert persons[-1] == bundle.persons[-1]
+        assert snapshot["vehicles"][4:7] == bundle.vehicles[4:7]
+        record = persons.record(17)
+        assert isinstance(record, memoryview)
+        assert record.nbytes == persons.record_size
+        assert "state" in persons.dictionaries
+        record.release()
+        with pytest.raises(IndexError):
+            persons[25]
+
+
+def test_binary_snapshot_rejects_foreign_files(tmp_path):
+    path = tmp_path / "not_a_snapshot.esdb"
+    path.write_bytes(b"SQLite format 3\x00" + b"\x00" * 64)
+    with pytest.raises(ValueError):
+        BinarySnapshot(path)
+
+
+def test_binary_export_stream_writes_manifest(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=30, seed=8)
+    chunks = [
+        bundle.__class__(
+            metadata=bundle.metadata,
+            persons=bundle.persons[start : start + 10],
+            vehicles=bundle.vehicles[start : start + 10],
+            profiles=bundle.profiles[start : start + 10],
+        )
+        for start in range(0, 30, 10)
+    ]
+    artifacts = export_snapshot_binary_stream(chunks, bundle.metadata, tmp_path)
+
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+    assert manifest["format"] == "binary"
+    assert manifest["record_counts"] == {"persons": 30, "vehicles": 30, "profiles": 30}
+    assert verify_snapshot(artifacts["manifest_json"]) == {}
+    restored = read_binary_snapshot(artifacts["binary_snapshot"])
+    assert restored.persons == bundle.persons
+    assert restored.metadata.record_count_profiles == 30
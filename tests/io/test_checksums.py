@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io import checksums
+from enterprise_synthetic_data_hub.io.exporters import export_snapshot_bundle, export_snapshot_jsonl
+
+
+@pytest.mark.parametrize(
+    "export",
+    [
+        lambda bundle, path: export_snapshot_jsonl(bundle, path, shard_size=4, compress=True),
+        lambda bundle, path: export_snapshot_bundle(bundle, path, max_workers=3),
+    ],
+    ids=["jsonl", "bundle-workers"],
+)
+def test_manifest_checksums_are_computed_while_writing(tmp_path, monkeypatch, export):
+    def fail_if_reread(path):  # pragma: no cover - only runs on regression
+        raise AssertionError(f"{path} was re-read to compute its digest")
+
+    monkeypatch.setattr(checksums, "hash_file", fail_if_reread)
+    bundle = generate_snapshot_bundle(num_records=6, seed=3)
+    artifacts = export(bundle, tmp_path)
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+
+    assert set(manifest["checksums"]) == set(manifest["files"])
+    for entry in manifest["checksums"].values():
+        data = (tmp_path / entry["file"]).read_bytes()
+        assert entry["bytes"] == len(data)
+        assert entry["sha256"] == hashlib.sha256(data).hexdigest()
+
+
+def test_digests_are_recorded_only_in_the_log_passed_in(tmp_path):
+    log = checksums.DigestLog()
+    checksums.write_digest_text(tmp_path / "logged.txt", "logged", log)
+    checksums.write_digest_text(tmp_path / "unlogged.txt", "unlogged")
+
+    assert len(log) == 1
+    assert checksums.file_digest(tmp_path / "logged.txt", log) == {
+        "sha256": hashlib.sha256(b"logged").hexdigest(),
+        "bytes": len("logged"),
+    }
+    assert log.get(tmp_path / "unlogged.txt") is None
+
+
+def test_verify_snapshot_reports_missing_and_modified_files(tmp_path):
+    artifacts = export_snapshot_bundle(generate_snapshot_bundle(num_records=4, seed=1), tmp_path)
+    assert checksums.verify_snapshot(artifacts["manifest_json"]) == {}
+
+    artifacts["vehicles_csv"].unlink()
+    with artifacts["dataset_json"].open("r+b") as handle:
+        handle.write(b"[")
+    problems = checksums.verify_snapshot(artifacts["manifest_json"], max_workers=2)
+
+    assert problems == {"vehicles_csv": "missing", "dataset_json": "sha256 mismatch"}
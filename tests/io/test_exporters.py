@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import (
+    build_snapshot_metadata,
+    generate_snapshot_bundle,
+    iter_snapshot_records,
+)
+from enterprise_synthetic_data_hub.io.exporters import (
+    export_snapshot_bundle,
+    export_snapshot_columnar,
+    export_snapshot_columnar_stream,
+    export_snapshot_jsonl,
+    export_snapshot_jsonl_stream,
+    export_snapshot_stream,
+)
+
+
+def test_stream_export_matches_bundle_csvs(tmp_path):
+    bundle_dir = tmp_path / "bundle"
+    stream_dir = tmp_path / "stream"
+    bundle_artifacts = export_snapshot_bundle(generate_snapshot_bundle(num_records=17, seed=5), bundle_dir)
+    stream_artifacts = export_snapshot_stream(
+        iter_snapshot_records(num_records=17, seed=5, chunk_size=4),
+        build_snapshot_metadata(0, 5),
+        stream_dir,
+    )
+
+    for label in ("persons_csv", "vehicles_csv"):
+        assert stream_artifacts[label].read_bytes() == bundle_artifacts[label].read_bytes()
+
+
+def test_stream_export_counts_rows_in_manifest(tmp_path):
+    artifacts = export_snapshot_stream(
+        iter_snapshot_records(num_records=9, seed=1, chunk_size=2),
+        build_snapshot_metadata(0, 1),
+        tmp_path,
+    )
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+    metadata = json.loads(artifacts["metadata_json"].read_text(encoding="utf-8"))
+
+    # The CSVs hold no profiles, so none are reported even though chunks carry them.
+    assert manifest["record_counts"] == {"persons": 9, "vehicles": 9, "profiles": 0}
+    assert metadata["record_count_persons"] == 9
+    assert metadata["record_count_profiles"] == 0
+    assert set(manifest["files"]) == {"persons_csv", "vehicles_csv", "metadata_json"}
+
+
+def test_jsonl_export_shards_rows_and_lists_them_in_manifest(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=7, seed=2)
+    artifacts = export_snapshot_jsonl(bundle, tmp_path, shard_size=3)
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+
+    assert manifest["record_counts"] == {"persons": 7, "vehicles": 7, "profiles": 7}
+    for entity in ("persons", "vehicles", "profiles"):
+        shards = manifest["shards"][entity]
+        assert [shard["rows"] for shard in shards] == [3, 3, 1]
+        rows = []
+        for shard in shards:
+            path = tmp_path / shard["file"]
+            assert path.stat().st_size == shard["bytes"]
+            rows.extend(json.loads(line) for line in path.read_text(encoding="utf-8").splitlines())
+        assert rows == getattr(bundle, entity)
+
+
+def test_jsonl_stream_export_gzip_matches_bundle_rows(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=10, seed=6)
+    artifacts = export_snapshot_jsonl_stream(
+        iter_snapshot_records(num_records=10, seed=6, chunk_size=4),
+        build_snapshot_metadata(0, 6),
+        tmp_path,
+        shard_size=6,
+        compress=True,
+    )
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+
+    assert manifest["compression"] == "gzip"
+    persons = []
+    for shard in manifest["shards"]["persons"]:
+        with gzip.open(tmp_path / shard["file"], "rt", encoding="utf-8") as handle:
+            persons.extend(json.loads(line) for line in handle)
+    assert persons == bundle.persons
+
+
+def test_parquet_export_uses_typed_columns_and_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    bundle = generate_snapshot_bundle(num_records=25, seed=3)
+    artifacts = export_snapshot_columnar(bundle, tmp_path, row_group_size=10)
+
+    persons = pq.ParquetFile(artifacts["persons_parquet"])
+    assert persons.metadata.num_row_groups == 3
+    schema = persons.schema_arrow
+    assert schema.field("date_of_birth").type == pa.date32()
+    assert pa.types.is_dictionary(schema.field("state").type)
+    vehicles = pq.read_table(artifacts["vehicles_parquet"])
+    assert vehicles.schema.field("model_year").type == pa.int32()
+    assert vehicles.to_pylist() == bundle.vehicles
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+    assert manifest["format"] == "parquet"
+    assert manifest["record_counts"]["profiles"] == 25
+
+
+def test_arrow_stream_export_round_trips_rows(tmp_path):
+    ipc = pytest.importorskip("pyarrow.ipc")
+    bundle = generate_snapshot_bundle(num_records=25, seed=3)
+    artifacts = export_snapshot_columnar_stream(
+        iter_snapshot_records(num_records=25, seed=3, chunk_size=7),
+        build_snapshot_metadata(0, 3),
+        tmp_path,
+        fmt="arrow",
+        row_group_size=10,
+    )
+
+    profiles = ipc.open_file(artifacts["profiles_arrow"]).read_all()
+    assert profiles.to_pylist() == bundle.profiles
+    persons = ipc.open_file(artifacts["persons_arrow"]).read_all().to_pylist()
+    assert [row["date_of_birth"].isoformat() for row in persons] == [
+        row["date_of_birth"] for row in bundle.persons
+    ]
+
+
+def test_concurrent_bundle_export_matches_serial_bytes(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=15, seed=8)
+    serial = export_snapshot_bundle(bundle, tmp_path / "serial")
+    concurrent = export_snapshot_bundle(bundle, tmp_path / "concurrent", max_workers=3)
+
+    for label in ("persons_csv", "vehicles_csv", "dataset_json", "metadata_json", "manifest_json"):
+        assert concurrent[label].read_bytes() == serial[label].read_bytes()
+    with pytest.raises(ValueError):
+        export_snapshot_bundle(bundle, tmp_path / "invalid", max_workers=0)
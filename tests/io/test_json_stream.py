@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.columnar import ColumnarSnapshotBundle
+from enterprise_synthetic_data_hub.generation.generator import (
+    generate_snapshot_bundle,
+    write_snapshot_bundle,
+)
+from enterprise_synthetic_data_hub.io.json_stream import write_json_document
+
+
+def _payload(bundle):
+    return {
+        "metadata": bundle.metadata.model_dump(mode="json"),
+        "persons": bundle.persons,
+        "vehicles": bundle.vehicles,
+        "profiles": bundle.profiles,
+    }
+
+
+def _render(sections, **kwargs):
+    handle = io.StringIO()
+    write_json_document(handle, sections, **kwargs)
+    return handle.getvalue()
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        {},
+        {"items": []},
+        {"meta": {}, "items": [], "nested": {"a": [1, {"b": None}], "c": "x\ny"}},
+        {"items": [{"name": "Zoë"}, [], {}, 3.5, True]},
+        {"items": [{"a": 1, "b": None, "c": False, "d": "q\"t"}, {"f": 1.5}, {"n": {"x": [1]}}]},
+    ],
+)
+def test_write_json_document_matches_json_dumps(sections):
+    assert _render(sections) == json.dumps(sections, indent=2)
+    assert _render(sections, compact=True) == json.dumps(sections, separators=(",", ":"))
+
+
+def test_write_json_document_streams_generators_in_small_blocks():
+    handle = io.StringIO()
+    rows = ({"index": index} for index in range(50))
+    write_json_document(handle, {"rows": rows}, buffer_size=16)
+
+    assert handle.getvalue() == json.dumps({"rows": [{"index": i} for i in range(50)]}, indent=2)
+
+
+def test_write_snapshot_bundle_is_byte_identical_to_json_dumps(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=12, seed=4)
+    path = write_snapshot_bundle(bundle, tmp_path)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(_payload(bundle), indent=2)
+
+
+def test_write_snapshot_bundle_compact_accepts_columnar_tables(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=12, seed=4)
+    path = write_snapshot_bundle(ColumnarSnapshotBundle.from_bundle(bundle), tmp_path, compact=True)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(_payload(bundle), separators=(",", ":"))
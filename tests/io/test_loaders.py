@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io.exporters import (
+    export_snapshot_bundle,
+    export_snapshot_jsonl,
+    export_snapshot_sqlite,
+)
+from enterprise_synthetic_data_hub.io.loaders import load_snapshot
+from enterprise_synthetic_data_hub.io.sinks import build_sink, export_snapshot_sinks
+
+
+@pytest.fixture(scope="module")
+def bundle():
+    return generate_snapshot_bundle(num_records=60, seed=21)
+
+
+def test_load_snapshot_round_trips_csv_export(tmp_path, bundle):
+    export_snapshot_bundle(bundle, tmp_path)
+
+    loaded = load_snapshot(tmp_path)
+    assert loaded.metadata == bundle.metadata
+    assert loaded.persons == bundle.persons
+    assert loaded.vehicles == bundle.vehicles
+    assert loaded.profiles == bundle.profiles
+
+
+def test_load_snapshot_splits_csv_into_byte_ranges(tmp_path, bundle):
+    artifacts = export_snapshot_bundle(bundle, tmp_path)
+
+    loaded = load_snapshot(artifacts["manifest_json"], ["persons"], chunk_bytes=512, max_workers=2)
+    assert loaded.persons == bundle.persons
+    assert loaded.vehicles == [] and loaded.profiles == []
+
+
+def test_load_snapshot_projects_columns_into_frames(tmp_path, bundle):
+    export_snapshot_jsonl(bundle, tmp_path, shard_size=25, compress=True)
+
+    frames = load_snapshot(
+        tmp_path,
+        entities=["vehicles", "profiles"],
+        columns={"vehicles": ["vin", "model_year"], "profiles": ["person_id"]},
+        as_frames=True,
+    )
+    assert list(frames) == ["vehicles", "profiles"]
+    assert list(frames["vehicles"].columns) == ["vin", "model_year"]
+    assert frames["vehicles"]["model_year"].tolist() == [row["model_year"] for row in bundle.vehicles]
+    assert frames["profiles"]["person_id"].tolist() == [row["person_id"] for row in bundle.profiles]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_load_snapshot_reads_single_section_of_json_bundle(tmp_path, bundle, compact):
+    export_snapshot_sinks([bundle], bundle.metadata, [build_sink("json", compact=compact)], tmp_path)
+
+    loaded = load_snapshot(tmp_path, ["profiles"], ["profile_id", "vehicle_id"])
+    assert loaded.profiles == [
+        {"profile_id": row["profile_id"], "vehicle_id": row["vehicle_id"]} for row in bundle.profiles
+    ]
+
+
+def test_load_snapshot_rejects_unknown_entities_and_columns(tmp_path, bundle):
+    export_snapshot_sqlite(bundle, tmp_path)
+
+    assert load_snapshot(tmp_path, ["vehicles"]).vehicles == bundle.vehicles
+    with pytest.raises(ValueError):
+        load_snapshot(tmp_path, ["claims"])
+    with pytest.raises(ValueError):
+        load_snapshot(tmp_path, ["persons"], ["vin"])
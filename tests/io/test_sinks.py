@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import (
+    generate_snapshot_bundle,
+    iter_snapshot_records,
+)
+from enterprise_synthetic_data_hub.io.exporters import export_snapshot_bundle
+from enterprise_synthetic_data_hub.io.sinks import (
+    SinkReport,
+    SnapshotSink,
+    build_sink,
+    export_snapshot_sinks,
+)
+
+
+def test_single_pass_sinks_match_bundle_export(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=20, seed=2)
+    reference = export_snapshot_bundle(bundle, tmp_path / "reference")
+    artifacts = export_snapshot_sinks(
+        iter_snapshot_records(num_records=20, seed=2, chunk_size=6),
+        bundle.metadata,
+        [build_sink("csv"), build_sink("json"), build_sink("jsonl", shard_size=8), build_sink("sqlite")],
+        tmp_path / "sinks",
+    )
+
+    for label in ("persons_csv", "vehicles_csv", "dataset_json", "metadata_json"):
+        assert artifacts[label].read_bytes() == reference[label].read_bytes()
+    assert not list((tmp_path / "sinks").glob("*.spool"))
+
+    with sqlite3.connect(artifacts["sqlite_db"]) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM profiles").fetchone() == (20,)
+        vin = connection.execute("SELECT vin FROM vehicles ORDER BY rowid LIMIT 1").fetchone()[0]
+    assert vin == bundle.vehicles[0]["vin"]
+
+
+def test_sink_manifest_reports_rows_and_bytes(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=9, seed=4)
+    artifacts = export_snapshot_sinks(
+        [bundle], bundle.metadata, [build_sink("csv"), build_sink("jsonl", shard_size=4)], tmp_path
+    )
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+
+    assert manifest["record_counts"] == {"persons": 9, "vehicles": 9, "profiles": 9}
+    jsonl = manifest["sinks"]["jsonl"]
+    assert jsonl["rows"] == {"persons": 9, "vehicles": 9, "profiles": 9}
+    assert len(jsonl["files"]) == 9
+    assert jsonl["bytes"] == sum(
+        (tmp_path / entry["file"]).stat().st_size for entry in jsonl["files"].values()
+    )
+    assert manifest["sinks"]["csv"]["rows"] == {"persons": 9, "vehicles": 9}
+
+
+def test_build_sink_rejects_unknown_names_and_duplicates(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=2, seed=1)
+    with pytest.raises(ValueError):
+        build_sink("xml")
+    with pytest.raises(ValueError):
+        export_snapshot_sinks([bundle], bundle.metadata, [build_sink("csv"), build_sink("csv")], tmp_path)
+
+
+class _FailingSink(SnapshotSink):
+    name = "failing"
+
+    def __init__(self, fail_on: str):
+        self.fail_on = fail_on
+        self.aborted = False
+
+    def open(self, output_dir, metadata):
+        if self.fail_on == "open":
+            raise OSError("disk full")
+
+    def write_chunk(self, chunk):
+        pass
+
+    def close(self, metadata):
+        if self.fail_on == "close":
+            raise OSError("disk full")
+        return SinkReport()
+
+    def abort(self):
+        self.aborted = True
+        if self.fail_on == "close":
+            raise RuntimeError("cleanup failed")
+
+
+def _failing_chunks(bundle):
+    yield bundle
+    raise RuntimeError("generation failed")
+
+
+@pytest.mark.parametrize("fail_on", ["chunks", "close"])
+def test_failed_export_aborts_sinks_and_removes_their_files(tmp_path, caplog, fail_on):
+    bundle = generate_snapshot_bundle(num_records=5, seed=3)
+    failing = _FailingSink(fail_on)
+    sinks = [build_sink(name) for name in ("csv", "json", "jsonl", "sqlite", "parquet", "binary")]
+    chunks = _failing_chunks(bundle) if fail_on == "chunks" else [bundle]
+
+    with pytest.raises((RuntimeError, OSError)):
+        export_snapshot_sinks(chunks, bundle.metadata, [*sinks, failing], tmp_path)
+
+    assert failing.aborted
+    assert list(tmp_path.iterdir()) == []
+    if fail_on == "close":
+        assert "Could not clean up the failing sink" in caplog.text
+
+
+def test_sinks_must_implement_every_method():
+    class NoAbort(SnapshotSink):
+        def open(self, output_dir, metadata):
+            pass
+
+        def write_chunk(self, chunk):
+            pass
+
+        def close(self, metadata):
+            return SinkReport()
+
+    with pytest.raises(TypeError, match="abort"):
+        NoAbort()
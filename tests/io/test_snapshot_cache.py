@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+import stat
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io.exporters import export_snapshot_bundle
+from enterprise_synthetic_data_hub.io import snapshot_cache
+from enterprise_synthetic_data_hub.io.snapshot_cache import SnapshotCache, snapshot_cache_key
+
+
+def _key(**overrides):
+    params = {"dataset_version": "v0.1", "seed": 7, "records": 5}
+    params.update(overrides)
+    return snapshot_cache_key(**params)
+
+
+def test_cache_key_changes_with_every_parameter():
+    base = _key()
+    assert base == _key()
+    variants = [
+        _key(seed=8),
+        _key(records=6),
+        _key(include_profiles=False),
+        _key(engine="vectorized"),
+        _key(dataset_version="v0.2"),
+        _key(export_options={"format": "jsonl"}),
+    ]
+    assert base not in variants
+    assert len(set(variants)) == len(variants)
+
+
+def test_cache_round_trip_links_identical_artifacts(tmp_path):
+    cache = SnapshotCache(tmp_path / "cache")
+    artifacts = export_snapshot_bundle(generate_snapshot_bundle(num_records=5, seed=7), tmp_path / "first")
+    assert cache.materialize(_key(), tmp_path / "second") is None
+
+    cache.store(_key(), artifacts)
+    reused = cache.materialize(_key(), tmp_path / "second")
+
+    assert reused.keys() == artifacts.keys()
+    for label, path in artifacts.items():
+        assert reused[label].read_bytes() == path.read_bytes()
+    assert SnapshotCache.detach(tmp_path / "second")
+    assert not any((tmp_path / "second").iterdir())
+    assert cache.materialize(_key(), tmp_path / "third") is not None
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    artifacts = export_snapshot_bundle(generate_snapshot_bundle(num_records=5, seed=7), tmp_path / "out")
+    entry_size = sum(path.stat().st_size for path in artifacts.values())
+    cache = SnapshotCache(tmp_path / "cache", max_bytes=entry_size * 2 + entry_size // 2)
+
+    old = cache.store(_key(seed=1), artifacts)
+    recent = cache.store(_key(seed=2), artifacts)
+    os.utime(old, (1, 1))
+    os.utime(recent, (2, 2))
+    cache.materialize(_key(seed=1), tmp_path / "touch")
+    cache.store(_key(seed=3), artifacts)
+
+    assert old.exists()
+    assert not recent.exists()
+    assert len(cache.entries()) == 2
+
+
+@pytest.fixture
+def windows_unlink(monkeypatch):
+    """Make ``os.unlink`` refuse read-only files, as it does on Windows."""
+
+    real_unlink = os.unlink
+
+    def unlink(path, *, dir_fd=None):
+        if not os.stat(path, dir_fd=dir_fd, follow_symlinks=False).st_mode & stat.S_IWUSR:
+            raise PermissionError(13, "Access is denied", path)
+        real_unlink(path, dir_fd=dir_fd)
+
+    monkeypatch.setattr(os, "unlink", unlink)
+
+
+def test_cache_evicts_read_only_entries_and_counts_only_removed_ones(tmp_path, monkeypatch, windows_unlink):
+    artifacts = export_snapshot_bundle(generate_snapshot_bundle(num_records=5, seed=7), tmp_path / "out")
+    entry_size = sum(path.stat().st_size for path in artifacts.values())
+    cache = SnapshotCache(tmp_path / "cache", max_bytes=entry_size * 10)
+    entries = [cache.store(_key(seed=seed), artifacts) for seed in (1, 2, 3)]
+    for age, entry in enumerate(entries, start=1):
+        os.utime(entry, (age, age))
+    cache.max_bytes = entry_size + entry_size // 2
+
+    assert cache.evict() == entries[:2]
+    assert not entries[0].exists() and not entries[1].exists()
+
+    monkeypatch.setattr(snapshot_cache, "remove_tree", lambda path: False)
+    cache.store(_key(seed=4), artifacts)
+    assert cache.evict() == []
+    assert len(cache.entries()) == 2
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+from enterprise_synthetic_data_hub.io.exporters import export_snapshot_sqlite
+from enterprise_synthetic_data_hub.io.sqlite_export import SqliteSnapshotWriter
+
+
+def test_sqlite_export_loads_rows_with_keys_and_indexes(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=12, seed=5)
+    artifacts = export_snapshot_sqlite(bundle, tmp_path)
+    manifest = json.loads(artifacts["manifest_json"].read_text(encoding="utf-8"))
+    assert manifest["record_counts"] == {"persons": 12, "vehicles": 12, "profiles": 12}
+
+    connection = sqlite3.connect(artifacts["sqlite_db"])
+    connection.row_factory = sqlite3.Row
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        persons = [dict(row) for row in connection.execute("SELECT * FROM persons ORDER BY rowid")]
+        assert persons == bundle.persons
+        vehicle = bundle.vehicles[3]
+        row = connection.execute("SELECT * FROM vehicles WHERE vin = ?", (vehicle["vin"],)).fetchone()
+        assert dict(row) == vehicle
+        parents = {row["table"] for row in connection.execute("PRAGMA foreign_key_list(profiles)")}
+        assert parents == {"persons", "vehicles"}
+        indexes = {row["name"] for row in connection.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+        assert {"persons_person_id_key", "persons_state_idx", "vehicles_vin_idx"} <= indexes
+        plan = connection.execute("EXPLAIN QUERY PLAN SELECT * FROM persons WHERE lob_type = 'Personal'")
+        assert "INDEX" in " ".join(row["detail"] for row in plan)
+    finally:
+        connection.close()
+
+
+def test_sqlite_writer_rejects_orphaned_rows(tmp_path):
+    bundle = generate_snapshot_bundle(num_records=2, seed=5)
+    writer = SqliteSnapshotWriter(tmp_path / "orphans.sqlite")
+    writer.write_rows("persons", bundle.persons[:1])
+    writer.write_rows("vehicles", bundle.vehicles)
+
+    with pytest.raises(ValueError, match="foreign key"):
+        writer.close()
@@ -50,3 +50,105 @@ def test_cli_main_writes_snapshot(tmp_path):
     assert persons_csv.exists()
     assert vehicles_csv.exists()
     assert Path(payload["files"]["persons_csv"]).name == persons_csv.name
+
+
+def test_cli_workers_selects_sharded_engine(tmp_path):
+    parser = build_parser()
+    args = parser.parse_args(["generate-snapshot", "--workers", "2"])
+    assert args.workers == 2
+    assert args.engine is None
+
+    exit_code = main(["generate-snapshot", "--output-dir", str(tmp_path), "--records", "3", "--workers", "2"])
+    assert exit_code == 0
+    version_slug = settings.dataset_version.replace(".", "_")
+    payload = json.loads((tmp_path / f"snapshot_manifest_{version_slug}.json").read_text(encoding="utf-8"))
+    assert payload["record_counts"]["persons"] == 3
+
+
+def test_cli_vectorized_engine_builds_columnar_bundle(tmp_path, monkeypatch):
+    from enterprise_synthetic_data_hub.cli import main as cli_main
+    from enterprise_synthetic_data_hub.generation.generator import generate_snapshot_bundle
+
+    def row_dict_path(**kwargs):
+        raise AssertionError("the vectorized engine should not build row dicts")
+
+    monkeypatch.setattr(cli_main, "generate_snapshot_bundle", row_dict_path)
+    exit_code = main(
+        ["generate-snapshot", "--output-dir", str(tmp_path), "--records", "6", "--seed", "9", "--engine", "vectorized"]
+    )
+    assert exit_code == 0
+    version_slug = settings.dataset_version.replace(".", "_")
+    expected = generate_snapshot_bundle(num_records=6, seed=9, engine="vectorized")
+    persons_csv = (tmp_path / f"persons_{version_slug}.csv").read_text(encoding="utf-8").splitlines()
+    assert [line.split(",")[0] for line in persons_csv[1:]] == [row["person_id"] for row in expected.persons]
+
+
+def test_cli_stream_mode_writes_csvs(tmp_path):
+    exit_code = main(
+        ["generate-snapshot", "--output-dir", str(tmp_path), "--records", "7", "--stream", "--chunk-size", "3"]
+    )
+    assert exit_code == 0
+    version_slug = settings.dataset_version.replace(".", "_")
+    payload = json.loads((tmp_path / f"snapshot_manifest_{version_slug}.json").read_text(encoding="utf-8"))
+    assert payload["record_counts"] == {"persons": 7, "vehicles": 7, "profiles": 0}
+    persons_csv = tmp_path / f"persons_{version_slug}.csv"
+    assert len(persons_csv.read_text(encoding="utf-8").splitlines()) == 8
+
+
+def test_cli_jsonl_format_writes_compressed_shards(tmp_path):
+    exit_code = main(
+        [
+            "generate-snapshot",
+            "--output-dir",
+            str(tmp_path),
+            "--records",
+            "5",
+            "--format",
+            "jsonl",
+            "--shard-size",
+            "2",
+            "--compress",
+        ]
+    )
+    assert exit_code == 0
+    version_slug = settings.dataset_version.replace(".", "_")
+    payload = json.loads((tmp_path / f"snapshot_manifest_{version_slug}.json").read_text(encoding="utf-8"))
+    assert payload["format"] == "jsonl"
+    assert [shard["rows"] for shard in payload["shards"]["persons"]] == [2, 2, 1]
+    assert (tmp_path / f"persons_{version_slug}-00002.jsonl.gz").exists()
+
+
+def test_cli_sinks_write_every_format_in_one_pass(tmp_path):
+    exit_code = main(
+        ["generate-snapshot", "--output-dir", str(tmp_path), "--records", "4", "--sinks", "csv", "jsonl", "sqlite"]
+    )
+    assert exit_code == 0
+    version_slug = settings.dataset_version.replace(".", "_")
+    payload = json.loads((tmp_path / f"snapshot_manifest_{version_slug}.json").read_text(encoding="utf-8"))
+    assert set(payload["sinks"]) == {"csv", "jsonl", "sqlite"}
+    assert payload["record_counts"]["profiles"] == 4
+    assert (tmp_path / f"snapshot_{version_slug}.sqlite").exists()
+
+
+def test_cli_cache_dir_reuses_identical_snapshot(tmp_path, capsys):
+    argv = ["generate-snapshot", "--records", "3", "--seed", "11", "--cache-dir", str(tmp_path / "cache")]
+    assert main([*argv, "--output-dir", str(tmp_path / "first")]) == 0
+    assert "Reused cached snapshot" not in capsys.readouterr().out
+
+    assert main([*argv, "--output-dir", str(tmp_path / "second")]) == 0
+    assert "Reused cached snapshot" in capsys.readouterr().out
+    version_slug = settings.dataset_version.replace(".", "_")
+    name = f"persons_{version_slug}.csv"
+    assert (tmp_path / "second" / name).read_bytes() == (tmp_path / "first" / name).read_bytes()
+
+
+def test_cli_verify_snapshot_detects_tampering(tmp_path, capsys):
+    assert main(["generate-snapshot", "--output-dir", str(tmp_path), "--records", "4"]) == 0
+    assert main(["verify-snapshot", str(tmp_path)]) == 0
+    assert "Snapshot verified" in capsys.readouterr().out
+
+    version_slug = settings.dataset_version.replace(".", "_")
+    persons_csv = tmp_path / f"persons_{version_slug}.csv"
+    persons_csv.write_text(persons_csv.read_text(encoding="utf-8").replace("a", "b"), encoding="utf-8")
+    assert main(["verify-snapshot", str(tmp_path / f"snapshot_manifest_{version_slug}.json")]) == 1
+    assert "persons_csv" in capsys.readouterr().out
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import json
+import random
+
+import pytest
 
 from enterprise_synthetic_data_hub.config.settings import settings
+from enterprise_synthetic_data_hub.generation import generator
 from enterprise_synthetic_data_hub.generation.generator import (
     SnapshotBundle,
+    build_snapshot_metadata,
+    generate_records,
     generate_snapshot_bundle,
+    iter_snapshot_records,
     write_snapshot_bundle,
 )
 
@@ -66,3 +73,115 @@ def test_snapshot_bundle_type_annotations():
 def test_snapshot_bundle_notes_use_default_seed():
     bundle = generate_snapshot_bundle(num_records=1, seed=None)
     assert f"seed={settings.random_seed}" in bundle.metadata.notes
+
+
+def test_iter_snapshot_records_matches_bundle_bytes():
+    bundle = generate_snapshot_bundle(num_records=23, seed=7)
+    chunks = list(iter_snapshot_records(num_records=23, seed=7, chunk_size=5))
+
+    assert [chunk.start for chunk in chunks] == [0, 5, 10, 15, 20]
+    assert [len(chunk.persons) for chunk in chunks] == [5, 5, 5, 5, 3]
+    for entity in ("persons", "vehicles", "profiles"):
+        streamed = [row for chunk in chunks for row in getattr(chunk, entity)]
+        assert json.dumps(streamed) == json.dumps(getattr(bundle, entity))
+
+
+def test_iter_snapshot_records_rechunks_vectorized_engine():
+    bundle = generate_snapshot_bundle(num_records=12, seed=3, engine="vectorized")
+    chunks = list(iter_snapshot_records(num_records=12, seed=3, chunk_size=5, engine="vectorized"))
+    assert [len(chunk.vehicles) for chunk in chunks] == [5, 5, 2]
+    assert [row for chunk in chunks for row in chunk.vehicles] == bundle.vehicles
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 7, 100])
+def test_rechunk_preserves_order_across_uneven_blocks(chunk_size):
+    sizes = [3, 0, 5, 1, 9, 2]
+    rows = iter(range(sum(sizes)))
+    blocks = []
+    for size in sizes:
+        persons = [next(rows) for _ in range(size)]
+        blocks.append((persons, [-row for row in persons], []))
+
+    chunks = list(generator._rechunk(iter(blocks), chunk_size))
+
+    assert [row for chunk in chunks for row in chunk[0]] == list(range(sum(sizes)))
+    assert [row for chunk in chunks for row in chunk[1]] == [-row for row in range(sum(sizes))]
+    assert all(len(chunk[0]) == chunk_size for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1][0]) <= chunk_size
+
+
+def test_iter_snapshot_records_validates_eagerly():
+    with pytest.raises(ValueError, match="chunk_size"):
+        iter_snapshot_records(num_records=3, chunk_size=0)
+
+
+def test_build_snapshot_metadata_matches_bundle():
+    bundle = generate_snapshot_bundle(num_records=4, seed=2, include_profiles=False)
+    assert build_snapshot_metadata(4, 2, include_profiles=False) == bundle.metadata
+
+
+def test_sharded_output_is_independent_of_worker_count(monkeypatch):
+    monkeypatch.setattr(generator, "SHARD_SIZE", 4)
+    single = generate_snapshot_bundle(num_records=10, seed=21, engine="sharded", workers=1)
+    pooled = generate_snapshot_bundle(num_records=10, seed=21, engine="sharded", workers=3)
+
+    assert single.persons == pooled.persons
+    assert single.vehicles == pooled.vehicles
+    assert single.profiles == pooled.profiles
+    assert [person["address_line_1"] for person in pooled.persons][-1] == "109 Main Street"
+
+
+def test_workers_require_sharded_engine():
+    with pytest.raises(ValueError, match="sharded"):
+        generate_snapshot_bundle(num_records=2, workers=2)
+
+
+def test_generate_records_matches_counter_bundle_window():
+    bundle = generate_snapshot_bundle(num_records=12, seed=31, engine="counter")
+    window = generate_records(31, 5, 9)
+
+    assert window.start == 5
+    assert window.persons == bundle.persons[5:9]
+    assert window.vehicles == bundle.vehicles[5:9]
+    assert window.profiles == bundle.profiles[5:9]
+    assert generate_records(31, 9_000_000, 9_000_002).persons[0]["address_line_1"] == "9000100 Main Street"
+
+
+def test_generate_records_rejects_inverted_range():
+    with pytest.raises(ValueError, match="start"):
+        generate_records(1, 5, 2)
+    assert generate_records(1, 3, 3).persons == []
+
+
+def test_entity_scoped_generation_matches_full_run():
+    full = generate_snapshot_bundle(num_records=40, seed=17)
+    persons_only = generate_snapshot_bundle(num_records=40, seed=17, include_vehicles=False)
+    vehicles_only = generate_snapshot_bundle(num_records=40, seed=17, include_profiles=False)
+
+    assert persons_only.persons == full.persons
+    assert persons_only.vehicles == [] and persons_only.profiles == []
+    assert persons_only.metadata.record_count_vehicles == 0
+    assert vehicles_only.vehicles == full.vehicles
+    assert vehicles_only.profiles == []
+
+
+def test_entity_scoped_generation_validates_scope():
+    with pytest.raises(ValueError, match="profiles require vehicles"):
+        generate_snapshot_bundle(num_records=2, include_profiles=True, include_vehicles=False)
+    with pytest.raises(ValueError, match="sequential"):
+        generate_snapshot_bundle(
+            num_records=2, include_profiles=False, include_vehicles=False, engine="counter"
+        )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 17, 20251101, 2**40 + 3])
+def test_skip_vehicle_consumes_the_same_draws_as_generate_vehicle(seed):
+    # _skip_vehicle mirrors CPython's Random._randbelow rejection loop; an
+    # interpreter that draws differently must fail here, not shift output.
+    full_rng, skip_rng = random.Random(seed), random.Random(seed)
+    for index in range(300):
+        person = generator._generate_person(full_rng, index)
+        assert generator._generate_person(skip_rng, index) == person
+        generator._generate_vehicle(full_rng, person)
+        generator._skip_vehicle(skip_rng, person)
+        assert skip_rng.getstate() == full_rng.getstate()